@@ -0,0 +1,58 @@
+"""Group-by and pivot times of the aggregation engine, against a Python loop over the rows.
+
+    python benchmarks/aggregate.py [ROWS]
+"""
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, "src"))
+
+
+def timed(label, function, *args, **kwargs):
+    start = time.perf_counter()
+    result = function(*args, **kwargs)
+    print(f"{label:<52} {(time.perf_counter() - start) * 1000:9.1f} ms")
+    return result
+
+
+def main() -> None:
+    import numpy as np
+    from dashboard_components.aggregate import AggregationEngine
+    from dashboard_components.columnar_model import sample_columns
+    from dashboard_components.date_index import DateIndex
+
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    names, columns = sample_columns(rows, 4)
+    names.append("Status")
+    columns.append(np.random.default_rng(3).integers(0, 6, rows))
+    engine = AggregationEngine()
+    engine.setColumns(names, columns)
+    print(f"{rows:,} rows")
+
+    timed("sum by day, first run (factorizes Date)", engine.aggregate, 0, "sum", value=2)
+    timed("sum by day, again", engine.aggregate, 0, "sum", value=2)
+    timed("pivot day x status, first run (factorizes Status)", engine.aggregate, 0, "mean", value=2, pivot=4)
+    timed("count by status", engine.aggregate, 4, "count")
+    timed("max by status", engine.aggregate, 4, "max", value=3)
+    index = DateIndex(columns[0])
+    for first, last in (("2021-01-01", "2021-12-31"), ("2022-03-01", "2022-03-31")):
+        selection = index.rows(np.datetime64(first), np.datetime64(last))
+        timed(f"pivot for {first}..{last} (filter change only)", engine.aggregate, 0, "mean", value=2, pivot=4,
+              rows=selection)
+
+    count = min(rows, 1_000_000)
+    dates, values = columns[0][:count].tolist(), columns[2][:count].tolist()
+
+    def python_loop():
+        sums = {}
+        for date, value in zip(dates, values):
+            sums[date] = sums.get(date, 0.0) + value
+        return sums
+
+    timed(f"Python loop, sum by day over {count:,} rows", python_loop)
+
+
+if __name__ == "__main__":
+    main()
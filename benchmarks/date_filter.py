@@ -0,0 +1,78 @@
+"""Cost of one date range change on the Processes page, by table size, against a filtering proxy model.
+
+The DateIndex filter should cost the same at every size; QSortFilterProxyModel re-tests every row:
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/date_filter.py
+"""
+import os
+import statistics
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, "src"))
+
+CHANGES = 30
+
+
+def main() -> None:
+    import numpy as np
+    from PySide6.QtCore import QDate, QSortFilterProxyModel
+    from PySide6.QtWidgets import QApplication
+    from dashboard_components.columnar_model import sample_columns
+    from dashboard_components.date_index import DateIndex
+    from dashboard_components.processes import ProcessesPage
+    from dashboard_components.style import StyleManager
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    rng = np.random.default_rng(2)
+    for rows in (100_000, 1_000_000, 5_000_000):
+        for shuffled in (False, True):
+            names, columns = sample_columns(rows, 6)
+            if shuffled:
+                columns[0] = rng.permutation(columns[0])
+            start = time.perf_counter()
+            DateIndex(columns[0])
+            build = time.perf_counter() - start
+
+            page = ProcessesPage(StyleManager())
+            page.resize(1200, 800)
+            page.show()
+            page.setColumns(names, columns)
+            while page.date_index is None:
+                app.processEvents()
+            timings = []
+            for change in range(CHANGES):
+                first = QDate(2020, 1, 1).addDays(int(rng.integers(0, 1500)))
+                started = time.perf_counter()
+                page.from_date.setDate(first)
+                page.to_date.setDate(first.addDays(int(rng.integers(0, 60))))
+                page.table_view.viewport().repaint()
+                timings.append(time.perf_counter() - started)
+            order = "shuffled" if shuffled else "sorted"
+            print(f"{rows:>9,} rows {order:<8}  index build {build * 1000:7.1f} ms  "
+                  f"range change median {statistics.median(timings) * 1000:5.1f} ms  max {max(timings) * 1000:5.1f} ms")
+            page.deleteLater()
+            app.processEvents()
+
+    class DateRangeProxy(QSortFilterProxyModel):
+        first = last = None
+
+        def filterAcceptsRow(self, row, parent):
+            value = self.sourceModel().columnData(0)[row]
+            return bool(self.first <= value <= self.last)
+
+    names, columns = sample_columns(100_000, 6)
+    page = ProcessesPage(StyleManager())
+    page.setColumns(names, columns)
+    proxy = DateRangeProxy()
+    proxy.first, proxy.last = np.datetime64("2021-01-01"), np.datetime64("2021-02-01")
+    proxy.setSourceModel(page.model)
+    start = time.perf_counter()
+    proxy.invalidateFilter()
+    proxy.rowCount()  # The proxy filters lazily, when its mapping is first needed
+    print(f"  100,000 rows proxy model, one range change {(time.perf_counter() - start) * 1000:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
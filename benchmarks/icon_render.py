@@ -0,0 +1,66 @@
+"""Compare per-call SVG parsing with the pooled renderers of SVGIconManager.
+
+Run from the repository root:
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/icon_render.py
+"""
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
+
+from PySide6.QtCore import QByteArray, Qt
+from PySide6.QtGui import QPainter, QPixmap
+from PySide6.QtSvg import QSvgRenderer
+from PySide6.QtWidgets import QApplication
+
+from dashboard_components.icon import SVGIconManager, fill_template
+
+FILLS = ["#FFFFFF", "#000000", "gray"]
+SIZES = [10, 16, 32]
+ROUNDS = 20
+
+
+def render_per_call(manager, icon_name, size, fill):
+    """The original render_icon pipeline: substitute, parse and paint on every call."""
+    svg_template = fill_template(manager.get_icon(icon_name), fill, size)
+    renderer = QSvgRenderer(QByteArray(svg_template.encode("utf-8")))
+    pixmap = QPixmap(size, size)
+    pixmap.fill(Qt.transparent)
+    painter = QPainter(pixmap)
+    renderer.render(painter)
+    painter.end()
+    return pixmap
+
+
+def render_pooled(manager, icon_name, size, fill):
+    """Paint-only path: pooled renderer plus tint, bypassing the pixmap cache."""
+    return QPixmap.fromImage(manager.rasterize(manager.get_renderer(icon_name), size, fill))
+
+
+def run(label, func, manager):
+    names = list(manager.icons.keys())
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for name in names:
+            for size in SIZES:
+                for fill in FILLS:
+                    func(manager, name, size, fill)
+    elapsed = time.perf_counter() - start
+    calls = ROUNDS * len(names) * len(SIZES) * len(FILLS)
+    print(f"{label:<10} {calls:>6} renders  {elapsed * 1000:9.1f} ms  {elapsed / calls * 1e6:8.1f} us/render")
+    return elapsed
+
+
+def main():
+    QApplication.instance() or QApplication(sys.argv)
+    manager = SVGIconManager(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "icons.txt"))
+    print(f"{len(manager.icons)} icons, sizes {SIZES}, fills {FILLS}, {ROUNDS} rounds")
+    per_call = run("per-call", render_per_call, manager)
+    pooled = run("pooled", render_pooled, manager)
+    print(f"speedup    {per_call / pooled:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
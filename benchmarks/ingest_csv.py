@@ -0,0 +1,99 @@
+"""Load a generated CSV into the Processes page and measure how long the GUI thread is ever blocked.
+
+A 5 ms timer runs during the load; the longest gap between its ticks is the worst stall. The file is
+then reopened from the table cache, as is and after touching it (which costs a content hash):
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/ingest_csv.py [ROWS] [COLUMNS]
+"""
+import os
+import resource
+import shutil
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, "src"))
+
+
+def write_csv(path, rows, columns):
+    import numpy as np
+    rng = np.random.default_rng(0)
+    with open(path, "w", encoding="utf-8") as file:
+        file.write(",".join(["Date", "Id"] + [f"Value {i}" for i in range(1, columns - 1)]) + "\n")
+        for start in range(0, rows, 100_000):
+            count = min(100_000, rows - start)
+            dates = np.datetime_as_string(np.datetime64("2020-01-01") + rng.integers(0, 1500, count))
+            values = rng.standard_normal((count, columns - 2)).round(3)
+            file.writelines(f"{date},{start + i},{','.join(map(str, row))}\n"
+                            for i, (date, row) in enumerate(zip(dates, values.tolist())))
+
+
+def main() -> None:
+    from PySide6.QtCore import QThreadPool, QTimer
+    from PySide6.QtWidgets import QApplication
+    from dashboard_components.processes import ProcessesPage
+    from dashboard_components.style import StyleManager
+    from dashboard_components.table_cache import TableCache
+
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    columns = int(sys.argv[2]) if len(sys.argv) > 2 else 10
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    directory = tempfile.mkdtemp()
+    path = os.path.join(directory, "table.csv")
+    write_csv(path, rows, columns)
+    print(f"{rows:,} x {columns} CSV, {os.path.getsize(path) / 2**20:,.0f} MiB")
+
+    cache = TableCache(os.path.join(directory, "cache"))
+    page = ProcessesPage(StyleManager(), cache=cache)
+    page.resize(1200, 800)
+    page.show()
+    gaps, last = [], [time.perf_counter()]
+
+    def tick():
+        now = time.perf_counter()
+        gaps.append(now - last[0])
+        last[0] = now
+
+    timer = QTimer()
+    timer.setInterval(5)
+    timer.timeout.connect(tick)
+    done = []
+    page.ingestor.finished.connect(lambda loaded, cancelled: done.append(loaded))
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    start = time.perf_counter()
+    timer.start()
+    page.loadFile(path)
+    while not done:
+        app.processEvents()
+        time.sleep(0.001)
+    elapsed = time.perf_counter() - start
+    gaps.sort()
+    print(f"loaded {done[0]:,} rows in {elapsed:.1f} s ({done[0] / elapsed:,.0f} rows/s)")
+    print(f"GUI timer gaps: median {gaps[len(gaps) // 2] * 1000:.1f} ms, "
+          f"p99 {gaps[int(len(gaps) * 0.99)] * 1000:.1f} ms, max {gaps[-1] * 1000:.1f} ms")
+    print(f"peak RSS grew by {(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before) / 1024:,.0f} MiB, "
+          f"columns hold {sum(page.model.columnData(c).nbytes for c in range(page.model.columnCount())) / 2**20:,.0f} MiB")
+
+    QThreadPool.globalInstance().waitForDone()  # The cache is written in the background
+    print(f"cache holds {cache.total_bytes() / 2**20:,.0f} MiB")
+    for label in ("reopen", "reopen after touch"):
+        if label != "reopen":
+            os.utime(path)
+        reopened = ProcessesPage(StyleManager(), cache=cache)
+        reopened.resize(1200, 800)
+        reopened.show()
+        done.clear()
+        reopened.ingestor.finished.connect(lambda loaded, cancelled: done.append(loaded))
+        start = time.perf_counter()
+        reopened.loadFile(path)
+        while not done:
+            app.processEvents()
+        reopened.table_view.viewport().repaint()
+        print(f"{label}: {done[0]:,} rows on screen in {(time.perf_counter() - start) * 1000:.0f} ms")
+    print(f"cache {cache.info()}")
+    shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""Memory and time of a full navigation icon refresh, per-item pixmaps vs. the sprite atlas.
+
+Each mode runs in its own process on a navigation pane with 500 items, each with a distinct icon:
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/nav_atlas_memory.py
+"""
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, "src"))
+
+ITEMS = 500
+FILLS = ["#FFFFFF", "#000000"]
+
+
+def rss_kib() -> int:
+    with open("/proc/self/statm") as statm:
+        return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") // 1024
+
+
+def run_mode(mode: str) -> None:
+    from PySide6.QtGui import QIcon
+    from PySide6.QtWidgets import QApplication, QLabel, QWidget
+    from dashboard_components.icon import SVGIconManager
+    from dashboard_components.icon_store import JsonLinesStore, read_legacy_icons
+    from dashboard_components.navbar import CustomNavigationContentWidget
+    from dashboard_components.style import StyleManager
+
+    class Host(QWidget):
+        def toggle_mode(self):
+            pass
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    templates = list(read_legacy_icons(os.path.join(REPO_ROOT, "icons.txt")).values())
+    with tempfile.TemporaryDirectory() as directory:
+        icons = {f"icon-{i}": templates[i % len(templates)] for i in range(ITEMS)}
+        store = JsonLinesStore.create(os.path.join(directory, "icons.jsonl"), icons)
+        icon_manager = SVGIconManager(store=store, cache_size=ITEMS * len(FILLS) + 16)
+        host = Host()
+        nav = CustomNavigationContentWidget(StyleManager(), icon_manager, host, atlas_mode=mode == "atlas")
+        for name in icons:
+            nav.addPageWithNavigationItem(QLabel(name), QIcon(), name, name)
+        app.processEvents()
+
+        baseline = rss_kib()
+        start = time.perf_counter()
+        for fill in FILLS:
+            icon_manager.set_icon_fill(fill)
+            nav.refresh_icons()
+        elapsed = time.perf_counter() - start
+        app.processEvents()
+        grown = rss_kib() - baseline
+
+        info = icon_manager.cache_info()
+        if mode == "atlas":
+            sheets = list(icon_manager._atlas_cache.values())
+            pixmaps = len(sheets)
+            pixel_bytes = sum(atlas.memory_bytes() for atlas in sheets)
+        else:
+            pixmaps = info["misses"]
+            pixel_bytes = sum(pixmap.width() * pixmap.height() * pixmap.depth() // 8
+                              for pixmap in icon_manager._pixmap_cache.values())
+        print(f"{mode:<9} {ITEMS} items x {len(FILLS)} fills  {elapsed * 1000:8.1f} ms  "
+              f"{pixmaps:5d} pixmaps  {pixel_bytes / 1024:8.1f} KiB pixels  RSS +{grown} KiB")
+        store.close()
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        run_mode(sys.argv[1])
+        return
+    for mode in ("per-item", "atlas"):
+        subprocess.run([sys.executable, os.path.abspath(__file__), mode], check=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Per-keystroke cost of filtering a navigation pane of 10,000 items through the search index.
+
+Times the index lookup alone and the full filterNavigation call (lookup plus model reset):
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/nav_search.py
+"""
+import os
+import random
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, "src"))
+
+ITEMS = 10000
+TYPED = "sales report 12"
+
+
+def main() -> None:
+    from PySide6.QtGui import QIcon
+    from PySide6.QtWidgets import QApplication, QWidget
+    from dashboard_components.icon import SVGIconManager
+    from dashboard_components.icon_store import LegacyDictStore, read_legacy_icons
+    from dashboard_components.navbar import CustomNavigationContentWidget
+    from dashboard_components.style import StyleManager
+
+    class Host(QWidget):
+        def toggle_mode(self):
+            pass
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    icons_path = os.path.join(REPO_ROOT, "icons.txt")
+    icon_names = list(read_legacy_icons(icons_path))
+    host = Host()
+    nav = CustomNavigationContentWidget(StyleManager(), SVGIconManager(store=LegacyDictStore(icons_path)), host)
+    random.seed(0)
+    topics = ["sales", "stock", "finance", "payroll", "inventory"]
+    start = time.perf_counter()
+    for i in range(ITEMS):
+        nav.addPageWithNavigationItem(lambda: QWidget(), QIcon(), f"{random.choice(topics).title()} report {i}",
+                                      random.choice(icon_names))
+    print(f"indexed {ITEMS} items while adding pages in {(time.perf_counter() - start) * 1000:.0f} ms")
+    app.processEvents()
+
+    print(f"{'query':<18} {'matches':>7} {'index':>9} {'filter':>9}")
+    for length in range(1, len(TYPED) + 1):
+        query = TYPED[:length]
+        index_query = TYPED[:length - 1]
+        nav.search_index.search(index_query)  # Same previous query the search box would have seen
+        start = time.perf_counter()
+        matches = nav.search_index.search(query)
+        lookup = time.perf_counter() - start
+        nav.search_index.search(index_query)
+        start = time.perf_counter()
+        nav.filterNavigation(query)
+        elapsed = time.perf_counter() - start
+        print(f"{query!r:<18} {len(matches):7d} {lookup * 1e6:7.0f}us {elapsed * 1e6:7.0f}us")
+
+
+if __name__ == "__main__":
+    main()
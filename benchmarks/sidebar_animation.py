@@ -0,0 +1,61 @@
+"""Frame timing of the animated sidebar collapse with a heavy page visible, against the instant toggle.
+
+The MainWindow shows an extra page of 2,000 widgets; each mode collapses and expands the sidebar:
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/sidebar_animation.py
+"""
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, "src"))
+
+WIDGETS = 2000
+TOGGLES = 4
+
+
+def main() -> None:
+    from PySide6.QtCore import QElapsedTimer, QVariantAnimation
+    from PySide6.QtGui import QIcon
+    from PySide6.QtWidgets import QApplication, QGridLayout, QLabel, QPushButton, QWidget
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    os.chdir(REPO_ROOT)
+    from main import MainWindow
+    window = MainWindow()
+    nav = window.navigationContentWidget
+    page = QWidget()
+    grid = QGridLayout(page)
+    for i in range(WIDGETS):
+        grid.addWidget(QPushButton(f"Button {i}") if i % 2 else QLabel(f"Label {i}"), i // 40, i % 40)
+    nav.addPageWithNavigationItem(page, QIcon(), "Widgets", "Home")
+    nav.switchToPage(nav.contentStack.count() - 1)
+    window.resize(1600, 1000)
+    window.show()
+    app.processEvents()
+    print(f"frame budget {nav.frameInterval() * 1000:.1f} ms")
+
+    nav.animated_collapse = False
+    timings = []
+    for _ in range(TOGGLES):
+        start = time.perf_counter()
+        nav.toggle_sidebar()
+        app.processEvents()
+        timings.append(time.perf_counter() - start)
+    print(f"instant   toggle max {max(timings) * 1000:7.1f} ms (one frame)")
+
+    nav.animated_collapse = True
+    for _ in range(TOGGLES):
+        nav.toggle_sidebar()
+        timer = QElapsedTimer()
+        timer.start()
+        while nav._sidebar_animation.state() == QVariantAnimation.Running and timer.elapsed() < 5000:
+            app.processEvents()
+        stats = nav.sidebar_frame_stats()
+        print(f"animated  {stats['frames']:3d} frames  mean {stats['mean_ms']:5.1f} ms  max {stats['max_ms']:5.1f} ms"
+              f"  {stats['fps']:5.1f} fps  {stats['dropped']} dropped")
+
+
+if __name__ == "__main__":
+    main()
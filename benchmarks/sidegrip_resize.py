@@ -0,0 +1,78 @@
+"""Relayouts per second while dragging a side grip with a 1,000 Hz mouse, per event vs. coalesced per frame.
+
+Mouse moves are posted to the right-edge grip of a shown MainWindow once per millisecond for two seconds;
+every window resize event counts as one relayout of the window:
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/sidegrip_resize.py
+"""
+import os
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, "src"))
+
+POLLING_RATE = 1000
+SECONDS = 2.0
+
+
+def run_mode(mode: str) -> None:
+    from PySide6.QtCore import QEvent, QObject, QPointF, Qt
+    from PySide6.QtGui import QMouseEvent
+    from PySide6.QtWidgets import QApplication
+
+    class ResizeCounter(QObject):
+        count = 0
+
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.Resize:
+                self.count += 1
+            return False
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    os.chdir(REPO_ROOT)
+    from main import MainWindow
+    window = MainWindow()
+    window.resize(1000, 700)
+    window.show()
+    app.processEvents()
+
+    grip = window.sideGrips[2]
+    if mode == "per-event":
+        grip.resizeCoalescer.interval = 0
+    counter = ResizeCounter()
+    window.installEventFilter(counter)
+
+    def mouse_event(event_type, x):
+        local = QPointF(grip.width() / 2, grip.height() / 2)
+        global_pos = QPointF(grip.mapToGlobal(local.toPoint())) + QPointF(x, 0)
+        return QMouseEvent(event_type, local, global_pos, Qt.LeftButton, Qt.LeftButton, Qt.NoModifier)
+
+    app.sendEvent(grip, mouse_event(QEvent.MouseButtonPress, 0))
+    moves = 0
+    start = time.perf_counter()
+    next_move = start
+    while time.perf_counter() - start < SECONDS:
+        now = time.perf_counter()
+        if now >= next_move:
+            moves += 1
+            app.sendEvent(grip, mouse_event(QEvent.MouseMove, (moves % 400) - 200))
+            next_move += 1.0 / POLLING_RATE
+        app.processEvents()
+    app.sendEvent(grip, mouse_event(QEvent.MouseButtonRelease, 0))
+    elapsed = time.perf_counter() - start
+    print(f"{mode:<10} {moves / elapsed:6.0f} moves/s  {counter.count / elapsed:6.0f} relayouts/s  "
+          f"{grip.resizeCoalescer.applied} geometry changes")
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        run_mode(sys.argv[1])
+        return
+    for mode in ("per-event", "coalesced"):
+        subprocess.run([sys.executable, os.path.abspath(__file__), mode], check=True, stderr=subprocess.DEVNULL)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Polish cost of a theme toggle: per-widget setStyleSheet cascades vs. one application stylesheet.
+
+"application" applies the scoped sheet once on the main window, "qapplication" applies the same sheet
+through QApplication.setStyleSheet for comparison and "palette" swaps QPalettes only. Each mode runs in
+its own process on a MainWindow carrying an extra page of 1,000 widgets:
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/stylesheet_polish.py
+"""
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, "src"))
+
+WIDGETS = 1000
+TOGGLES = 10
+
+
+def run_mode(styling_mode: str) -> None:
+    from PySide6.QtCore import QEvent, QObject
+    from PySide6.QtGui import QIcon
+    from PySide6.QtWidgets import QApplication, QGridLayout, QLabel, QPushButton, QWidget
+
+    class StyleChangeCounter(QObject):
+        count = 0
+
+        def eventFilter(self, obj, event):
+            if event.type() == QEvent.StyleChange:
+                self.count += 1
+            return False
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    os.chdir(REPO_ROOT)
+    from main import MainWindow
+    window = MainWindow(styling_mode="application" if styling_mode == "qapplication" else styling_mode)
+    if styling_mode == "qapplication":
+        window.setStyleSheet("")
+        window.applyStyles = lambda: app.setStyleSheet(window.style_manager.get_application_stylesheet())
+        window.applyStyles()
+
+    page = QWidget()
+    grid = QGridLayout(page)
+    for i in range(WIDGETS):
+        widget = QPushButton(f"Button {i}") if i % 2 else QLabel(f"Label {i}")
+        grid.addWidget(widget, i // 25, i % 25)
+    window.navigationContentWidget.addPageWithNavigationItem(page, QIcon(), "Widgets", "Home")
+    window.navigationContentWidget.switchToPage(window.navigationContentWidget.contentStack.count() - 1)
+    window.show()
+    app.processEvents()
+
+    counter = StyleChangeCounter()
+    app.installEventFilter(counter)
+    timings = []
+    for _ in range(TOGGLES):
+        start = time.perf_counter()
+        window.toggle_mode()
+        app.processEvents()
+        timings.append(time.perf_counter() - start)
+    print(f"{styling_mode:<13} {len(app.allWidgets()):5d} widgets  toggle median {statistics.median(timings) * 1000:7.1f} ms"
+          f"  max {max(timings) * 1000:7.1f} ms  {counter.count // TOGGLES:6d} style changes/toggle")
+
+
+def main() -> None:
+    if len(sys.argv) > 1:
+        run_mode(sys.argv[1])
+        return
+    for styling_mode in ("widget", "application", "qapplication", "palette"):
+        subprocess.run([sys.executable, os.path.abspath(__file__), styling_mode], check=True,
+                       stdout=None, stderr=subprocess.DEVNULL)
+
+
+if __name__ == "__main__":
+    main()
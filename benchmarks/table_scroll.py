@@ -0,0 +1,63 @@
+"""Scrolling cost of the Processes page over a 5,000,000 x 30 columnar dataset (about 600 MiB of arrays).
+
+Pages down, jumps to random positions and scrolls sideways, repainting after every step:
+
+    QT_QPA_PLATFORM=offscreen python benchmarks/table_scroll.py [ROWS] [COLUMNS]
+"""
+import os
+import statistics
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, "src"))
+
+STEPS = 200
+
+
+def main() -> None:
+    import numpy as np
+    from PySide6.QtWidgets import QApplication
+    from dashboard_components.columnar_model import sample_columns
+    from dashboard_components.processes import ProcessesPage
+    from dashboard_components.style import StyleManager
+
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000_000
+    columns = int(sys.argv[2]) if len(sys.argv) > 2 else 30
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+
+    start = time.perf_counter()
+    names, data = sample_columns(rows, columns)
+    print(f"generated {rows:,} x {columns} in {time.perf_counter() - start:.1f} s, "
+          f"{sum(column.nbytes for column in data) / 2**20:,.0f} MiB of arrays")
+
+    page = ProcessesPage(StyleManager())
+    page.resize(1600, 1000)
+    page.show()
+    start = time.perf_counter()
+    page.setColumns(names, data)
+    app.processEvents()
+    print(f"setColumns + first paint {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    view = page.table_view
+    vertical, horizontal = view.verticalScrollBar(), view.horizontalScrollBar()
+    rng = np.random.default_rng(1)
+    scenarios = {
+        "page down": lambda step: vertical.setValue(vertical.value() + vertical.pageStep()),
+        "random jump": lambda step: vertical.setValue(int(rng.integers(0, vertical.maximum()))),
+        "sideways": lambda step: horizontal.setValue((step * 97) % (horizontal.maximum() + 1)),
+    }
+    for label, scroll in scenarios.items():
+        timings = []
+        for step in range(STEPS):
+            started = time.perf_counter()
+            scroll(step)
+            view.viewport().repaint()
+            timings.append(time.perf_counter() - started)
+        print(f"{label:<12} median {statistics.median(timings) * 1000:6.2f} ms  "
+              f"p99 {sorted(timings)[int(STEPS * 0.99)] * 1000:6.2f} ms  max {max(timings) * 1000:6.2f} ms")
+    print(f"cache {page.model.cache_info()}")
+
+
+if __name__ == "__main__":
+    main()
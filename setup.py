@@ -11,8 +11,12 @@ setup(
     package_dir={"": "src"},      # Specify 'src' as the root for your package directories
     install_requires=[           # List your project's dependencies here
         "PySide6",                # Add any dependencies here
+        "numpy",                  # Columnar data of the Processes page
         "pytest",                 # Optional: add for testing
     ],
+    extras_require={
+        "xlsx": ["openpyxl"],     # .xlsx files on the Processes page; .csv needs nothing extra
+    },
     classifiers=[                # Additional classifiers for Python Package Index (PyPI)
         "Programming Language :: Python :: 3",
         "Programming Language :: Python :: 3.9",
@@ -1,3 +1,18 @@
-from .navbar import CustomNavigationContentWidget
-from .titlebar import CustomTitleBar
-from .style import StyleManager
\ No newline at end of file
+import importlib
+
+# Exports are imported on first access, so importing one submodule does not load the others
+_EXPORTS = {
+    "CustomNavigationContentWidget": ".navbar",
+    "CustomTitleBar": ".titlebar",
+    "StyleManager": ".style",
+}
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
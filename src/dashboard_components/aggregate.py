@@ -0,0 +1,142 @@
+"""Vectorized group-by and pivot aggregation over NumPy columns."""
+import threading
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+FUNCTIONS = ("count", "sum", "mean", "min", "max")
+MAX_PIVOT_CELLS = 10_000_000  # Groups times pivot keys; the dense result grid would not fit beyond this
+
+
+def factorize(values: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Return the sorted distinct keys of a column and each row's position among them.
+
+    Dates are grouped by day. Object columns mixing types that cannot be ordered, such as dates and
+    text, are grouped by their text.
+    """
+    if values.dtype.kind == "M":
+        values = values.astype("datetime64[D]")
+    if values.dtype.kind in "iufM" and len(values) and bool(np.all(values[1:] >= values[:-1])):
+        # Already in order, as date columns often are: one linear pass instead of np.unique's sort
+        starts = np.empty(len(values), dtype=bool)
+        starts[0] = True
+        np.not_equal(values[1:], values[:-1], out=starts[1:])
+        return values[starts], np.cumsum(starts, dtype=np.intp) - 1
+    try:
+        keys, codes = np.unique(values, return_inverse=True)
+    except TypeError:
+        keys, codes = np.unique(values.astype(str), return_inverse=True)
+    return keys, codes.reshape(-1).astype(np.intp, copy=False)
+
+
+def reduce_groups(function: str, codes: np.ndarray, values: Optional[np.ndarray], size: int) -> np.ndarray:
+    """Apply an aggregate to every group at once; groups without rows get 0 (count, sum) or NaN."""
+    if function == "count":
+        return np.bincount(codes, minlength=size)
+    if values is None:
+        raise ValueError(f"{function} needs a value column")
+    if function in ("sum", "mean"):
+        sums = np.bincount(codes, weights=values, minlength=size)
+        if function == "sum":
+            return sums
+        counts = np.bincount(codes, minlength=size)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return sums / counts
+    if function in ("min", "max"):
+        ufunc, start = (np.minimum, np.inf) if function == "min" else (np.maximum, -np.inf)
+        result = np.full(size, start)
+        ufunc.at(result, codes, values)
+        result[np.isinf(result) & (np.bincount(codes, minlength=size) == 0)] = np.nan
+        return result
+    raise ValueError(f"Unknown aggregate {function!r}; expected one of {', '.join(FUNCTIONS)}")
+
+
+class AggregationEngine:
+    """Group-by, pivot and summary statistics over a table's columns.
+
+    Each key column is factorized once (np.unique, the only O(n log n) step) and its codes are kept
+    until the columns change. An aggregate is then np.bincount or a ufunc.at over the codes of the
+    rows shown, so when only the row filter changes the work is proportional to the rows kept.
+    aggregate() may run on a worker thread; generation lets a queued request see it was superseded.
+    """
+
+    def __init__(self):
+        self.names: List[str] = []
+        self.columns: List[np.ndarray] = []
+        self.generation = 0
+        self.factorizations = 0  # np.unique runs since the engine was created
+        self._factors: Dict[int, Tuple[np.ndarray, np.ndarray, np.ndarray]] = {}  # Column -> (array, keys, codes)
+        self._lock = threading.Lock()
+
+    def setColumns(self, names: Sequence[str], columns: Sequence[np.ndarray]) -> None:
+        with self._lock:
+            self.names = list(names)
+            self.columns = list(columns)
+            self._factors.clear()
+
+    def factors(self, column: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Return the keys and codes of a column, factorizing it on first use."""
+        with self._lock:
+            array = self.columns[column]
+            cached = self._factors.get(column)
+        if cached is not None and cached[0] is array:
+            return cached[1], cached[2]
+        keys, codes = factorize(array)
+        with self._lock:
+            self.factorizations += 1
+            if column < len(self.columns) and self.columns[column] is array:  # Not replaced meanwhile
+                self._factors[column] = (array, keys, codes)
+        return keys, codes
+
+    def aggregate(self, group: int, function: str = "count", value: Optional[int] = None,
+                  pivot: Optional[int] = None, rows: Union[None, slice, np.ndarray] = None
+                  ) -> Tuple[List[str], List[np.ndarray]]:
+        """Aggregate value by the keys of group (and pivot), over the given rows or all of them.
+
+        Returns the result as column names and arrays: the group keys followed by one column of
+        results, or one column per pivot key named by the key. Only groups and pivot keys that occur
+        in the rows are kept.
+        """
+        keys, codes = self.factors(group)
+        if rows is not None:
+            codes = codes[rows]
+        values = None
+        if function != "count" or value is not None:
+            if value is None:
+                raise ValueError(f"{function} needs a value column")
+            values = self.columns[value]
+            if values.dtype.kind not in "fiub":
+                raise TypeError(f"{self.names[value]} is not numeric")
+            values = values if rows is None else values[rows]
+            values = values.astype(np.float64, copy=False)
+        pivot_keys = None
+        if pivot is not None:
+            pivot_keys, pivot_codes = self.factors(pivot)
+            if len(keys) * len(pivot_keys) > MAX_PIVOT_CELLS:
+                raise ValueError(f"{len(keys):,} groups × {len(pivot_keys):,} pivot keys is too many cells")
+            codes = codes * len(pivot_keys) + (pivot_codes if rows is None else pivot_codes[rows])
+        size = len(keys) * (len(pivot_keys) if pivot_keys is not None else 1)
+        counts = np.bincount(codes, minlength=size)  # Rows per group, missing values included
+        if values is not None:
+            present = ~np.isnan(values)
+            if not present.all():
+                codes, values = codes[present], values[present]
+        result = reduce_groups(function, codes, values, size)
+        if function == "sum" and self.columns[value].dtype.kind in "iub":
+            result = np.rint(result).astype(np.int64)
+
+        label = function if value is None else f"{function}({self.names[value]})"
+        if pivot_keys is None:
+            kept = counts > 0
+            return [self.names[group], label], [keys[kept], result[kept]]
+        counts = counts.reshape(len(keys), len(pivot_keys))
+        grid = result.reshape(len(keys), len(pivot_keys))
+        kept_rows, kept_columns = counts.any(axis=1), np.flatnonzero(counts.any(axis=0))
+        names = [self.names[group]] + [_key_text(pivot_keys[column]) for column in kept_columns]
+        return names, [keys[kept_rows]] + [np.ascontiguousarray(grid[kept_rows, column]) for column in kept_columns]
+
+
+def _key_text(key) -> str:
+    if isinstance(key, np.datetime64):
+        return np.datetime_as_string(key)
+    return str(key)
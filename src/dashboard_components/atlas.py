@@ -0,0 +1,85 @@
+import math
+from typing import Dict, Iterable
+
+from PySide6.QtCore import QRect, QRectF, QSize, Qt
+from PySide6.QtGui import QColor, QIcon, QIconEngine, QImage, QPainter, QPixmap
+
+
+class _AtlasIconEngine(QIconEngine):
+    """Icon engine that paints a sub-rectangle of a shared atlas sheet."""
+
+    def __init__(self, atlas, source: QRectF):
+        super().__init__()
+        self.atlas = atlas
+        self.source = source
+
+    def paint(self, painter, rect, mode, state):
+        if mode == QIcon.Disabled:
+            painter.save()
+            painter.setOpacity(0.5)
+            painter.drawPixmap(QRectF(rect), self.atlas.sheet, self.source)
+            painter.restore()
+        else:
+            painter.drawPixmap(QRectF(rect), self.atlas.sheet, self.source)
+
+    def actualSize(self, size, mode, state):
+        return QSize(min(size.width(), self.atlas.size), min(size.height(), self.atlas.size))
+
+    def pixmap(self, size, mode, state):
+        # Only reached when a caller asks for a standalone pixmap; item views use paint()
+        pixmap = QPixmap(size)
+        pixmap.fill(Qt.transparent)
+        painter = QPainter(pixmap)
+        self.paint(painter, QRect(0, 0, size.width(), size.height()), mode, state)
+        painter.end()
+        return pixmap
+
+    def clone(self):
+        return _AtlasIconEngine(self.atlas, self.source)
+
+
+class IconAtlas:
+    """All icons of one size and fill packed into a single pixmap sheet.
+
+    The sheet is painted in one pass with the icon manager's pooled renderers and tinted once,
+    and icons handed out by icon() only reference their cell of the shared sheet.
+    """
+
+    def __init__(self, icon_manager, names: Iterable[str], size: int, fill: str, dpr: float = 1.0):
+        self.size = size
+        self.fill = fill
+        self.rects: Dict[str, QRectF] = {}
+
+        renderers = {}
+        for icon_name in dict.fromkeys(names):
+            renderer = icon_manager.get_renderer(icon_name)
+            if renderer is not None:
+                renderers[icon_name] = renderer
+
+        columns = max(1, math.ceil(math.sqrt(len(renderers))))
+        rows = max(1, math.ceil(len(renderers) / columns))
+        image = QImage(round(columns * size * dpr), round(rows * size * dpr), QImage.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(dpr)
+        image.fill(Qt.transparent)
+        painter = QPainter(image)
+        for position, (icon_name, renderer) in enumerate(renderers.items()):
+            cell = QRectF((position % columns) * size, (position // columns) * size, size, size)
+            renderer.render(painter, cell)
+            # drawPixmap source rectangles are in device pixels
+            self.rects[icon_name] = QRectF(cell.x() * dpr, cell.y() * dpr, size * dpr, size * dpr)
+        painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
+        painter.fillRect(QRectF(0, 0, columns * size, rows * size), QColor(fill))
+        painter.end()
+        self.sheet = QPixmap.fromImage(image)
+
+    def __contains__(self, icon_name) -> bool:
+        return icon_name in self.rects
+
+    def icon(self, icon_name: str) -> QIcon:
+        """Return an icon drawing the named cell of the sheet, or a null icon if it is missing."""
+        source = self.rects.get(icon_name)
+        return QIcon(_AtlasIconEngine(self, source)) if source is not None else QIcon()
+
+    def memory_bytes(self) -> int:
+        """Size of the sheet's pixel data."""
+        return self.sheet.width() * self.sheet.height() * self.sheet.depth() // 8
@@ -0,0 +1,219 @@
+from collections import OrderedDict
+from typing import Callable, Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+# data() runs for every role of every visible cell on each repaint; the view passes plain ints and
+# looking up Qt enum members costs microseconds per comparison, so the roles are resolved once here.
+_DISPLAY_ROLE = Qt.ItemDataRole.DisplayRole.value
+_ALIGNMENT_ROLE = Qt.ItemDataRole.TextAlignmentRole.value
+
+def _block_formatter(values: np.ndarray) -> Callable[[np.ndarray], List[str]]:
+    """Return a function turning a slice of a column into display strings."""
+    kind = values.dtype.kind
+    if kind == "f":
+        return lambda block: [f"{value:,.2f}" for value in block.tolist()]
+    if kind in "iu":
+        return lambda block: [f"{value:,}" for value in block.tolist()]
+    if kind == "M":
+        return lambda block: np.datetime_as_string(block).tolist()  # In the column's own unit
+    if kind == "b":
+        return lambda block: ["true" if value else "false" for value in block.tolist()]
+    return lambda block: [str(value) for value in block.tolist()]
+
+
+def merged_dtype(current: np.dtype, new: np.dtype) -> np.dtype:
+    """Return a dtype holding values of both; text and incompatible kinds fall back to object."""
+    if current == new:
+        return current
+    try:
+        dtype = np.result_type(current, new)
+    except TypeError:  # Dates mixed with numbers, for instance
+        return np.dtype(object)
+    return np.dtype(object) if dtype.kind in "US" else dtype
+
+
+class ColumnarTableModel(QAbstractTableModel):
+    """Read-only table over one NumPy array per column.
+
+    Cells are not materialized as Python objects: data() formats a block of block_rows rows of one
+    column the first time any cell in it is requested and keeps the strings in an LRU cache of
+    cache_blocks blocks, so memory follows what the view shows rather than the size of the data.
+
+    setRowMap() restricts the rows shown to a slice or an array of source rows without copying any
+    column, so a filter that can produce one (such as a DateIndex query) costs the same at any size.
+    """
+
+    def __init__(self, names: Sequence[str] = (), columns: Sequence[np.ndarray] = (), parent=None,
+                 block_rows: int = 256, cache_blocks: int = 512):
+        super().__init__(parent)
+        self.block_rows = block_rows
+        self.cache_blocks = cache_blocks
+        self._names: List[str] = []
+        self._columns: List[np.ndarray] = []  # Views of the first _rows entries of _buffers
+        self._buffers: List[np.ndarray] = []
+        self._formatters: List[Callable[[np.ndarray], List[str]]] = []
+        self._alignments: List[Qt.AlignmentFlag] = []
+        self._rows = 0
+        self._row_map: Union[None, slice, np.ndarray] = None  # Source rows shown, in view order; None for all
+        self._blocks: "OrderedDict[Tuple[int, int], List[str]]" = OrderedDict()
+        self.formatted_blocks = 0  # Blocks formatted since the data was set; a cache miss each
+        self.setColumns(names, columns)
+
+    def setColumns(self, names: Sequence[str], columns: Sequence[np.ndarray]) -> None:
+        """Replace the data; every column must have the same length."""
+        lengths = {len(column) for column in columns}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns differ in length: {sorted(lengths)}")
+        self.beginResetModel()
+        self._names = list(names)
+        self._buffers = list(columns)
+        self._columns = list(columns)
+        self._rows = lengths.pop() if lengths else 0
+        self._row_map = None
+        self._updateFormatting()
+        self._blocks.clear()
+        self.formatted_blocks = 0
+        self.endResetModel()
+
+    def setRowMap(self, rows: Union[None, slice, np.ndarray]) -> None:
+        """Show only the given source rows: a slice, an integer array in display order, or None for all."""
+        if isinstance(rows, slice):
+            start, stop, step = rows.indices(self._rows)
+            if step != 1:
+                raise ValueError("Row slices must be contiguous")
+            rows = slice(start, max(start, stop))
+        self.beginResetModel()
+        self._row_map = rows
+        self._blocks.clear()
+        self.endResetModel()
+
+    def sourceRowCount(self) -> int:
+        """Return the number of rows in the columns, shown or not."""
+        return self._rows
+
+    def rowMap(self) -> Union[None, slice, np.ndarray]:
+        return self._row_map
+
+    def sourceRow(self, row: int) -> int:
+        """Return the row of the columns shown at a view row."""
+        row_map = self._row_map
+        if row_map is None:
+            return row
+        if isinstance(row_map, slice):
+            return row_map.start + row
+        return int(row_map[row])
+
+    def appendRows(self, columns: Sequence[np.ndarray]) -> None:
+        """Append one chunk of rows, given as one array per existing column, in a single row insertion.
+
+        Column buffers grow geometrically so appending many chunks copies each value a bounded number
+        of times. A column whose dtype cannot hold the new values is converted, e.g. integers to floats.
+        """
+        if self._row_map is not None:
+            raise RuntimeError("Clear the row map before appending rows")
+        if len(columns) != len(self._buffers):
+            raise ValueError(f"Expected {len(self._buffers)} columns, got {len(columns)}")
+        lengths = {len(column) for column in columns}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns differ in length: {sorted(lengths)}")
+        count = lengths.pop() if lengths else 0
+        if not count:
+            return
+        start, end = self._rows, self._rows + count
+        self.beginInsertRows(QModelIndex(), start, end - 1)
+        dtype_changed = False
+        for position, (buffer, chunk) in enumerate(zip(self._buffers, columns)):
+            dtype = merged_dtype(buffer.dtype, chunk.dtype)
+            if dtype != buffer.dtype or end > len(buffer):
+                dtype_changed = dtype_changed or dtype != buffer.dtype
+                grown = np.empty(max(end, 2 * len(buffer)), dtype=dtype)
+                grown[:start] = buffer[:start]
+                buffer = self._buffers[position] = grown
+            buffer[start:end] = chunk
+            self._columns[position] = buffer[:end]
+        self._rows = end
+        if dtype_changed:
+            self._updateFormatting()
+            self._blocks.clear()
+        else:
+            # Only the formerly last, partial block of each column has new rows
+            last_block = start // self.block_rows
+            for column in range(len(self._columns)):
+                self._blocks.pop((column, last_block), None)
+        self.endInsertRows()
+
+    def _updateFormatting(self):
+        self._formatters = [_block_formatter(column) for column in self._columns]
+        self._alignments = [Qt.AlignRight | Qt.AlignVCenter if column.dtype.kind in "fiu" else Qt.AlignLeft | Qt.AlignVCenter
+                            for column in self._columns]
+
+    def columnNames(self) -> List[str]:
+        return list(self._names)
+
+    def columnData(self, column: int) -> np.ndarray:
+        return self._columns[column]
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        row_map = self._row_map
+        if row_map is None:
+            return self._rows
+        return row_map.stop - row_map.start if isinstance(row_map, slice) else len(row_map)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._columns)
+
+    def data(self, index, role=_DISPLAY_ROLE):
+        if role == _DISPLAY_ROLE:
+            block, offset = divmod(index.row(), self.block_rows)
+            return self._block(index.column(), block)[offset]
+        if role == _ALIGNMENT_ROLE:
+            return self._alignments[index.column()]
+        return None
+
+    def headerData(self, section, orientation, role=_DISPLAY_ROLE):
+        if role != _DISPLAY_ROLE:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._names[section] if section < len(self._names) else None
+        return str(self.sourceRow(section) + 1)
+
+    def _block(self, column: int, block: int) -> List[str]:
+        key = (column, block)
+        strings = self._blocks.get(key)
+        if strings is not None:
+            self._blocks.move_to_end(key)
+            return strings
+        start = block * self.block_rows
+        values, row_map = self._columns[column], self._row_map
+        if row_map is None:
+            values = values[start:start + self.block_rows]
+        elif isinstance(row_map, slice):
+            values = values[row_map.start + start:min(row_map.start + start + self.block_rows, row_map.stop)]
+        else:
+            values = values[row_map[start:start + self.block_rows]]
+        strings = self._formatters[column](values)
+        self._blocks[key] = strings
+        self.formatted_blocks += 1
+        if len(self._blocks) > self.cache_blocks:
+            self._blocks.popitem(last=False)
+        return strings
+
+    def cache_info(self) -> Dict[str, int]:
+        """Return the formatted-block cache counters."""
+        return {"blocks": len(self._blocks), "max_blocks": self.cache_blocks, "formatted": self.formatted_blocks}
+
+
+def sample_columns(rows: int, columns: int, seed: int = 0) -> Tuple[List[str], List[np.ndarray]]:
+    """Return a synthetic dataset: a date column, an integer id column and float32 measurement columns."""
+    rng = np.random.default_rng(seed)
+    names = ["Date", "Id"] + [f"Value {i}" for i in range(1, max(columns - 2, 0) + 1)]
+    data = [
+        np.datetime64("2020-01-01") + np.sort(rng.integers(0, 5 * 365, rows)).astype("timedelta64[D]"),
+        np.arange(rows, dtype=np.int64),
+    ]
+    data += [rng.standard_normal(rows, dtype=np.float32) * 1000 for _ in range(columns - 2)]
+    return names[:columns], data[:columns]
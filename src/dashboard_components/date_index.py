@@ -0,0 +1,47 @@
+"""Sorted index over a date column, answering date-range queries with two binary searches."""
+from typing import Optional, Tuple, Union
+
+import numpy as np
+
+_ONE_DAY = np.timedelta64(1, "D")
+
+
+class DateIndex:
+    """Rows of a datetime64 column in date order.
+
+    Building costs one pass to check whether the column is already sorted, plus an argsort when it
+    is not. A query afterwards is two searchsorted calls, and its rows are a slice of the column
+    (sorted data) or a view of the argsort: no per-row work, whatever the table size. Missing dates
+    (NaT) sort last and never match a range.
+    """
+
+    def __init__(self, dates: np.ndarray):
+        if dates.dtype.kind != "M":
+            raise TypeError(f"Expected a datetime64 column, got {dates.dtype}")
+        # NaT compares false, so a column containing it takes the argsort path
+        in_order = len(dates) < 2 or bool(np.all(dates[1:] >= dates[:-1]))
+        self.order: Optional[np.ndarray] = None if in_order else np.argsort(dates, kind="stable")
+        self.sorted_dates = dates if in_order else dates[self.order]
+        self.count = len(dates) - int(np.count_nonzero(np.isnat(self.sorted_dates)))
+
+    def __len__(self) -> int:
+        return self.count
+
+    def bounds(self) -> Optional[Tuple[np.datetime64, np.datetime64]]:
+        """Return the first and last day in the column, or None when it has no dates."""
+        if not self.count:
+            return None
+        return (self.sorted_dates[0].astype("datetime64[D]"),
+                self.sorted_dates[self.count - 1].astype("datetime64[D]"))
+
+    def positions(self, first: np.datetime64, last: np.datetime64) -> Tuple[int, int]:
+        """Return the [start, stop) positions in date order of the days first to last, inclusive."""
+        dates = self.sorted_dates[:self.count]
+        start = int(np.searchsorted(dates, np.datetime64(first, "D"), side="left"))
+        stop = int(np.searchsorted(dates, np.datetime64(last, "D") + _ONE_DAY, side="left"))
+        return start, max(start, stop)
+
+    def rows(self, first: np.datetime64, last: np.datetime64) -> Union[slice, np.ndarray]:
+        """Return the column rows dated first to last, inclusive: a slice, or an array view in date order."""
+        start, stop = self.positions(first, last)
+        return slice(start, stop) if self.order is None else self.order[start:stop]
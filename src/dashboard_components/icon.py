@@ -1,45 +1,93 @@
 import sys
-import os
-import ast
-import re
-from typing import Dict, Optional
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Tuple
 from PySide6.QtWidgets import (
     QApplication, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QTextEdit,
     QPushButton, QWidget, QMessageBox, QComboBox
 )
-from PySide6.QtGui import QColor, QPixmap, QPainter, QFontMetrics
+from PySide6.QtGui import QColor, QImage, QPixmap, QPainter, QPalette, QFontMetrics, QGuiApplication
 from PySide6.QtSvg import QSvgRenderer
-from PySide6.QtCore import QByteArray
+from PySide6.QtCore import QByteArray, QObject, QRunnable, QThreadPool, QTimer, Signal
 from dashboard_components.style import StyleManager
+from dashboard_components.icon_store import IconStore, ReadOnlyIconStoreError, open_icon_store, svg_to_template
 from PySide6.QtCore import Qt
 
+if TYPE_CHECKING:
+    from dashboard_components.atlas import IconAtlas
+
+MASK_FILL = "#000000"  # Opaque fill used for the color-agnostic mask renders
+
+
+def fill_template(svg_template: str, fill: str, size: int = 16, class_name: str = "bi") -> str:
+    """Substitute the template placeholders with concrete values."""
+    return (svg_template
+            .replace("{width}", str(size))
+            .replace("{height}", str(size))
+            .replace("{fill}", fill)
+            .replace("{class_name}", class_name)
+            .replace("currentColor", fill))
+
+
+class _PrerenderTask(QRunnable):
+    """Rasterize every requested size and fill of one icon on a pool thread."""
+
+    def __init__(self, manager, icon_name: str, version: int, mask_svg: bytes, jobs: List[Tuple[tuple, int, str, float]]):
+        super().__init__()
+        self.manager = manager
+        self.icon_name = icon_name
+        self.version = version
+        self.mask_svg = mask_svg
+        self.jobs = jobs
+
+    def run(self):
+        # QSvgRenderer and QImage painting are safe off the GUI thread as long as nothing is shared
+        renderer = QSvgRenderer(QByteArray(self.mask_svg))
+        images = {key: SVGIconManager.rasterize(renderer, size, fill, dpr) for key, size, fill, dpr in self.jobs}
+        self.manager._store_prerendered(self.icon_name, self.version, images)
+
+
 class SVGIconManager:
-    def __init__(self, file_path: str = "icons.txt"):
+    def __init__(self, file_path: str = "icons.txt", cache_size: int = 256, store: Optional[IconStore] = None):
         self.file_path = file_path
         self.icon_fill = "#FFFFFF"  # Default dark mode color
+        self.store = store
         self.icons = self.load_icons()
 
-    def load_icons(self) -> Dict[str, str]:
-        """Load icons from the file."""
-        if not os.path.exists(self.file_path):
-            with open(self.file_path, "w", encoding="utf-8") as file:
-                file.write("{}")
-            return {}
-        with open(self.file_path, "r", encoding="utf-8") as file:
-            try:
-                data = file.read()
-                return ast.literal_eval(data)
-            except (SyntaxError, ValueError):
-                return {}
+        # Rendered pixmaps keyed by (icon name, size, fill, class, device pixel ratio), least recently used first
+        self.cache_size = cache_size
+        self._pixmap_cache: "OrderedDict[Tuple[str, int, str, str, float], QPixmap]" = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        # One parsed renderer per template; fill colors are applied by tinting the rendered mask
+        self._renderer_pool: Dict[str, QSvgRenderer] = {}
+
+        # Images rasterized ahead of time by prerender(); promoted to pixmaps on the GUI thread when first used
+        self._prerendered: Dict[Tuple[str, int, str, str, float], QImage] = {}
+        self._prerender_lock = threading.Lock()
+        self._template_versions: Dict[str, int] = {}
+        self._thread_pool: Optional[QThreadPool] = None
+
+        # The latest sprite sheet and its icon names per (size, fill, device pixel ratio), least recently used first;
+        # a sheet built for another list of names replaces the previous one instead of accumulating
+        self.atlas_cache_size = 4  # Both themes' fills, at the current and one previous device pixel ratio
+        self._atlas_cache: "OrderedDict[Tuple[int, str, float], Tuple[Tuple[str, ...], IconAtlas]]" = OrderedDict()
+
+    def load_icons(self) -> IconStore:
+        """Open the icon store; a legacy icons.txt dict is imported into a .jsonl store on first use."""
+        if self.store is None:
+            self.store = open_icon_store(self.file_path)
+        return self.store
 
     def save_icons(self) -> None:
-        """Save icons to the file."""
-        with open(self.file_path, "w", encoding="utf-8") as file:
-            file.write(str(self.icons))
+        """Flush the icon store; single-icon changes are already persisted."""
+        self.icons.flush()
 
     def add_icon(self, icon_name: str, svg_template: str) -> None:
         """Add a new icon to the manager."""
         self.icons[icon_name] = svg_template
+        self.invalidate_icon(icon_name)
         self.save_icons()
 
     def get_icon(self, icon_name: str) -> Optional[str]:
@@ -50,35 +98,210 @@ class SVGIconManager:
         """Delete an icon from the manager."""
         if icon_name in self.icons:
             del self.icons[icon_name]
+            self.invalidate_icon(icon_name)
             self.save_icons()
 
     def set_icon_fill(self, color: str) -> None:
         """Set the fill color for icons."""
         self.icon_fill = color
 
-    def render_icon(self, icon_name: str, size=16, class_name="bi") -> Optional[QPixmap]:
-        """Render an icon to a QPixmap."""
-        svg_template = self.get_icon(icon_name)
-        if not svg_template:
-            return None
-
-        svg_template = svg_template.replace("currentColor", self.icon_fill)
-        renderer = QSvgRenderer(QByteArray(svg_template.encode("utf-8")))
-        pixmap = QPixmap(size, size)
-        pixmap.fill(Qt.transparent)
-        painter = QPainter(pixmap)
+    def invalidate_icon(self, icon_name: str) -> None:
+        """Drop the parsed renderer and every cached pixmap of the given icon."""
+        self._renderer_pool.pop(icon_name, None)
+        for key in [key for key in self._pixmap_cache if key[0] == icon_name]:
+            del self._pixmap_cache[key]
+        for key in [key for key, (names, _) in self._atlas_cache.items() if icon_name in names]:
+            del self._atlas_cache[key]
+        with self._prerender_lock:
+            self._template_versions[icon_name] = self._template_versions.get(icon_name, 0) + 1
+            for key in [key for key in self._prerendered if key[0] == icon_name]:
+                del self._prerendered[key]
+
+    def clear_cache(self) -> None:
+        """Drop all cached pixmaps and atlases and reset the hit/miss counters."""
+        self._pixmap_cache.clear()
+        self._atlas_cache.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def cache_info(self) -> Dict[str, int]:
+        """Return the pixmap cache counters."""
+        return {
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "size": len(self._pixmap_cache),
+            "max_size": self.cache_size,
+            "prerendered": len(self._prerendered),
+        }
+
+    def prerender(self, names: Iterable[str], sizes: Iterable[int] = (16,), fills: Optional[Iterable[str]] = None,
+                  class_name: str = "bi") -> int:
+        """Rasterize icons on a worker thread pool so later render_icon calls only wrap a ready image.
+
+        Every combination of name, size and fill that is not cached yet is queued; fills default to
+        the current icon fill. Returns the number of images queued.
+        """
+        sizes = list(sizes)
+        fills = list(fills) if fills is not None else [self.icon_fill]
+        dpr = self._device_pixel_ratio()
+        if self._thread_pool is None:
+            self._thread_pool = QThreadPool()
+
+        queued = 0
+        for icon_name in dict.fromkeys(names):
+            svg_template = self.get_icon(icon_name)
+            if not svg_template:
+                continue
+            with self._prerender_lock:
+                jobs = [((icon_name, size, fill, class_name, dpr), size, fill, dpr)
+                        for size in sizes for fill in fills
+                        if (icon_name, size, fill, class_name, dpr) not in self._pixmap_cache
+                        and (icon_name, size, fill, class_name, dpr) not in self._prerendered]
+                version = self._template_versions.get(icon_name, 0)
+            if jobs:
+                # The template is read here because stores may not be shared across threads
+                mask_svg = fill_template(svg_template, MASK_FILL).encode("utf-8")
+                self._thread_pool.start(_PrerenderTask(self, icon_name, version, mask_svg, jobs))
+                queued += len(jobs)
+        return queued
+
+    def build_atlas(self, names: Iterable[str], size: int = 16, fill: Optional[str] = None) -> "IconAtlas":
+        """Return a sprite sheet holding the given icons at one size and fill (the current fill by default)."""
+        names = tuple(dict.fromkeys(names))
+        fill = fill or self.icon_fill
+        dpr = self._device_pixel_ratio()
+        key = (size, fill, dpr)
+        cached = self._atlas_cache.get(key)
+        if cached is not None and cached[0] == names:
+            self._atlas_cache.move_to_end(key)
+            return cached[1]
+        from dashboard_components.atlas import IconAtlas  # Only atlas-mode navigation panes need it
+        atlas = IconAtlas(self, names, size, fill, dpr)
+        self._atlas_cache[key] = (names, atlas)
+        self._atlas_cache.move_to_end(key)
+        while len(self._atlas_cache) > self.atlas_cache_size:
+            self._atlas_cache.popitem(last=False)
+        return atlas
+
+    def wait_for_prerender(self, msecs: int = -1) -> bool:
+        """Block until queued prerender work is done; returns False on timeout."""
+        return self._thread_pool is None or self._thread_pool.waitForDone(msecs)
+
+    def _store_prerendered(self, icon_name: str, version: int, images: Dict[tuple, QImage]) -> None:
+        with self._prerender_lock:
+            if self._template_versions.get(icon_name, 0) == version:
+                self._prerendered.update(images)
+
+    def _take_prerendered(self, key) -> Optional[QImage]:
+        with self._prerender_lock:
+            return self._prerendered.pop(key, None)
+
+    def get_renderer(self, icon_name: str) -> Optional[QSvgRenderer]:
+        """Return the pooled renderer for an icon, parsing its template on first use."""
+        renderer = self._renderer_pool.get(icon_name)
+        if renderer is None:
+            svg_template = self.get_icon(icon_name)
+            if not svg_template:
+                return None
+            renderer = QSvgRenderer(QByteArray(fill_template(svg_template, MASK_FILL).encode("utf-8")))
+            self._renderer_pool[icon_name] = renderer
+        return renderer
+
+    @staticmethod
+    def rasterize(renderer: QSvgRenderer, size: int, fill: str, dpr: float = 1.0) -> QImage:
+        """Paint the renderer's mask into an image and tint it with the fill color."""
+        image = QImage(round(size * dpr), round(size * dpr), QImage.Format_ARGB32_Premultiplied)
+        image.setDevicePixelRatio(dpr)
+        image.fill(Qt.transparent)
+        painter = QPainter(image)
         renderer.render(painter)
+        painter.setCompositionMode(QPainter.CompositionMode_SourceIn)
+        painter.fillRect(image.rect(), QColor(fill))
         painter.end()
+        return image
+
+    @classmethod
+    def rasterize_template(cls, svg_template: str, size: int, fill: str, dpr: float = 1.0) -> Optional[QImage]:
+        """Rasterize a template that is not in the store; safe to call from worker threads."""
+        renderer = QSvgRenderer(QByteArray(fill_template(svg_template, MASK_FILL).encode("utf-8")))
+        if not renderer.isValid():
+            return None
+        return cls.rasterize(renderer, size, fill, dpr)
+
+    @staticmethod
+    def _device_pixel_ratio() -> float:
+        app = QGuiApplication.instance()
+        return app.devicePixelRatio() if app is not None else 1.0
+
+    def render_icon(self, icon_name: str, size=16, class_name="bi") -> Optional[QPixmap]:
+        """Render an icon to a QPixmap, reusing a cached or prerendered image when possible."""
+        dpr = self._device_pixel_ratio()
+        key = (icon_name, size, self.icon_fill, class_name, dpr)
+        pixmap = self._pixmap_cache.get(key)
+        if pixmap is not None:
+            self._pixmap_cache.move_to_end(key)
+            self.cache_hits += 1
+            return pixmap
+
+        image = self._take_prerendered(key)
+        if image is not None:
+            self.cache_hits += 1
+        else:
+            renderer = self.get_renderer(icon_name)
+            if renderer is None:
+                return None
+            self.cache_misses += 1
+            image = self.rasterize(renderer, size, self.icon_fill, dpr)
+
+        pixmap = QPixmap.fromImage(image)
+        self._pixmap_cache[key] = pixmap
+        if len(self._pixmap_cache) > self.cache_size:
+            self._pixmap_cache.popitem(last=False)
         return pixmap
 
+class _TemplateSignals(QObject):
+    ready = Signal(int, str, QImage)
+
+
+class _TemplateTask(QRunnable):
+    """Convert a large SVG to a template and rasterize its preview on a pool thread."""
+
+    def __init__(self, generation: int, svg_code: str, size: int, fill: str, dpr: float, signals: _TemplateSignals):
+        super().__init__()
+        self.generation = generation
+        self.svg_code = svg_code
+        self.size = size
+        self.fill = fill
+        self.dpr = dpr
+        self.signals = signals
+
+    def run(self):
+        template = svg_to_template(self.svg_code)
+        image = SVGIconManager.rasterize_template(template, self.size, self.fill, self.dpr)
+        self.signals.ready.emit(self.generation, template, image if image is not None else QImage())
+
+
 class SVGTemplateGenerator(QWidget):
+    generate_delay_ms = 150  # Quiet period after the last keystroke before the template is regenerated
+    async_threshold = 32 * 1024  # SVG sources longer than this are converted off the GUI thread
+    preview_size = 16
+
     def __init__(self, icon_manager, style_manager, parent=None):
         super().__init__(parent)  # Pass the parent to the QWidget constructor
         self.icon_manager = icon_manager
         self.style_manager = style_manager
         self.setWindowTitle("SVG Template Generator")
+        self.setObjectName("svgTemplateGenerator")
         self.setGeometry(300, 300, 600, 600)
 
+        self._generation = 0  # Incremented per request so results of superseded background runs are dropped
+        self._template_signals = _TemplateSignals()  # Unparented: a running _TemplateTask keeps it alive past this page
+        self._template_signals.ready.connect(self._apply_generated_template)
+        self._generate_timer = QTimer(self)
+        self._generate_timer.setSingleShot(True)
+        self._generate_timer.setInterval(self.generate_delay_ms)
+        self._generate_timer.timeout.connect(self.generate_template)
+
         self.initUI()
         self.applyStyles()
 
@@ -121,10 +344,15 @@ class SVGTemplateGenerator(QWidget):
         main_layout.addWidget(self.svg_input)
 
         self.output_label = QLabel("Generated Template:")
+        self.preview_display = QLabel()
+        self.preview_display.setFixedSize(icon_button_height, icon_button_height)
         self.output_display = QTextEdit()
         self.output_display.setReadOnly(True)
 
-        main_layout.addWidget(self.output_label)
+        output_header_layout = QHBoxLayout()
+        output_header_layout.addWidget(self.output_label)
+        output_header_layout.addWidget(self.preview_display)
+        main_layout.addLayout(output_header_layout)
         main_layout.addWidget(self.output_display)
 
         button_layout = QHBoxLayout()
@@ -136,7 +364,7 @@ class SVGTemplateGenerator(QWidget):
         main_layout.addLayout(button_layout)
         self.setLayout(main_layout)
 
-        self.svg_input.textChanged.connect(self.generate_template)
+        self.svg_input.textChanged.connect(self._generate_timer.start)  # Debounced: restarts on every keystroke
         self.save_button.clicked.connect(self.add_icon_to_manager)
         self.delete_button.clicked.connect(self.delete_icon_from_manager)
         self.close_button.clicked.connect(self.close)
@@ -144,20 +372,41 @@ class SVGTemplateGenerator(QWidget):
 
     def applyStyles(self):
         """Apply styles using the style manager."""
-        self.setStyleSheet(self.style_manager.get_svg_template_generator_stylesheet())
+        if self.style_manager.styling_mode == "palette":
+            self.setAutoFillBackground(True)
+            self.setBackgroundRole(QPalette.Base)
+        self.style_manager.apply_stylesheet(self, self.style_manager.get_svg_template_generator_stylesheet)
 
     def generate_template(self):
-        icon_name = self.name_input.text().strip()
+        """Regenerate the template text and preview; large inputs are processed on a worker thread."""
+        self._generate_timer.stop()
+        self._generation += 1
         svg_code = self.svg_input.toPlainText().strip()
 
-        if not icon_name or not svg_code:
-            self.output_display.setPlainText("")
+        if not svg_code:
+            self._apply_generated_template(self._generation, "", QImage())
             return
 
-        template = re.sub(r'width="[^"]+"', 'width="{width}"', svg_code)
-        template = re.sub(r'height="[^"]+"', 'height="{height}"', template)
-        template = re.sub(r'fill="[^"]+"', 'fill="{fill}"', template)
-        template = re.sub(r'class="[^"]+"', 'class="{class_name}"', template)
+        if len(svg_code) > self.async_threshold:
+            QThreadPool.globalInstance().start(_TemplateTask(
+                self._generation, svg_code, self.preview_size, self.icon_manager.icon_fill,
+                self.icon_manager._device_pixel_ratio(), self._template_signals))
+            return
+
+        template = svg_to_template(svg_code)
+        preview = self.icon_manager.rasterize_template(template, self.preview_size, self.icon_manager.icon_fill,
+                                                       self.icon_manager._device_pixel_ratio())
+        self._apply_generated_template(self._generation, template, preview if preview is not None else QImage())
+
+    def _apply_generated_template(self, generation: int, template: str, preview: QImage):
+        if generation != self._generation:
+            return  # A newer edit superseded this result
+        icon_name = self.name_input.text().strip()
+        self.preview_display.setPixmap(QPixmap.fromImage(preview))
+
+        if not icon_name or not template:
+            self.output_display.setPlainText("")
+            return
 
         formatted_output = f'"{icon_name}": """\n{template}\n""",'
         self.output_display.setPlainText(formatted_output)
@@ -170,12 +419,13 @@ class SVGTemplateGenerator(QWidget):
             QMessageBox.warning(self, "Error", "Icon name and SVG code cannot be empty!")
             return
 
-        template = re.sub(r'width="[^"]+"', 'width="{width}"', svg_code)
-        template = re.sub(r'height="[^"]+"', 'height="{height}"', template)
-        template = re.sub(r'fill="[^"]+"', 'fill="{fill}"', template)
-        template = re.sub(r'class="[^"]+"', 'class="{class_name}"', template)
+        template = svg_to_template(svg_code)
 
-        self.icon_manager.add_icon(icon_name, template)
+        try:
+            self.icon_manager.add_icon(icon_name, template)
+        except ReadOnlyIconStoreError as error:
+            QMessageBox.warning(self, "Error", str(error))
+            return
         QMessageBox.information(self, "Success", f"Icon '{icon_name}' added/updated successfully!")
         self.output_display.setPlainText("")
 
@@ -195,7 +445,11 @@ class SVGTemplateGenerator(QWidget):
             QMessageBox.warning(self, "Error", f"Icon '{icon_name}' does not exist!")
             return
 
-        self.icon_manager.delete_icon(icon_name)
+        try:
+            self.icon_manager.delete_icon(icon_name)
+        except ReadOnlyIconStoreError as error:
+            QMessageBox.warning(self, "Error", str(error))
+            return
         QMessageBox.information(self, "Success", f"Icon '{icon_name}' deleted successfully!")
         self.refresh_icon_combobox()
 
@@ -208,6 +462,22 @@ class SVGTemplateGenerator(QWidget):
             pixmap = self.icon_manager.render_icon(icon_name, size=16)
             self.icon_display.setPixmap(pixmap)
 
+    def save_state(self):
+        """Capture the editor inputs so the page can be rebuilt after being unloaded."""
+        return {
+            "selected_icon": self.icon_combobox.currentText(),
+            "name": self.name_input.text(),
+            "svg": self.svg_input.toPlainText(),
+        }
+
+    def restore_state(self, state):
+        """Restore inputs captured by save_state."""
+        self.icon_combobox.blockSignals(True)
+        self.icon_combobox.setCurrentText(state["selected_icon"])
+        self.icon_combobox.blockSignals(False)
+        self.name_input.setText(state["name"])
+        self.svg_input.setPlainText(state["svg"])
+
     def refresh_icon_combobox(self):
         self.icon_combobox.clear()
         self.icon_combobox.addItems(self.icon_manager.icons.keys())
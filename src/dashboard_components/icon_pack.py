@@ -0,0 +1,149 @@
+"""Read-only, memory-mapped icon packs.
+
+Layout (little endian)::
+
+    header   8s magic, u32 icon count, u32 reserved
+    index    one (u64 name offset, u32 name length, u64 body offset, u32 body length)
+             record per icon, sorted by UTF-8 name
+    data     names and SVG template bodies
+
+Opening a pack maps the file and reads the 16-byte header only. Lookups binary-search the
+fixed-width index inside the mapping and slice out the requested body, so startup cost and
+resident memory do not grow with the number of icons in the pack.
+
+Build a pack from a legacy icons.txt, an icon store or a directory of .svg files::
+
+    python -m dashboard_components.icon_pack icons.svgpack icons.txt
+    python -m dashboard_components.icon_pack icons.svgpack path/to/bootstrap-icons/
+"""
+import argparse
+import mmap
+import os
+import struct
+from typing import Dict, Iterator, Optional
+
+from dashboard_components.icon_store import (
+    IconStore, ReadOnlyIconStoreError, STORE_TYPES, atomic_write, read_legacy_icons, svg_to_template
+)
+
+MAGIC = b"SVGPACK1"
+HEADER = struct.Struct("<8sII")
+INDEX_ENTRY = struct.Struct("<QIQI")
+
+
+def build_icon_pack(file_path: str, icons: Dict[str, str]) -> None:
+    """Write the given name -> template mapping as an icon pack."""
+    entries = sorted((name.encode("utf-8"), body.encode("utf-8")) for name, body in icons.items())
+    offset = HEADER.size + INDEX_ENTRY.size * len(entries)
+    index = bytearray()
+    data = bytearray()
+    for name, body in entries:
+        name_offset = offset + len(data)
+        data += name
+        body_offset = offset + len(data)
+        data += body
+        index += INDEX_ENTRY.pack(name_offset, len(name), body_offset, len(body))
+    atomic_write(file_path, HEADER.pack(MAGIC, len(entries), 0) + bytes(index) + bytes(data))
+
+
+def load_svg_directory(directory: str) -> Dict[str, str]:
+    """Read every .svg file in a directory as a template named after the file."""
+    icons = {}
+    for file_name in sorted(os.listdir(directory)):
+        name, extension = os.path.splitext(file_name)
+        if extension.lower() == ".svg":
+            with open(os.path.join(directory, file_name), "r", encoding="utf-8") as file:
+                icons[name] = svg_to_template(file.read().strip())
+    return icons
+
+
+class IconPackStore(IconStore):
+    """Read-only icon store over a memory-mapped icon pack."""
+
+    def __init__(self, file_path: str):
+        super().__init__(file_path)
+        self._file = open(file_path, "rb")
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self._count, _ = HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC:
+            self.close()
+            raise ValueError(f"{file_path} is not an icon pack")
+
+    def _entry(self, position: int):
+        return INDEX_ENTRY.unpack_from(self._map, HEADER.size + position * INDEX_ENTRY.size)
+
+    def _name_at(self, position: int) -> bytes:
+        name_offset, name_length, _, _ = self._entry(position)
+        return self._map[name_offset:name_offset + name_length]
+
+    def _find(self, icon_name) -> Optional[int]:
+        if not isinstance(icon_name, str):
+            return None
+        key = icon_name.encode("utf-8")
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if self._name_at(middle) < key:
+                low = middle + 1
+            else:
+                high = middle
+        return low if low < self._count and self._name_at(low) == key else None
+
+    def _names(self):
+        return self  # Membership, iteration and length are answered from the index below
+
+    def _read_body(self, icon_name: str) -> str:
+        _, _, body_offset, body_length = self._entry(self._find(icon_name))
+        return self._map[body_offset:body_offset + body_length].decode("utf-8")
+
+    def __contains__(self, icon_name) -> bool:
+        return self._find(icon_name) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        for position in range(self._count):
+            yield self._name_at(position).decode("utf-8")
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __setitem__(self, icon_name: str, svg_template: str) -> None:
+        raise ReadOnlyIconStoreError(f"icon pack {self.file_path} is read-only")
+
+    def __delitem__(self, icon_name: str) -> None:
+        raise ReadOnlyIconStoreError(f"icon pack {self.file_path} is read-only")
+
+    def close(self) -> None:
+        self._map.close()
+        self._file.close()
+
+
+def load_source(source: str) -> Dict[str, str]:
+    """Read icons from a directory of .svg files, an icon store or a legacy dict file."""
+    if os.path.isdir(source):
+        return load_svg_directory(source)
+    store_type = STORE_TYPES.get(os.path.splitext(source)[1].lower())
+    if store_type is not None:
+        store = store_type(source)
+        try:
+            return dict(store)
+        finally:
+            store.close()
+    return read_legacy_icons(source)
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Build a memory-mapped icon pack.")
+    parser.add_argument("output", help="path of the .svgpack file to write")
+    parser.add_argument("sources", nargs="+",
+                        help="icons.txt, a .jsonl/.db icon store or a directory of .svg files; later sources win")
+    args = parser.parse_args(argv)
+
+    icons: Dict[str, str] = {}
+    for source in args.sources:
+        icons.update(load_source(source))
+    build_icon_pack(args.output, icons)
+    print(f"Wrote {len(icons)} icons to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,284 @@
+import abc
+import ast
+import json
+import os
+import re
+import tempfile
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, Optional
+
+
+class ReadOnlyIconStoreError(TypeError):
+    """Raised when changing an icon store that cannot be written, such as an icon pack."""
+
+
+def atomic_write(path: str, data: bytes) -> None:
+    """Write data to a temporary file next to path, then rename it over path."""
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+_TEMPLATE_ATTRIBUTES = re.compile(r'(width|height|fill|class)="[^"]+"')
+_TEMPLATE_PLACEHOLDERS = {
+    "width": 'width="{width}"',
+    "height": 'height="{height}"',
+    "fill": 'fill="{fill}"',
+    "class": 'class="{class_name}"',
+}
+
+
+def svg_to_template(svg_code: str) -> str:
+    """Replace the size, fill and class attributes of an SVG with template placeholders in a single pass."""
+    return _TEMPLATE_ATTRIBUTES.sub(lambda match: _TEMPLATE_PLACEHOLDERS[match.group(1)], svg_code)
+
+
+def read_legacy_icons(file_path: str) -> Dict[str, str]:
+    """Read the legacy icons.txt format (a Python dict literal)."""
+    with open(file_path, "r", encoding="utf-8") as file:
+        try:
+            data = ast.literal_eval(file.read())
+        except (SyntaxError, ValueError):
+            return {}
+    return data if isinstance(data, dict) else {}
+
+
+class IconStore(MutableMapping, abc.ABC):
+    """Mapping of icon names to SVG templates backed by persistent storage.
+
+    Names are known as soon as the store is opened; template bodies are read on first access.
+    Assigning or deleting a key persists that single icon.
+    """
+
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self._bodies: Dict[str, str] = {}
+
+    @abc.abstractmethod
+    def _read_body(self, icon_name: str) -> str:
+        """Read the template of an icon known to be in the store."""
+
+    @abc.abstractmethod
+    def _names(self):
+        """Return a container of the icon names, supporting in, iteration and len()."""
+
+    def __getitem__(self, icon_name: str) -> str:
+        body = self._bodies.get(icon_name)
+        if body is None:
+            if icon_name not in self._names():
+                raise KeyError(icon_name)
+            body = self._bodies[icon_name] = self._read_body(icon_name)
+        return body
+
+    def __contains__(self, icon_name) -> bool:
+        return icon_name in self._names()
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._names()))
+
+    def __len__(self) -> int:
+        return len(self._names())
+
+    def flush(self) -> None:
+        """Persist pending changes; per-icon stores write on every change."""
+
+    def close(self) -> None:
+        """Release any file handles held by the store."""
+
+
+class LegacyDictStore(IconStore):
+    """The original icons.txt format, rewritten in full on every change."""
+
+    def __init__(self, file_path: str):
+        super().__init__(file_path)
+        self._bodies = read_legacy_icons(file_path) if os.path.exists(file_path) else {}
+
+    def _names(self):
+        return self._bodies
+
+    def _read_body(self, icon_name: str) -> str:
+        return self._bodies[icon_name]  # Every body is read when the file is opened
+
+    def __setitem__(self, icon_name: str, svg_template: str) -> None:
+        self._bodies[icon_name] = svg_template
+        self.flush()
+
+    def __delitem__(self, icon_name: str) -> None:
+        del self._bodies[icon_name]
+        self.flush()
+
+    def flush(self) -> None:
+        atomic_write(self.file_path, str(self._bodies).encode("utf-8"))
+
+
+class JsonLinesStore(IconStore):
+    """Append-only JSON-lines log of ``[name, template]`` records.
+
+    Upserts append one line and deletions append ``[name, null]``; the last record for a name wins.
+    Opening the store decodes only the names and remembers each record's byte offset, so template
+    bodies are parsed lazily. The log is compacted with an atomic rewrite once stale records
+    outnumber live ones.
+    """
+
+    compact_threshold = 64
+
+    def __init__(self, file_path: str):
+        super().__init__(file_path)
+        self._offsets: Dict[str, int] = {}
+        self._stale = 0
+        self._decoder = json.JSONDecoder()
+        if not os.path.exists(file_path):
+            atomic_write(file_path, b"")
+        self._scan()
+
+    @classmethod
+    def create(cls, file_path: str, icons: Dict[str, str]) -> "JsonLinesStore":
+        """Atomically write a fresh log holding the given icons and open it."""
+        atomic_write(file_path, cls._encode_records(icons.items()))
+        return cls(file_path)
+
+    @staticmethod
+    def _encode_records(records) -> bytes:
+        return "".join(json.dumps([name, body]) + "\n" for name, body in records).encode("utf-8")
+
+    def _scan(self) -> None:
+        self._offsets.clear()
+        self._stale = 0
+        with open(self.file_path, "rb") as file:
+            offset = 0
+            for raw_line in file:
+                line = raw_line.decode("utf-8")
+                if line.strip():
+                    # Decode only the name; the body after it stays unparsed until requested
+                    icon_name, end = self._decoder.raw_decode(line, line.index("[") + 1)
+                    if icon_name in self._offsets:
+                        self._stale += 1
+                    if line[end:].lstrip(", ").startswith("null"):
+                        self._offsets.pop(icon_name, None)
+                        self._stale += 1
+                    else:
+                        self._offsets[icon_name] = offset
+                offset += len(raw_line)
+
+    def _names(self):
+        return self._offsets
+
+    def _read_body(self, icon_name: str) -> str:
+        with open(self.file_path, "rb") as file:
+            file.seek(self._offsets[icon_name])
+            return json.loads(file.readline())[1]
+
+    def _append(self, icon_name: str, svg_template: Optional[str]) -> int:
+        with open(self.file_path, "ab") as file:
+            offset = file.tell()
+            file.write(self._encode_records([(icon_name, svg_template)]))
+        return offset
+
+    def __setitem__(self, icon_name: str, svg_template: str) -> None:
+        if icon_name in self._offsets:
+            self._stale += 1
+        self._offsets[icon_name] = self._append(icon_name, svg_template)
+        self._bodies[icon_name] = svg_template
+        self._maybe_compact()
+
+    def __delitem__(self, icon_name: str) -> None:
+        if icon_name not in self._offsets:
+            raise KeyError(icon_name)
+        self._append(icon_name, None)
+        del self._offsets[icon_name]
+        self._bodies.pop(icon_name, None)
+        self._stale += 2
+        self._maybe_compact()
+
+    def _maybe_compact(self) -> None:
+        if self._stale > max(self.compact_threshold, len(self._offsets)):
+            self.compact()
+
+    def compact(self) -> None:
+        """Rewrite the log with one record per live icon."""
+        atomic_write(self.file_path, self._encode_records((name, self[name]) for name in list(self._offsets)))
+        self._scan()
+
+
+class SQLiteStore(IconStore):
+    """SQLite table of icons with per-icon upserts."""
+
+    def __init__(self, file_path: str):
+        import sqlite3  # Only SQLite-backed stores pay for the import
+
+        super().__init__(file_path)
+        self._connection = sqlite3.connect(file_path)
+        self._connection.execute("CREATE TABLE IF NOT EXISTS icons (name TEXT PRIMARY KEY, svg TEXT NOT NULL)")
+        self._connection.commit()
+        self._name_set = {row[0] for row in self._connection.execute("SELECT name FROM icons")}
+
+    @classmethod
+    def create(cls, file_path: str, icons: Dict[str, str]) -> "SQLiteStore":
+        """Write the given icons into a new database and open it."""
+        store = cls(file_path)
+        with store._connection:
+            store._connection.executemany(
+                "INSERT OR REPLACE INTO icons (name, svg) VALUES (?, ?)", icons.items())
+        store._name_set.update(icons)
+        return store
+
+    def _names(self):
+        return self._name_set
+
+    def _read_body(self, icon_name: str) -> str:
+        return self._connection.execute("SELECT svg FROM icons WHERE name = ?", (icon_name,)).fetchone()[0]
+
+    def __setitem__(self, icon_name: str, svg_template: str) -> None:
+        with self._connection:
+            self._connection.execute("INSERT OR REPLACE INTO icons (name, svg) VALUES (?, ?)",
+                                     (icon_name, svg_template))
+        self._name_set.add(icon_name)
+        self._bodies[icon_name] = svg_template
+
+    def __delitem__(self, icon_name: str) -> None:
+        if icon_name not in self._name_set:
+            raise KeyError(icon_name)
+        with self._connection:
+            self._connection.execute("DELETE FROM icons WHERE name = ?", (icon_name,))
+        self._name_set.discard(icon_name)
+        self._bodies.pop(icon_name, None)
+
+    def close(self) -> None:
+        self._connection.close()
+
+
+STORE_TYPES = {
+    ".jsonl": JsonLinesStore,
+    ".db": SQLiteStore,
+    ".sqlite": SQLiteStore,
+    ".sqlite3": SQLiteStore,
+}
+
+
+def open_icon_store(file_path: str) -> IconStore:
+    """Open the store matching the file extension; ``.svgpack`` files open read-only.
+
+    Any other path is treated as a legacy dict file: it is imported once into a sibling ``.jsonl``
+    store, which is the source of truth from then on. The legacy file is left untouched.
+    """
+    root, extension = os.path.splitext(file_path)
+    if extension.lower() == ".svgpack":
+        from dashboard_components.icon_pack import IconPackStore
+        return IconPackStore(file_path)
+    store_type = STORE_TYPES.get(extension.lower())
+    if store_type is not None:
+        return store_type(file_path)
+
+    target = root + ".jsonl"
+    if not os.path.exists(target) and os.path.exists(file_path):
+        return JsonLinesStore.create(target, read_legacy_icons(file_path))
+    return JsonLinesStore(target)
@@ -0,0 +1,292 @@
+"""Chunked loading of CSV and Excel files into a ColumnarTableModel on a worker thread."""
+import csv
+import datetime
+import logging
+import os
+import re
+import threading
+from typing import Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+from .columnar_model import ColumnarTableModel
+from .table_cache import Fingerprint, TableCache
+
+logger = logging.getLogger(__name__)
+SUPPORTED_SUFFIXES = (".csv", ".xlsx")
+# Cells int() or float() would accept but change: IDs and ZIP codes with leading zeros, "1_000", "nan", "inf"
+_NOT_A_NUMBER = re.compile(r"\s*[+-]?(0\d|nan|inf)|.*_", re.IGNORECASE)
+
+
+def typed_column(values: List[str]) -> np.ndarray:
+    """Convert the text of one column of a chunk to int64, float64, datetime64 or, failing those, object.
+
+    Empty cells are NaN in float columns and NaT in date columns; an integer column with empty
+    cells becomes a float column. Cells whose text a number would not reproduce, such as "007",
+    keep the column as text, so each chunk decides the same way whatever the other chunks hold.
+    """
+    # Parsed with Python's int() and float() rather than NumPy's string casts: those are slower and
+    # hold the GIL for the whole column, stalling the GUI thread while a chunk converts
+    has_empty = "" in values
+    if has_empty and values.count("") == len(values):
+        return np.array(values, dtype=object)
+    if any(_NOT_A_NUMBER.match(value) for value in values):
+        return np.array(values, dtype=object)  # NumPy would read "007" as a year as well
+    if not has_empty:
+        try:
+            return np.array([int(value) for value in values], dtype=np.int64)
+        except (ValueError, OverflowError):
+            pass
+    try:
+        return np.array([float(value) if value else np.nan for value in values], dtype=np.float64)
+    except ValueError:
+        pass
+    try:
+        dates = np.array([value or "NaT" for value in values], dtype="datetime64[s]")
+    except ValueError:
+        return np.array(values, dtype=object)
+    days = dates.astype("datetime64[D]")
+    present = ~np.isnat(dates)
+    return days if (days[present] == dates[present]).all() else dates
+
+
+def typed_columns(rows: List[list], width: int) -> List[np.ndarray]:
+    """Transpose a chunk of text rows into typed columns; short rows are padded with empty cells.
+
+    Columns are gathered with comprehensions rather than zip(*rows), a single C call that would
+    hold the GIL for the whole chunk.
+    """
+    if not rows:
+        return [np.empty(0, dtype=object) for _ in range(width)]
+    if any(len(row) < width for row in rows):
+        rows = [row + [""] * (width - len(row)) if len(row) < width else row for row in rows]
+    return [typed_column([row[position] for row in rows]) for position in range(width)]
+
+
+def column_names(header: Sequence[str]) -> List[str]:
+    return [name.strip() or f"Column {position}" for position, name in enumerate(header, start=1)]
+
+
+def read_csv_chunks(path: str, chunk_rows: int) -> Iterator[Tuple[List[list], float]]:
+    """Yield (rows, fraction of the file read) with up to chunk_rows rows of text each."""
+    size = os.path.getsize(path) or 1
+    with open(path, newline="", encoding="utf-8-sig") as file:
+        reader = csv.reader(file)
+        rows = []
+        for row in reader:
+            rows.append(row)
+            if len(rows) == chunk_rows:
+                yield rows, min(file.buffer.tell() / size, 1.0)  # Ahead by the read buffer at most
+                rows = []
+        yield rows, 1.0
+
+
+def _cell_text(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    return str(value)
+
+
+def read_xlsx_chunks(path: str, chunk_rows: int) -> Iterator[Tuple[List[list], float]]:
+    """Yield (rows, fraction of the rows read) from the active sheet, streamed with openpyxl's read-only mode."""
+    try:
+        import openpyxl
+    except ImportError as error:
+        raise ImportError("Reading .xlsx files needs openpyxl: pip install openpyxl") from error
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheet = workbook.active
+        total = sheet.max_row or 0  # Unknown when the file has no dimension record
+        rows, read = [], 0
+        for values in sheet.iter_rows(values_only=True):
+            rows.append([_cell_text(value) for value in values])
+            read += 1
+            if len(rows) == chunk_rows:
+                yield rows, min(read / total, 1.0) if total else 0.0
+                rows = []
+        yield rows, 1.0
+    finally:
+        workbook.close()
+
+
+def read_table_chunks(path: str, chunk_rows: int) -> Iterator[Tuple[List[list], float]]:
+    suffix = os.path.splitext(path)[1].lower()
+    if suffix == ".csv":
+        return read_csv_chunks(path, chunk_rows)
+    if suffix == ".xlsx":
+        return read_xlsx_chunks(path, chunk_rows)
+    raise ValueError(f"Unsupported file type {suffix!r}; expected one of {', '.join(SUPPORTED_SUFFIXES)}")
+
+
+class _IngestSignals(QObject):
+    chunkReady = Signal(int, object, object)  # Generation, column names, typed columns
+    progress = Signal(int, float)
+    finished = Signal(int, bool, object)  # Generation, whether the load was cancelled, Fingerprint to cache it under
+    failed = Signal(int, str)
+    stored = Signal()
+
+
+class _IngestTask(QRunnable):
+    """Read, convert and hand over one file chunk by chunk on a pool thread.
+
+    A chunk is only converted once the GUI thread has taken all but max_pending of the earlier ones,
+    so at most that many converted chunks plus the one being read are held at a time.
+    """
+
+    def __init__(self, generation: int, path: str, chunk_rows: int, signals: _IngestSignals,
+                 slots: threading.Semaphore, cancelled: threading.Event, cache: Optional[TableCache] = None):
+        super().__init__()
+        self.generation = generation
+        self.path = path
+        self.chunk_rows = chunk_rows
+        self.signals = signals
+        self.slots = slots
+        self.cancelled = cancelled
+        self.cache = cache
+
+    def run(self):
+        chunks = None
+        try:
+            fingerprint = None
+            if self.cache is not None:
+                fingerprint, table = self.cache.find(self.path)
+                if table is not None:  # Memory-mapped; nothing is read until the view asks for it
+                    self.slots.acquire()
+                    self.signals.chunkReady.emit(self.generation, *table)
+                    self.signals.progress.emit(self.generation, 1.0)
+                    self.signals.finished.emit(self.generation, False, None)
+                    return
+            chunks = read_table_chunks(self.path, self.chunk_rows)
+            names = None
+            for rows, progress in chunks:
+                if names is None:
+                    names = column_names(rows.pop(0) if rows else [])
+                elif not rows:
+                    continue
+                while not self.slots.acquire(timeout=0.05):
+                    if self.cancelled.is_set():
+                        break
+                if self.cancelled.is_set():
+                    break
+                columns = typed_columns(rows, len(names))
+                del rows
+                self.signals.chunkReady.emit(self.generation, names, columns)
+                self.signals.progress.emit(self.generation, progress)
+            self.signals.finished.emit(self.generation, self.cancelled.is_set(), fingerprint)
+        except Exception as error:  # Reported to the GUI instead of being lost on the pool thread
+            self.signals.failed.emit(self.generation, f"{type(error).__name__}: {error}")
+        finally:
+            if chunks is not None:
+                chunks.close()  # Closes the file when the loop stopped early
+
+
+class _CacheStoreTask(QRunnable):
+    """Write a completely loaded table to the cache on a pool thread."""
+
+    def __init__(self, cache: TableCache, fingerprint: Fingerprint, names: List[str], columns: List[np.ndarray],
+                 signals: _IngestSignals):
+        super().__init__()
+        self.cache = cache
+        self.fingerprint = fingerprint
+        self.names = names
+        self.columns = columns
+        self.signals = signals
+
+    def run(self):
+        try:
+            self.cache.store(self.fingerprint, self.names, self.columns)
+        except (OSError, MemoryError, ValueError) as error:  # The table is loaded either way; only the next open is slower
+            logger.warning("Could not cache %s: %s", self.fingerprint.source, error)
+        self.signals.stored.emit()
+
+
+class TableIngestor(QObject):
+    """Loads .csv and .xlsx files into a ColumnarTableModel without blocking the GUI thread.
+
+    The first chunk replaces the model's data; each later chunk is appended as one row insertion.
+    With a cache, a file loaded before is mapped from it instead, and a completely loaded file is
+    written to it in the background.
+    """
+    started = Signal(str)
+    progress = Signal(float)
+    finished = Signal(int, bool)  # Rows loaded, whether the load was cancelled
+    failed = Signal(str)
+    cacheUpdated = Signal()  # The cache's counters or size changed
+
+    def __init__(self, model: ColumnarTableModel, parent=None, chunk_rows: int = 50_000, max_pending: int = 2,
+                 cache: Optional[TableCache] = None):
+        super().__init__(parent)
+        self.model = model
+        self.cache = cache
+        self.chunk_rows = chunk_rows
+        self.max_pending = max_pending
+        self._generation = 0  # Incremented per load so chunks of a superseded load are dropped
+        self._slots: Optional[threading.Semaphore] = None
+        self._cancelled = threading.Event()
+        self._signals: Optional[_IngestSignals] = None
+        self._first_chunk = False
+        self._running = False
+        self._thread_pool: Optional[QThreadPool] = None
+
+    def load(self, path: str, thread_pool: Optional[QThreadPool] = None) -> None:
+        """Start loading path, cancelling a load still in progress."""
+        self.cancel()
+        self._generation += 1
+        self._cancelled = threading.Event()
+        self._slots = threading.Semaphore(self.max_pending)
+        # Not a child of this object: the task keeps it alive, so a worker outliving the page never emits
+        # through a deleted QObject
+        self._signals = _IngestSignals()
+        self._signals.chunkReady.connect(self._onChunkReady)
+        self._signals.progress.connect(self._onProgress)
+        self._signals.finished.connect(self._onFinished)
+        self._signals.failed.connect(self._onFailed)
+        self._signals.stored.connect(self.cacheUpdated)
+        self._first_chunk = True
+        self._running = True
+        self.started.emit(path)
+        (thread_pool or QThreadPool.globalInstance()).start(_IngestTask(
+            self._generation, path, self.chunk_rows, self._signals, self._slots, self._cancelled, self.cache))
+        self._thread_pool = thread_pool
+
+    def cancel(self) -> None:
+        """Stop the current load after the chunk being read; rows already appended stay in the model."""
+        self._cancelled.set()
+
+    def isRunning(self) -> bool:
+        return self._running
+
+    def _onChunkReady(self, generation: int, names: list, columns: list):
+        if generation != self._generation:
+            return
+        if self._first_chunk:
+            self._first_chunk = False
+            self.model.setColumns(names, columns)
+        elif not self._cancelled.is_set():
+            self.model.appendRows(columns)
+        self._slots.release()
+
+    def _onProgress(self, generation: int, fraction: float):
+        if generation == self._generation:
+            self.progress.emit(fraction)
+
+    def _onFinished(self, generation: int, cancelled: bool, fingerprint: Optional[Fingerprint]):
+        if generation != self._generation:
+            return
+        self._running = False
+        if self.cache is not None:
+            if fingerprint is not None and not cancelled:
+                # The columns are not modified again: the next load replaces them rather than appending
+                columns = [self.model.columnData(column) for column in range(self.model.columnCount())]
+                (self._thread_pool or QThreadPool.globalInstance()).start(_CacheStoreTask(
+                    self.cache, fingerprint, self.model.columnNames(), columns, self._signals))
+            self.cacheUpdated.emit()
+        self.finished.emit(self.model.rowCount(), cancelled)
+
+    def _onFailed(self, generation: int, message: str):
+        if generation == self._generation:
+            self._running = False
+            self.failed.emit(message)
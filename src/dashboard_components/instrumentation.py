@@ -0,0 +1,215 @@
+"""Opt-in instrumentation of the GUI thread: event dispatch times, a stall watchdog, paint counts and handler timings."""
+import functools
+import logging
+import sys
+import threading
+import time
+import traceback
+from collections import Counter, deque
+from typing import Dict, List, Optional, Tuple
+
+from PySide6.QtCore import QEvent, QObject, QTimer, Signal
+from PySide6.QtWidgets import QApplication, QLabel, QWidget
+
+logger = logging.getLogger(__name__)
+
+
+class TimingStats:
+    """Count, total, worst and most recent duration of one kind of work, in seconds."""
+    __slots__ = ("count", "total", "max", "last")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+        self.last = 0.0
+
+    def add(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        self.last = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+
+class Instrumentation(QObject):
+    """Measures what keeps the GUI thread busy.
+
+    - Dispatch time per event type, recorded by InstrumentedApplication.notify. An application event
+      filter only runs before an event is delivered, so it cannot see how long delivery took.
+    - Paint counts per widget, from an application event filter.
+    - Handler timings of methods replaced through wrap().
+    - A watchdog thread that logs the GUI thread's Python stack when the event loop has not run
+      for longer than stall_threshold_ms. It needs the GIL, so a stall inside a long C++ call is
+      reported when that call returns to Python.
+    """
+    stallDetected = Signal(float, str)  # Seconds stalled so far and the GUI thread's stack, from the watchdog thread
+
+    def __init__(self, stall_threshold_ms: int = 200, heartbeat_ms: int = 50, parent=None):
+        super().__init__(parent)
+        self.stall_threshold = stall_threshold_ms / 1000
+        self.dispatch_stats: Dict[str, TimingStats] = {}
+        self.handler_stats: Dict[str, TimingStats] = {}
+        self.paint_counts: Counter = Counter()
+        self.frame_times = deque(maxlen=120)  # Seconds spent in each repaint pass of a top-level window
+        self.stalls = deque(maxlen=20)  # [seconds, stack] of the latest stalls; seconds grow until the loop resumes
+        self._app = None
+        self._gui_thread_id = None
+        self._last_beat = time.perf_counter()
+        self._stall_reported = False
+        self._stop = threading.Event()
+        self._watchdog = None
+        self._heartbeat = QTimer(self)
+        self._heartbeat.setInterval(heartbeat_ms)
+        self._heartbeat.timeout.connect(self._beat)
+
+    def install(self, app: Optional[QApplication] = None) -> None:
+        """Start measuring; call from the GUI thread."""
+        self._app = app or QApplication.instance()
+        self._app.installEventFilter(self)
+        if isinstance(self._app, InstrumentedApplication):
+            self._app.instrumentation = self
+        self._gui_thread_id = threading.get_ident()
+        self._last_beat = time.perf_counter()
+        self._heartbeat.start()
+        self._stop.clear()
+        self._watchdog = threading.Thread(target=self._watch, name="gui-watchdog", daemon=True)
+        self._watchdog.start()
+
+    def uninstall(self) -> None:
+        """Stop measuring; the collected numbers are kept."""
+        if self._app is None:
+            return
+        self._app.removeEventFilter(self)
+        if isinstance(self._app, InstrumentedApplication) and self._app.instrumentation is self:
+            self._app.instrumentation = None
+        self._heartbeat.stop()
+        self._stop.set()
+        self._watchdog.join()
+        self._app = None
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Paint and isinstance(obj, QWidget):
+            self.paint_counts[widget_label(obj)] += 1
+        return False
+
+    def record_dispatch(self, receiver, event_type, seconds: float) -> None:
+        """Account one delivered event; called by InstrumentedApplication.notify."""
+        name = getattr(event_type, "name", None) or f"Event{int(event_type)}"
+        stats = self.dispatch_stats.get(name)
+        if stats is None:
+            stats = self.dispatch_stats[name] = TimingStats()
+        stats.add(seconds)
+        if event_type == QEvent.UpdateRequest and isinstance(receiver, QWidget) and receiver.isWindow():
+            self.frame_times.append(seconds)
+
+    def wrap(self, owner, name: str, label: Optional[str] = None):
+        """Replace owner.name with a wrapper recording its duration under label.
+
+        Only lookups made after the call see the wrapper; signals connected to the original bound
+        method keep calling it directly.
+        """
+        method = getattr(owner, name)
+        label = label or f"{type(owner).__name__}.{name}"
+        stats = self.handler_stats.setdefault(label, TimingStats())
+
+        @functools.wraps(method)
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                stats.add(time.perf_counter() - start)
+
+        setattr(owner, name, timed)
+        return timed
+
+    def slowest_handlers(self, count: int = 3) -> List[Tuple[str, float]]:
+        """Return (label, worst seconds) of the slowest wrapped handlers."""
+        measured = [(label, stats.max) for label, stats in self.handler_stats.items() if stats.count]
+        return sorted(measured, key=lambda item: item[1], reverse=True)[:count]
+
+    def slowest_events(self, count: int = 3) -> List[Tuple[str, float]]:
+        """Return (event type, worst seconds) of the slowest event types."""
+        measured = [(name, stats.max) for name, stats in self.dispatch_stats.items()]
+        return sorted(measured, key=lambda item: item[1], reverse=True)[:count]
+
+    def _beat(self):
+        now = time.perf_counter()
+        gap = now - self._last_beat
+        self._last_beat = now
+        if self._stall_reported:
+            self._stall_reported = False
+            if self.stalls:
+                self.stalls[-1][0] = gap  # The stall's full length is known once the loop runs again
+
+    def _watch(self):
+        interval = self._heartbeat.interval() / 1000
+        while not self._stop.wait(interval):
+            lag = time.perf_counter() - self._last_beat - interval
+            if lag < self.stall_threshold or self._stall_reported:
+                continue
+            frame = sys._current_frames().get(self._gui_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame is not None else "(no Python frames)\n"
+            self._stall_reported = True
+            self.stalls.append([lag, stack])
+            logger.warning("GUI thread stalled for %.0f ms in:\n%s", lag * 1000, stack)
+            self.stallDetected.emit(lag, stack)
+
+
+class InstrumentedApplication(QApplication):
+    """QApplication that times every delivered event when an Instrumentation is attached."""
+    instrumentation: Optional[Instrumentation] = None
+
+    def notify(self, receiver, event):
+        instrumentation = self.instrumentation
+        if instrumentation is None:
+            return super().notify(receiver, event)
+        event_type = event.type()
+        start = time.perf_counter()
+        try:
+            return super().notify(receiver, event)
+        finally:
+            instrumentation.record_dispatch(receiver, event_type, time.perf_counter() - start)
+
+
+class InstrumentationOverlay(QLabel):
+    """One-line readout of the latest frame time, stall count and slowest handlers, refreshed while visible."""
+
+    def __init__(self, instrumentation: Instrumentation, parent=None, refresh_ms: int = 500):
+        super().__init__(parent)
+        self.instrumentation = instrumentation
+        self.setObjectName("instrumentationOverlay")
+        self._timer = QTimer(self)
+        self._timer.setInterval(refresh_ms)
+        self._timer.timeout.connect(self.refresh)
+
+    def toggle(self):
+        self.setVisible(not self.isVisible())
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        self.refresh()
+        self._timer.start()
+
+    def hideEvent(self, event):
+        super().hideEvent(event)
+        self._timer.stop()
+
+    def refresh(self):
+        instrumentation = self.instrumentation
+        frames = list(instrumentation.frame_times)[-30:]
+        frame_text = f"frame {max(frames) * 1000:.1f} ms" if frames else "frame n/a"
+        handlers = ", ".join(f"{label} {seconds * 1000:.1f} ms"
+                             for label, seconds in instrumentation.slowest_handlers())
+        self.setText(f"{frame_text}  |  stalls {len(instrumentation.stalls)}  |  {handlers or 'no handlers timed'}  ")
+
+
+def widget_label(widget: QWidget) -> str:
+    """Name a widget by class and object name for the paint counts."""
+    name = widget.objectName()
+    return f"{type(widget).__name__}#{name}" if name else type(widget).__name__
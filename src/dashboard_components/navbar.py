@@ -1,20 +1,68 @@
-from PySide6.QtWidgets import QWidget, QVBoxLayout, QListWidget, QListWidgetItem, QStackedWidget, QPushButton, QSizePolicy, QSplitter
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QIcon
+from PySide6.QtWidgets import QWidget, QVBoxLayout, QLineEdit, QListView, QAbstractItemView, QStackedWidget, QPushButton, QSizePolicy, QSplitter
+import time
+from collections import OrderedDict
+from PySide6.QtCore import Qt, QEasingCurve, QTimer, QVariantAnimation, Signal
+from PySide6.QtGui import QIcon, QPalette
 from .icon import SVGIconManager
+from .navigation_model import NavigationItemDelegate, NavigationListModel, PageIndexRole
+from .navigation_search import NavigationSearchIndex
+from .throttle import FrameCoalescer, frame_interval
 
 class CustomNavigationContentWidget(QWidget):
+    """Navigation pane plus content stack.
+
+    Pages added as factories have a lifecycle: they are built on first display and, once more than
+    max_resident_pages of them are alive or their estimated memory exceeds memory_budget bytes, the
+    least recently shown hidden page is destroyed and rebuilt when selected again. Pages may define
+    save_state() -> object and restore_state(state) to carry their state across that round trip, and
+    estimate_memory() -> int to override the default widget-count estimate.
+
+    With animated_collapse the sidebar width is animated instead of jumping; see animateSidebar.
+    """
+    pageUnloaded = Signal(QWidget)  # Emitted with a page widget right before it is destroyed
+    widget_memory_estimate = 4096  # Bytes assumed per widget when a page has no estimate_memory()
+
     def __init__(self, style_manager, icon_manager, parent=None, button_size=35, expanded_width=100, collapsed_width=35,
-                 item_height=30, padding=0):
+                 item_height=30, padding=0, atlas_mode=False, prewarm_pages=False, prewarm_delay_ms=250,
+                 max_resident_pages=None, memory_budget=None, animated_collapse=False, collapse_duration_ms=180):
         super().__init__(parent)
         self.style_manager = style_manager
         self.icon_manager = icon_manager
+        self.setObjectName("navigationContent")
         self.button_size = button_size
         self.expanded_width = expanded_width
         self.collapsed_width = collapsed_width
         self.item_height = item_height
         self.padding = padding
+        self.atlas_mode = atlas_mode  # Draw navigation item icons from one shared sprite sheet
         self.sidebar_expanded = True  # Start with the sidebar expanded
+        self.animated_collapse = animated_collapse
+        self._sidebar_animation = QVariantAnimation(self)
+        self._sidebar_animation.setDuration(collapse_duration_ms)
+        self._sidebar_animation.setEasingCurve(QEasingCurve.OutCubic)
+        self._sidebar_animation.valueChanged.connect(self._onSidebarFrame)
+        self._sidebar_animation.finished.connect(self._onSidebarAnimationFinished)
+        self._sidebar_width = expanded_width
+        self._suspended_page = None  # Page whose layout is off while the sidebar animates
+        self._sidebar_frames = FrameCoalescer(self.setSidebarWidth, parent=self)
+        self._last_tick_time = None
+        self._frame_intervals = []  # Seconds between the animation ticks of the last sidebar animation
+        self._atlas = None
+        self.search_index = NavigationSearchIndex()  # Page titles and icon names, keyed by page index
+
+        # Pages added as factories are built the first time they are shown; until then a placeholder holds their index
+        self.page_factories = {}
+        self._resident_pages = OrderedDict()  # Built factory pages, least recently shown first
+        self._page_states = {}
+        self.max_resident_pages = max_resident_pages
+        self.memory_budget = memory_budget
+        self.page_builds = 0
+        self.page_evictions = 0
+        self.prewarm_pages = prewarm_pages  # Build the next page while the event loop is idle
+        self._prewarm_timer = QTimer(self)
+        self._prewarm_timer.setSingleShot(True)
+        self._prewarm_timer.setInterval(prewarm_delay_ms)
+        self._prewarm_timer.timeout.connect(self.prewarmNextPage)
         self.initUI()
 
     def initUI(self):
@@ -38,14 +86,24 @@ class CustomNavigationContentWidget(QWidget):
         self.menuButton.clicked.connect(self.toggle_sidebar)
         navigation_layout.addWidget(self.menuButton)
 
-        self.nav_list_top = QListWidget(self)
-        self.nav_list_top.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.nav_list_top.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        # Search box filtering both lists through the search index
+        self.searchBox = QLineEdit(self)
+        self.searchBox.setObjectName("navigationSearch")
+        self.searchBox.setPlaceholderText("Search")
+        self.searchBox.setClearButtonEnabled(True)
+        self.searchBox.textChanged.connect(self.filterNavigation)
+        self.searchBox.returnPressed.connect(self.openFirstSearchResult)
+        navigation_layout.addWidget(self.searchBox)
+
+        # Both lists share one delegate, which hides the text while the sidebar is collapsed
+        self.nav_delegate = NavigationItemDelegate(self)
+        self.nav_model_top = NavigationListModel(self.navigationIcon, self)
+        self.nav_model_bottom = NavigationListModel(self.navigationIcon, self)
+
+        self.nav_list_top = self.createNavigationList(self.nav_model_top)
         navigation_layout.addWidget(self.nav_list_top)
 
-        self.nav_list_bottom = QListWidget(self)
-        self.nav_list_bottom.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
-        self.nav_list_bottom.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        self.nav_list_bottom = self.createNavigationList(self.nav_model_bottom)
         self.nav_list_bottom.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
         navigation_layout.addWidget(self.nav_list_bottom)
 
@@ -68,8 +126,8 @@ class CustomNavigationContentWidget(QWidget):
         # Set initial sizes for the splitter
         self.splitter.setSizes([self.expanded_width, self.width() - self.expanded_width])
 
-        self.nav_list_top.itemClicked.connect(self.handleTopItemClick)
-        self.nav_list_bottom.itemClicked.connect(self.handleBottomItemClick)
+        self.nav_list_top.clicked.connect(self.handleTopItemClick)
+        self.nav_list_bottom.clicked.connect(self.handleBottomItemClick)
 
         self.applyStyles()
 
@@ -79,88 +137,315 @@ class CustomNavigationContentWidget(QWidget):
         self.toggleButton.setIcon(QIcon(
             self.icon_manager.render_icon("Toggle-off" if self.style_manager.current_mode == "bright" else "Toggle-on")))
 
-        for i in range(self.nav_list_top.count()):
-            item = self.nav_list_top.item(i)
-            icon_name = item.data(Qt.UserRole + 2)  # Retrieve the stored icon name
-            if icon_name:  # Ensure the icon name is not None
-                item.setIcon(QIcon(self.icon_manager.render_icon(icon_name)))
+        self._atlas = None
+        self.nav_model_top.refreshIcons()
+        self.nav_model_bottom.refreshIcons()
+
+    def createNavigationList(self, model):
+        """Create a list view over a navigation model."""
+        nav_list = QListView(self)
+        nav_list.setModel(model)
+        nav_list.setItemDelegate(self.nav_delegate)
+        nav_list.setUniformItemSizes(True)
+        nav_list.setEditTriggers(QAbstractItemView.NoEditTriggers)
+        nav_list.setVerticalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        nav_list.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOff)
+        return nav_list
+
+    def navigationIcon(self, icon_name):
+        """Icon provider of the navigation models, called only for rows that are painted."""
+        if self.atlas_mode:
+            # One rasterization pass for every item; each icon references a cell of the sheet
+            if self._atlas is None:
+                self._atlas = self.icon_manager.build_atlas(self.item_icon_names())
+            return self._atlas.icon(icon_name)
+        return QIcon(self.icon_manager.render_icon(icon_name))
+
+    def item_icon_names(self):
+        """Return the icon names of the navigation items."""
+        return [item.icon_name for model in (self.nav_model_top, self.nav_model_bottom)
+                for item in model.items() if item.icon_name]
+
+    def icon_names(self):
+        """Return the names of every icon shown by the navigation pane."""
+        return ["Menu", "Toggle-on", "Toggle-off"] + self.item_icon_names()
 
-        for i in range(self.nav_list_bottom.count()):
-            item = self.nav_list_bottom.item(i)
-            icon_name = item.data(Qt.UserRole + 2)  # Retrieve the stored icon name
-            if icon_name:  # Ensure the icon name is not None
-                item.setIcon(QIcon(self.icon_manager.render_icon(icon_name)))
+    def prerender_icons(self, fills):
+        """Rasterize the navigation icons for the given fills in the background."""
+        self.icon_manager.prerender(self.icon_names(), sizes=[16], fills=fills)
 
-    def handleTopItemClick(self, item):
+    def handleTopItemClick(self, index):
         """Handle item click events for the top list."""
         # Clear selection in the bottom list
         self.nav_list_bottom.clearSelection()
         # Highlight only the clicked item
-        self.nav_list_top.setCurrentItem(item)
-        page_index = self.nav_list_top.row(item)
-        self.switchToPage(page_index)
+        self.nav_list_top.setCurrentIndex(index)
+        self.switchToPage(index.data(PageIndexRole))
 
-    def handleBottomItemClick(self, item):
+    def handleBottomItemClick(self, index):
         """Handle item click events for the bottom list."""
         # Clear selection in the top list
         self.nav_list_top.clearSelection()
         # Highlight only the clicked item
-        self.nav_list_bottom.setCurrentItem(item)
-        page_index = item.data(Qt.UserRole)
-        if isinstance(page_index, int):  # Ensure the page index is an integer
-            self.switchToPage(page_index)
+        self.nav_list_bottom.setCurrentIndex(index)
+        self.switchToPage(index.data(PageIndexRole))
+
+    def filterNavigation(self, text):
+        """Show only the navigation items whose title or icon name matches text."""
+        page_indexes = self.search_index.search(text) if text.strip() else None
+        self.nav_model_top.setVisiblePages(page_indexes)
+        self.nav_model_bottom.setVisiblePages(page_indexes)
+        self.adjustBottomListHeight()
+
+    def openFirstSearchResult(self):
+        """Switch to the first page left by the current search."""
+        if self.nav_model_top.rowCount():
+            self.handleTopItemClick(self.nav_model_top.index(0))
+        elif self.nav_model_bottom.rowCount():
+            self.handleBottomItemClick(self.nav_model_bottom.index(0))
 
     def applyStyles(self):
         """Apply styles using the style manager."""
-        self.setStyleSheet(self.style_manager.get_navigation_stylesheet())
+        if self.style_manager.styling_mode == "palette":
+            self.applyPaletteRoles()
+        self.style_manager.apply_stylesheet(self, self.style_manager.get_navigation_stylesheet)
+
+    def applyPaletteRoles(self):
+        """Map the navigation and content backgrounds to palette roles for palette-driven theming."""
+        self.navigation_widget.setAutoFillBackground(True)
+        self.navigation_widget.setBackgroundRole(QPalette.AlternateBase)
+        for nav_list in (self.nav_list_top, self.nav_list_bottom):
+            nav_list.viewport().setBackgroundRole(QPalette.AlternateBase)
+        self.contentStack.setAutoFillBackground(True)
+        self.contentStack.setBackgroundRole(QPalette.Base)
 
     def toggle_sidebar(self):
         """Toggle the visibility of the sidebar."""
         self.sidebar_expanded = not self.sidebar_expanded
         width = self.expanded_width if self.sidebar_expanded else self.collapsed_width
 
+        if self.animated_collapse and self.isVisible():
+            self.animateSidebar(width)
+            return
+        self.setSidebarWidth(width)
+        self._applySidebarState()
+
+    def setSidebarWidth(self, width):
+        """Resize the navigation pane and give the rest of the splitter to the content stack."""
+        self._sidebar_width = width
         # Set the fixed width of the navigation widget
         self.navigation_widget.setFixedWidth(width)
 
         # Update the splitter sizes to respect the new width
         self.splitter.setSizes([width, self.splitter.width() - width])
 
-        # Update text visibility for all items in the top list
-        for i in range(self.nav_list_top.count()):
-            item = self.nav_list_top.item(i)
-            original_text = item.data(Qt.UserRole + 1)  # Retrieve the original text
-            item.setText(original_text if self.sidebar_expanded else "")
+    def _applySidebarState(self):
+        self.searchBox.setVisible(self.sidebar_expanded)
+
+        # The delegate drops the text while collapsed; repainting the visible rows is all that is needed
+        self.nav_delegate.collapsed = not self.sidebar_expanded
+        self.nav_list_top.viewport().update()
+        self.nav_list_bottom.viewport().update()
+
+    def frameInterval(self):
+        """Seconds between two frames of the screen showing the widget."""
+        return frame_interval(self)
+
+    def animateSidebar(self, width):
+        """Animate the sidebar to width.
+
+        The animation may tick faster than the display refreshes; a new width is applied at most once
+        per refresh interval and only when it differs from the last one, so each frame costs one
+        relayout. The visible page neither repaints nor lays out its children until the animation ends.
+        """
+        animation = self._sidebar_animation
+        if animation.state() == QVariantAnimation.Running:
+            animation.stop()  # Reverse from wherever the previous animation got to
+            self._sidebar_frames.flush()
+        else:
+            self._suspendContentPage(True)
+        if not self.sidebar_expanded:
+            self._applySidebarState()  # Drop the text before the pane gets narrower than it
+        self._sidebar_frames.interval = self.frameInterval()
+        self._last_tick_time = None
+        self._frame_intervals = []
+        # Floats make the animation emit on every tick, so late ticks show up in the frame timings
+        animation.setStartValue(float(self._sidebar_width))
+        animation.setEndValue(float(width))
+        animation.start()
+
+    def _onSidebarFrame(self, value):
+        now = time.perf_counter()
+        if self._last_tick_time is not None:
+            # A late tick means the previous frame's relayout and paint overran the frame budget
+            self._frame_intervals.append(now - self._last_tick_time)
+        self._last_tick_time = now
+        width = round(value)
+        if width != self._sidebar_width:
+            self._sidebar_frames.submit(width)
+
+    def _onSidebarAnimationFinished(self):
+        self._sidebar_frames.cancel()
+        self.setSidebarWidth(round(self._sidebar_animation.endValue()))
+        if self.sidebar_expanded:
+            self._applySidebarState()
+        self._suspendContentPage(False)
+
+    def _suspendContentPage(self, suspended):
+        self.contentStack.setUpdatesEnabled(not suspended)
+        # The page shown when the animation ends may not be the one suspended when it started
+        if suspended:
+            self._suspended_page = self.contentStack.currentWidget()
+        page = self._suspended_page
+        if not suspended:
+            self._suspended_page = None
+        page_layout = page.layout() if page is not None else None
+        if page_layout is not None:
+            page_layout.setEnabled(not suspended)
+            if not suspended:
+                page_layout.activate()
 
-        # Update text visibility for all items in the bottom list
-        for i in range(self.nav_list_bottom.count()):
-            item = self.nav_list_bottom.item(i)
-            original_text = item.data(Qt.UserRole + 1)  # Retrieve the original text
-            item.setText(original_text if self.sidebar_expanded else "")
+    def sidebar_frame_stats(self):
+        """Return frame timings of the last sidebar animation in milliseconds."""
+        intervals = self._frame_intervals
+        if not intervals:
+            return {"frames": 0, "mean_ms": 0.0, "max_ms": 0.0, "fps": 0.0, "dropped": 0}
+        mean = sum(intervals) / len(intervals)
+        budget = self.frameInterval()
+        return {
+            "frames": len(intervals) + 1,
+            "mean_ms": mean * 1000,
+            "max_ms": max(intervals) * 1000,
+            "fps": 1.0 / mean,
+            "dropped": sum(int(interval / budget + 0.5) - 1 for interval in intervals if interval > budget * 1.5),
+        }
 
     def addPageWithNavigationItem(self, page_widget, icon, text, icon_name, align_bottom=False):
-        """Add a new page to the content stack and a corresponding item to the navigation pane."""
+        """Add a new page to the content stack and a corresponding item to the navigation pane.
+
+        page_widget is either a widget or a zero-argument callable returning one; a callable is only
+        invoked the first time switchToPage shows the page.
+        """
         # Add page to content stack
-        index = self.contentStack.addWidget(page_widget)
+        if isinstance(page_widget, QWidget):
+            index = self.contentStack.addWidget(page_widget)
+        else:
+            index = self.contentStack.addWidget(QWidget())
+            self.page_factories[index] = page_widget
 
         # Create and add corresponding navigation item
-        nav_item = QListWidgetItem(icon, text if self.sidebar_expanded else "")
-        nav_item.setData(Qt.UserRole, index)  # Store the page index
-        nav_item.setData(Qt.UserRole + 1, text)  # Store the original text separately
-        nav_item.setData(Qt.UserRole + 2, icon_name)  # Store the icon name
-
         if align_bottom:
-            self.nav_list_bottom.addItem(nav_item)
+            self.nav_model_bottom.addItem(text, icon_name, index, icon)
             self.adjustBottomListHeight()
         else:
-            self.nav_list_top.addItem(nav_item)
+            self.nav_model_top.addItem(text, icon_name, index, icon)
+        self._atlas = None
+
+        self.search_index.add(index, text, icon_name)
+        if self.searchBox.text().strip():
+            self.filterNavigation(self.searchBox.text())
 
     def adjustBottomListHeight(self):
         """Adjust the height of the bottom navigation list based on its contents."""
-        num_items = self.nav_list_bottom.count()
+        num_items = self.nav_model_bottom.rowCount()
         new_height = num_items * self.item_height + self.padding
         self.nav_list_bottom.setFixedHeight(new_height)
 
+    def isPageBuilt(self, index):
+        """Return whether the page at index is currently constructed."""
+        return index not in self.page_factories or index in self._resident_pages
+
+    def ensurePage(self, index):
+        """Build the page at index from its factory if needed and return it."""
+        if index not in self.page_factories or index in self._resident_pages:
+            return self.contentStack.widget(index)
+
+        page_widget = self.page_factories[index]()
+        if index in self._page_states and hasattr(page_widget, "restore_state"):
+            page_widget.restore_state(self._page_states.pop(index))
+        self._replacePage(index, page_widget)
+        self._resident_pages[index] = True
+        self.page_builds += 1
+        self.enforcePageBudget(keep=index)
+        return page_widget
+
+    def unloadPage(self, index):
+        """Destroy a built factory page, keeping its saved state; the visible page is never unloaded."""
+        if index not in self._resident_pages or index == self.contentStack.currentIndex():
+            return False
+        page_widget = self.contentStack.widget(index)
+        if hasattr(page_widget, "save_state"):
+            self._page_states[index] = page_widget.save_state()
+        del self._resident_pages[index]
+        self.pageUnloaded.emit(page_widget)
+        self._replacePage(index, QWidget())
+        self.page_evictions += 1
+        return True
+
+    def enforcePageBudget(self, keep=None):
+        """Unload least recently shown pages until the resident count and memory budget are respected."""
+        for index in list(self._resident_pages):
+            if not self._overPageBudget():
+                break
+            if index != keep:
+                self.unloadPage(index)
+
+    def _overPageBudget(self):
+        if self.max_resident_pages is not None and len(self._resident_pages) > self.max_resident_pages:
+            return True
+        return self.memory_budget is not None and self.residentPageMemory() > self.memory_budget
+
+    def pageMemory(self, index):
+        """Estimated memory of a built page in bytes."""
+        page_widget = self.contentStack.widget(index)
+        if hasattr(page_widget, "estimate_memory"):
+            return page_widget.estimate_memory()
+        return (1 + len(page_widget.findChildren(QWidget))) * self.widget_memory_estimate
+
+    def residentPageMemory(self):
+        """Estimated memory of every built factory page in bytes."""
+        return sum(self.pageMemory(index) for index in self._resident_pages)
+
+    def page_stats(self):
+        """Return the page lifecycle counters."""
+        return {
+            "builds": self.page_builds,
+            "evictions": self.page_evictions,
+            "resident": len(self._resident_pages),
+            "resident_memory": self.residentPageMemory(),
+        }
+
+    def _replacePage(self, index, page_widget):
+        old_widget = self.contentStack.widget(index)
+        if old_widget is self._suspended_page:
+            self._suspended_page = None
+        current_index = self.contentStack.currentIndex()
+        self.contentStack.removeWidget(old_widget)
+        self.contentStack.insertWidget(index, page_widget)
+        self.contentStack.setCurrentIndex(current_index)
+        old_widget.deleteLater()
+
+    def _unbuiltPages(self):
+        return [index for index in sorted(self.page_factories) if index not in self._resident_pages]
+
+    def prewarmNextPage(self):
+        """Build the first unbuilt page after the current one, unless that would exceed the page budget."""
+        unbuilt = self._unbuiltPages()
+        if not unbuilt:
+            return
+        if self.max_resident_pages is not None and len(self._resident_pages) >= self.max_resident_pages:
+            return
+        current_index = self.contentStack.currentIndex()
+        later_pages = [index for index in unbuilt if index > current_index]
+        self.ensurePage(later_pages[0] if later_pages else unbuilt[0])
+
     def switchToPage(self, index):
-        """Switch to a specific page."""
+        """Switch to a specific page, building it first if it was added as a factory."""
         if 0 <= index < self.contentStack.count():
-            self.contentStack.setCurrentIndex(index)
\ No newline at end of file
+            self.ensurePage(index)
+            self.contentStack.setCurrentIndex(index)
+            if index in self._resident_pages:
+                self._resident_pages.move_to_end(index)
+                self.enforcePageBudget()  # The previously visible page may be unloaded now
+            if self.prewarm_pages and self._unbuiltPages():
+                self._prewarm_timer.start()
\ No newline at end of file
@@ -0,0 +1,117 @@
+from PySide6.QtCore import QAbstractListModel, QModelIndex, Qt
+from PySide6.QtWidgets import QStyledItemDelegate, QStyleOptionViewItem
+
+PageIndexRole = Qt.UserRole
+TextRole = Qt.UserRole + 1
+IconNameRole = Qt.UserRole + 2
+
+
+class NavigationItem:
+    __slots__ = ("text", "icon_name", "page_index")
+
+    def __init__(self, text, icon_name, page_index):
+        self.text = text
+        self.icon_name = icon_name
+        self.page_index = page_index
+
+
+class NavigationListModel(QAbstractListModel):
+    """Navigation entries with icons pulled lazily from an icon provider.
+
+    Icons are only requested for rows a view actually paints and are cached per icon name, so a
+    theme change is one dataChanged signal instead of a setIcon call per item. A page filter hides
+    entries without removing them; rows then address only the visible entries.
+    """
+
+    def __init__(self, icon_provider, parent=None):
+        super().__init__(parent)
+        self.icon_provider = icon_provider  # Callable mapping an icon name to a QIcon
+        self._items = []
+        self._icons = {}
+        self._positions = {}  # Page index -> position in _items
+        self._visible = None  # Positions of the rows shown while a filter is set
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._items) if self._visible is None else len(self._visible)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        item = self.item(index.row())
+        if role in (Qt.DisplayRole, TextRole, Qt.ToolTipRole):
+            return item.text
+        if role == Qt.DecorationRole:
+            if not item.icon_name:
+                return None
+            icon = self._icons.get(item.icon_name)
+            if icon is None:
+                icon = self._icons[item.icon_name] = self.icon_provider(item.icon_name)
+            return icon
+        if role == PageIndexRole:
+            return item.page_index
+        if role == IconNameRole:
+            return item.icon_name
+        return None
+
+    def flags(self, index):
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable if index.isValid() else Qt.NoItemFlags
+
+    def addItem(self, text, icon_name, page_index, icon=None):
+        """Append an entry; icon optionally seeds the cache for its icon name.
+
+        While a filter is set the entry stays hidden until the next setVisiblePages call.
+        """
+        position = len(self._items)
+        if icon is not None and not icon.isNull() and icon_name:
+            self._icons.setdefault(icon_name, icon)
+        self._positions[page_index] = position
+        if self._visible is not None:
+            self._items.append(NavigationItem(text, icon_name, page_index))
+            return None
+        self.beginInsertRows(QModelIndex(), position, position)
+        self._items.append(NavigationItem(text, icon_name, page_index))
+        self.endInsertRows()
+        return position
+
+    def item(self, row):
+        return self._items[row if self._visible is None else self._visible[row]]
+
+    def items(self):
+        return list(self._items)
+
+    def setVisiblePages(self, page_indexes):
+        """Show only the entries of the given page indexes, in their original order; None shows all.
+
+        Only the matching pages are looked up, so the cost follows the number of matches rather than
+        the number of entries.
+        """
+        self.beginResetModel()
+        if page_indexes is None:
+            self._visible = None
+        else:
+            positions = self._positions
+            self._visible = sorted(positions[page] for page in page_indexes if page in positions)
+        self.endResetModel()
+
+    def refreshIcons(self):
+        """Drop the cached icons and tell views to fetch them again when they next paint."""
+        self._icons.clear()
+        rows = self.rowCount()
+        if rows:
+            self.dataChanged.emit(self.index(0), self.index(rows - 1), [Qt.DecorationRole])
+
+
+class NavigationItemDelegate(QStyledItemDelegate):
+    """Draws navigation entries with or without their text depending on the collapsed flag."""
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.collapsed = False
+
+    def initStyleOption(self, option, index):
+        super().initStyleOption(option, index)
+        if self.collapsed:
+            option.text = ""
+            option.features &= ~QStyleOptionViewItem.HasDisplay
@@ -0,0 +1,109 @@
+import re
+from typing import Dict, List, Optional, Set
+
+_WORD = re.compile(r"\w+")
+
+
+def trigrams(text: str) -> Set[str]:
+    """Return the set of three-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class NavigationSearchIndex:
+    """Prefix and trigram index over navigation entries, updated one entry at a time.
+
+    Query terms shorter than three characters are matched as word prefixes through a prefix posting
+    table; longer terms match anywhere by intersecting trigram posting sets and confirming the
+    substring on the candidates left. A query that extends the previous one only narrows the
+    previous result, which is what typing into the search box produces.
+    """
+
+    def __init__(self):
+        self._haystacks: Dict[int, str] = {}  # Key -> lowercased searchable text
+        self._prefixes: Dict[str, Set[int]] = {}  # One- and two-character word prefix -> keys
+        self._trigrams: Dict[str, Set[int]] = {}
+        self._last_query: Optional[str] = None
+        self._last_result: List[int] = []
+
+    def __len__(self) -> int:
+        return len(self._haystacks)
+
+    def __contains__(self, key) -> bool:
+        return key in self._haystacks
+
+    def add(self, key: int, *fields: str) -> None:
+        """Index an entry under key; the fields (title, icon name, ...) are searched together."""
+        if key in self._haystacks:
+            self.remove(key)
+        haystack = " ".join(field for field in fields if field).lower()
+        self._haystacks[key] = haystack
+        for prefix in self._word_prefixes(haystack):
+            self._prefixes.setdefault(prefix, set()).add(key)
+        for trigram in trigrams(haystack):
+            self._trigrams.setdefault(trigram, set()).add(key)
+        self._last_query = None
+
+    def remove(self, key: int) -> None:
+        """Drop an entry from the index."""
+        haystack = self._haystacks.pop(key, None)
+        if haystack is None:
+            return
+        for table, grams in ((self._prefixes, self._word_prefixes(haystack)), (self._trigrams, trigrams(haystack))):
+            for gram in grams:
+                postings = table[gram]
+                postings.discard(key)
+                if not postings:
+                    del table[gram]
+        self._last_query = None
+
+    def search(self, query: str) -> List[int]:
+        """Return the keys of entries matching every term of query, in ascending key order."""
+        query = " ".join(query.lower().split())
+        if not query:
+            return sorted(self._haystacks)
+        terms = query.split()
+        last_terms = self._last_query.split() if self._last_query else []
+        # A term reaching three characters switches from word prefix to substring matching, which
+        # can match entries its shorter form did not
+        if last_terms and query.startswith(self._last_query) and \
+                (len(last_terms[-1]) < 3) == (len(terms[len(last_terms) - 1]) < 3):
+            # Typing extends the query: every match is among the previous matches, and only the
+            # last previous term and any terms after it can reject one of them
+            result = self._last_result
+            for term in terms[len(last_terms) - 1:]:
+                if len(term) < 3:
+                    keys = self._prefixes.get(term, ())
+                    result = [key for key in result if key in keys]
+                else:
+                    haystacks = self._haystacks
+                    result = [key for key in result if term in haystacks[key]]
+        else:
+            result = sorted(self._lookup(terms))
+        self._last_query, self._last_result = query, result
+        return result
+
+    def _lookup(self, terms: List[str]) -> Set[int]:
+        candidates = None
+        for term in sorted(terms, key=len, reverse=True):  # Longest, most selective term first
+            if len(term) < 3:
+                keys = self._prefixes.get(term, set())
+            elif len(term) == 3:
+                keys = self._trigrams.get(term, set())  # A single trigram posting is exact
+            else:
+                keys = self._substring_keys(term, candidates)
+            candidates = keys if candidates is None else candidates & keys
+            if not candidates:
+                break
+        return candidates
+
+    @staticmethod
+    def _word_prefixes(haystack: str) -> Set[str]:
+        return {word[:length] for word in _WORD.findall(haystack) for length in (1, 2)}
+
+    def _substring_keys(self, term: str, within: Optional[Set[int]] = None) -> Set[int]:
+        # Only the rarest trigram's postings are scanned; the substring test is exact on its own
+        rarest = min((self._trigrams.get(trigram, ()) for trigram in trigrams(term)), key=len)
+        if within is not None:
+            rarest = within.intersection(rarest)
+        haystacks = self._haystacks
+        return {key for key in rarest if term in haystacks[key]}
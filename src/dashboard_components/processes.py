@@ -0,0 +1,387 @@
+import os
+import time
+
+import numpy as np
+from PySide6.QtCore import Qt, QDate, QObject, QRunnable, QThreadPool, Signal
+from PySide6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel, QTableView, QHeaderView, QAbstractItemView,
+                               QPushButton, QProgressBar, QFileDialog, QDateEdit, QComboBox, QSplitter)
+from .aggregate import FUNCTIONS, AggregationEngine
+from .columnar_model import ColumnarTableModel
+from .date_index import DateIndex
+from .ingest import TableIngestor
+from .table_cache import TableCache
+
+
+class _DateIndexSignals(QObject):
+    ready = Signal(int, int, object)  # Generation, column, DateIndex
+
+
+class _DateIndexTask(QRunnable):
+    """Sort a date column on a pool thread; an argsort of millions of rows takes a noticeable fraction of a second."""
+
+    def __init__(self, generation: int, column: int, dates: np.ndarray, signals: _DateIndexSignals):
+        super().__init__()
+        self.generation = generation
+        self.column = column
+        self.dates = dates
+        self.signals = signals
+
+    def run(self):
+        self.signals.ready.emit(self.generation, self.column, DateIndex(self.dates))
+
+
+class _AggregateSignals(QObject):
+    ready = Signal(int, object, object, float, str)  # Generation, names, columns, seconds, error message
+
+
+class _AggregateTask(QRunnable):
+    """Run one aggregation on a pool thread, unless a newer request superseded it while it was queued."""
+
+    def __init__(self, engine: AggregationEngine, generation: int, parameters: dict, signals: _AggregateSignals):
+        super().__init__()
+        self.engine = engine
+        self.generation = generation
+        self.parameters = parameters
+        self.signals = signals
+
+    def run(self):
+        if self.generation != self.engine.generation:
+            return
+        start = time.perf_counter()
+        try:
+            names, columns = self.engine.aggregate(**self.parameters)
+        except (ValueError, TypeError) as error:
+            self.signals.ready.emit(self.generation, [], [], 0.0, str(error))
+            return
+        self.signals.ready.emit(self.generation, names, columns, time.perf_counter() - start, "")
+
+
+def _configure_table_view(view: QTableView, row_height: int, column_width: int) -> None:
+    view.setWordWrap(False)
+    view.setEditTriggers(QAbstractItemView.NoEditTriggers)
+    view.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
+    vertical_header = view.verticalHeader()
+    vertical_header.setSectionResizeMode(QHeaderView.Fixed)
+    vertical_header.setDefaultSectionSize(row_height)
+    horizontal_header = view.horizontalHeader()
+    horizontal_header.setSectionResizeMode(QHeaderView.Interactive)
+    horizontal_header.setDefaultSectionSize(column_width)
+
+
+def _to_qdate(day: np.datetime64) -> QDate:
+    return QDate.fromString(str(day.astype("datetime64[D]")), "yyyy-MM-dd")
+
+
+def _to_datetime64(date: QDate) -> np.datetime64:
+    return np.datetime64(date.toString("yyyy-MM-dd"), "D")
+
+
+class ProcessesPage(QWidget):
+    """Spreadsheet page showing a ColumnarTableModel.
+
+    The view is set up so that nothing scales with the number of rows: fixed row heights, fixed
+    column widths instead of resizing to contents, and no word wrap. The date range filter narrows
+    the model to the rows of a DateIndex query on the first date column, also without per-row work.
+    The aggregation panel below the table groups or pivots the rows shown on a worker thread.
+    """
+
+    def __init__(self, style_manager, parent=None, row_height=24, column_width=110, cache=None):
+        super().__init__(parent)
+        self.style_manager = style_manager
+        self.setObjectName("excelProcessing")
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(10, 10, 10, 10)
+
+        toolbar = QHBoxLayout()
+        self.open_button = QPushButton("Open…", self)
+        self.open_button.clicked.connect(self.openFile)
+        toolbar.addWidget(self.open_button)
+        self.summary_label = QLabel("No data loaded", self)
+        toolbar.addWidget(self.summary_label, stretch=1)
+        self.cache_label = QLabel(self)
+        toolbar.addWidget(self.cache_label)
+        self.progress_bar = QProgressBar(self)
+        self.progress_bar.setRange(0, 1000)
+        self.progress_bar.setTextVisible(False)
+        self.progress_bar.setFixedWidth(160)
+        self.progress_bar.hide()
+        toolbar.addWidget(self.progress_bar)
+        self.cancel_button = QPushButton("Cancel", self)
+        self.cancel_button.hide()
+        toolbar.addWidget(self.cancel_button)
+        layout.addLayout(toolbar)
+        self.toolbar = toolbar
+
+        self.filter_bar = QWidget(self)
+        filter_layout = QHBoxLayout(self.filter_bar)
+        filter_layout.setContentsMargins(0, 0, 0, 0)
+        self.date_filter_label = QLabel(self.filter_bar)
+        filter_layout.addWidget(self.date_filter_label)
+        self.from_date = QDateEdit(self.filter_bar)
+        self.to_date = QDateEdit(self.filter_bar)
+        for date_edit in (self.from_date, self.to_date):
+            date_edit.setCalendarPopup(True)
+            date_edit.setDisplayFormat("yyyy-MM-dd")
+            date_edit.dateChanged.connect(self.applyDateFilter)
+        filter_layout.addWidget(self.from_date)
+        filter_layout.addWidget(QLabel("to", self.filter_bar))
+        filter_layout.addWidget(self.to_date)
+        self.all_dates_button = QPushButton("All dates", self.filter_bar)
+        self.all_dates_button.clicked.connect(self.clearDateFilter)
+        filter_layout.addWidget(self.all_dates_button)
+        filter_layout.addStretch(1)
+        self.filter_bar.hide()
+        layout.addWidget(self.filter_bar)
+        self.date_index = None
+        self.date_column = None
+        self._index_generation = 0  # Incremented whenever the data changes so stale indexes are dropped
+        self._index_signals = None
+
+        self.model = ColumnarTableModel(parent=self)
+        self.cache = cache if cache is not None else TableCache()
+        self.ingestor = TableIngestor(self.model, self, cache=self.cache)
+        self.ingestor.started.connect(self.onLoadStarted)
+        self.ingestor.progress.connect(self.onLoadProgress)
+        self.ingestor.finished.connect(self.onLoadFinished)
+        self.ingestor.failed.connect(self.onLoadFailed)
+        self.ingestor.cacheUpdated.connect(self.updateCacheSummary)
+        self.cancel_button.clicked.connect(self.ingestor.cancel)
+        self.model.rowsInserted.connect(self.updateSummary)
+        self.splitter = QSplitter(Qt.Vertical, self)
+        self.table_view = QTableView(self.splitter)
+        self.table_view.setModel(self.model)
+        _configure_table_view(self.table_view, row_height, column_width)
+        self.splitter.addWidget(self.table_view)
+        self.setupAggregationPanel(row_height, column_width)
+        self.splitter.setStretchFactor(0, 3)
+        self.splitter.setStretchFactor(1, 1)
+        layout.addWidget(self.splitter)
+
+        self.updateCacheSummary()
+
+        self.applyStyles()
+
+    def setupAggregationPanel(self, row_height, column_width):
+        self.aggregate_panel = QWidget(self.splitter)
+        panel_layout = QVBoxLayout(self.aggregate_panel)
+        panel_layout.setContentsMargins(0, 6, 0, 0)
+        controls = QHBoxLayout()
+        controls.addWidget(QLabel("Group by", self.aggregate_panel))
+        self.group_combo = QComboBox(self.aggregate_panel)
+        controls.addWidget(self.group_combo)
+        controls.addWidget(QLabel("Pivot by", self.aggregate_panel))
+        self.pivot_combo = QComboBox(self.aggregate_panel)
+        controls.addWidget(self.pivot_combo)
+        self.function_combo = QComboBox(self.aggregate_panel)
+        self.function_combo.addItems(FUNCTIONS)
+        controls.addWidget(self.function_combo)
+        controls.addWidget(QLabel("of", self.aggregate_panel))
+        self.value_combo = QComboBox(self.aggregate_panel)
+        controls.addWidget(self.value_combo)
+        self.aggregate_status = QLabel(self.aggregate_panel)
+        controls.addWidget(self.aggregate_status, stretch=1)
+        for combo in (self.group_combo, self.pivot_combo, self.function_combo, self.value_combo):
+            combo.currentIndexChanged.connect(self.requestAggregation)
+        panel_layout.addLayout(controls)
+
+        self.aggregate_model = ColumnarTableModel(parent=self)
+        self.aggregate_view = QTableView(self.aggregate_panel)
+        self.aggregate_view.setObjectName("aggregateTable")
+        self.aggregate_view.setModel(self.aggregate_model)
+        _configure_table_view(self.aggregate_view, row_height, column_width)
+        panel_layout.addWidget(self.aggregate_view)
+        self.splitter.addWidget(self.aggregate_panel)
+        self.aggregate_panel.hide()
+
+        self.aggregation = AggregationEngine()
+        self._aggregate_signals = None
+
+    def setColumns(self, names, columns):
+        """Show the given columns."""
+        self.model.setColumns(names, columns)
+        self.updateSummary()
+        self.onDataReplaced()
+
+    def onDataReplaced(self):
+        """Index and offer the new columns for filtering and aggregation."""
+        self.rebuildDateIndex()
+        self.updateAggregationColumns()
+
+    def updateAggregationColumns(self):
+        """Give the aggregation engine the model's columns and list them in the panel, keeping selections by name."""
+        names = self.model.columnNames()
+        columns = [self.model.columnData(column) for column in range(self.model.columnCount())]
+        self.aggregation.setColumns(names, columns)
+        if not names:
+            self.aggregate_panel.hide()
+            return
+        numeric = [column for column, array in enumerate(columns) if array.dtype.kind in "fiub"]
+        dates = [column for column, array in enumerate(columns) if array.dtype.kind == "M"]
+        default_group = dates[0] if dates else 0
+        default_value = next((column for column in numeric if column != default_group), None)
+        for combo, items, default in (
+                (self.group_combo, list(enumerate(names)), default_group),
+                (self.pivot_combo, [(None, "None")] + list(enumerate(names)), None),
+                (self.value_combo, [(column, names[column]) for column in numeric], default_value)):
+            selected = combo.currentText()
+            combo.blockSignals(True)
+            combo.clear()
+            for column, text in items:
+                combo.addItem(text, column)
+            position = combo.findText(selected)
+            combo.setCurrentIndex(position if selected and position >= 0 else max(combo.findData(default), 0))
+            combo.blockSignals(False)
+        self.aggregate_panel.show()
+        self.requestAggregation()
+
+    def requestAggregation(self):
+        """Recompute the aggregate for the current selections and the rows the date filter shows."""
+        if self.aggregate_panel.isHidden():
+            return
+        function = self.function_combo.currentText()
+        self.value_combo.setEnabled(function != "count")
+        parameters = {
+            "group": self.group_combo.currentData(),
+            "function": function,
+            "value": self.value_combo.currentData() if function != "count" else None,
+            "pivot": self.pivot_combo.currentData(),
+            "rows": self.model.rowMap(),
+        }
+        self.aggregation.generation += 1
+        self.aggregate_status.setText("Aggregating…")
+        self._aggregate_signals = self._startTask(_AggregateTask, _AggregateSignals, self._onAggregated,
+                                                  self.aggregation, self.aggregation.generation, parameters)
+
+    def _onAggregated(self, generation, names, columns, seconds, error):
+        if generation != self.aggregation.generation:
+            return
+        if error:
+            self.aggregate_model.setColumns([], [])
+            self.aggregate_status.setText(error)
+            return
+        self.aggregate_model.setColumns(names, columns)
+        self.aggregate_status.setText(f"{self.aggregate_model.rowCount():,} groups in {seconds * 1000:,.0f} ms")
+
+    def rebuildDateIndex(self):
+        """Index the first date column in the background; the filter appears once the index is ready."""
+        self._dropDateIndex()
+        column = next((column for column in range(self.model.columnCount())
+                       if self.model.columnData(column).dtype.kind == "M"), None)
+        if column is None:
+            return
+        self._index_signals = self._startTask(_DateIndexTask, _DateIndexSignals, self._onDateIndexReady,
+                                              self._index_generation, column, self.model.columnData(column))
+
+    def _startTask(self, task_type, signals_type, slot, *arguments):
+        """Start task_type(*arguments, signals) on the global thread pool, with its ready signal connected to slot."""
+        # Not a child of the page, so a task finishing after the page is gone has somewhere to emit
+        signals = signals_type()
+        signals.ready.connect(slot)
+        QThreadPool.globalInstance().start(task_type(*arguments, signals))
+        return signals
+
+    def _dropDateIndex(self):
+        self._index_generation += 1
+        self.date_index = self.date_column = None
+        self.filter_bar.hide()
+        if self.model.rowMap() is not None:
+            self.model.setRowMap(None)
+            self.updateSummary()
+            self.requestAggregation()
+
+    def _onDateIndexReady(self, generation, column, index):
+        if generation != self._index_generation:
+            return
+        bounds = index.bounds()
+        if bounds is None:
+            return
+        self.date_index, self.date_column = index, column
+        first, last = (_to_qdate(day) for day in bounds)
+        for date_edit, value in ((self.from_date, first), (self.to_date, last)):
+            date_edit.blockSignals(True)
+            date_edit.setDateRange(first, last)
+            date_edit.setDate(value)
+            date_edit.blockSignals(False)
+        self.date_filter_label.setText(self.model.columnNames()[column])
+        self.filter_bar.show()
+
+    def applyDateFilter(self):
+        """Show the rows dated from_date to to_date: two binary searches and a model reset."""
+        if self.date_index is None:
+            return
+        first, last = _to_datetime64(self.from_date.date()), _to_datetime64(self.to_date.date())
+        if (first, last) == self.date_index.bounds() and self.date_index.count == self.model.sourceRowCount():
+            self.model.setRowMap(None)
+        else:
+            self.model.setRowMap(self.date_index.rows(first, last))
+        self.updateSummary()
+        self.requestAggregation()
+
+    def clearDateFilter(self):
+        if self.date_index is None:
+            return
+        first, last = self.date_index.bounds()
+        for date_edit, value in ((self.from_date, first), (self.to_date, last)):
+            date_edit.blockSignals(True)
+            date_edit.setDate(_to_qdate(value))
+            date_edit.blockSignals(False)
+        self.model.setRowMap(None)
+        self.updateSummary()
+        self.requestAggregation()
+
+    def openFile(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Open table", "", "Tables (*.csv *.xlsx);;All files (*)")
+        if path:
+            self.loadFile(path)
+
+    def loadFile(self, path):
+        """Load a .csv or .xlsx file in the background; the table fills in chunk by chunk."""
+        self.ingestor.load(path)
+
+    def onLoadStarted(self, path):
+        self._dropDateIndex()
+        self.aggregation.generation += 1  # Drop results still in flight for the old data
+        self.aggregate_panel.hide()
+        self.progress_bar.setValue(0)
+        self.progress_bar.show()
+        self.cancel_button.show()
+        self.summary_label.setText(f"Loading {os.path.basename(path)}…")
+
+    def onLoadProgress(self, fraction):
+        self.progress_bar.setValue(int(fraction * self.progress_bar.maximum()))
+
+    def onLoadFinished(self, rows, cancelled):
+        self.progress_bar.hide()
+        self.cancel_button.hide()
+        self.updateSummary()
+        if cancelled:
+            self.summary_label.setText(f"{self.summary_label.text()} (cancelled)")
+        self.onDataReplaced()
+
+    def onLoadFailed(self, message):
+        self.progress_bar.hide()
+        self.cancel_button.hide()
+        self.summary_label.setText(f"Loading failed: {message}")
+
+    def updateSummary(self):
+        rows, columns, total = self.model.rowCount(), self.model.columnCount(), self.model.sourceRowCount()
+        if not columns:
+            self.summary_label.setText("No data loaded")
+        elif self.model.rowMap() is not None:
+            self.summary_label.setText(f"{rows:,} of {total:,} rows × {columns} columns")
+        else:
+            self.summary_label.setText(f"{rows:,} rows × {columns} columns")
+
+    def updateCacheSummary(self):
+        if not (self.cache.hits or self.cache.misses):
+            self.cache_label.setText("Cache: no lookups yet")  # Reading the cache index waits for the first load
+            return
+        info = self.cache.info()
+        self.cache_label.setText(f"Cache: {info['hits']} hit{'s' * (info['hits'] != 1)}, "
+                                 f"{info['misses']} miss{'es' * (info['misses'] != 1)}, "
+                                 f"{info['bytes'] / 2**20:,.0f} of {info['max_bytes'] / 2**20:,.0f} MiB")
+
+    def applyStyles(self):
+        """Apply styles using the style manager."""
+        self.style_manager.apply_stylesheet(self, self.style_manager.get_excel_processing_stylesheet)
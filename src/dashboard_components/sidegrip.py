@@ -1,9 +1,18 @@
 from PySide6.QtWidgets import (QWidget)
-from PySide6.QtCore import Qt
+from PySide6.QtCore import Qt, QRect
+from .throttle import FrameCoalescer
 
 class SideGrip(QWidget):
-    def __init__(self, parent, edge):
+    """Resize handle along one window edge.
+
+    Mouse moves only record the cursor position; the window geometry follows it at most once per
+    display frame. With system_resize the platform resizes the window instead, where it can.
+    """
+
+    def __init__(self, parent, edge, system_resize=False):
         super().__init__(parent)
+        self.edge = edge
+        self.system_resize = system_resize
         if edge == Qt.LeftEdge:
             self.setCursor(Qt.SizeHorCursor)
             self.resizeFunc = self.resizeLeft
@@ -16,40 +25,52 @@ class SideGrip(QWidget):
         else:
             self.setCursor(Qt.SizeVerCursor)
             self.resizeFunc = self.resizeBottom
-        self.mousePos = None
+        self.mousePos = None  # Global cursor position at the press
+        self.pressGeometry = None  # Window geometry at the press; every resize is relative to it
+        self.resizeCoalescer = FrameCoalescer(self.applyCursorPosition, parent=self)
 
     def resizeLeft(self, delta):
         window = self.window()
-        width = max(window.minimumWidth(), window.width() - delta.x())
-        geo = window.geometry()
-        geo.setLeft(geo.right() - width)
+        geo = QRect(self.pressGeometry)
+        width = max(window.minimumWidth(), geo.width() - delta.x())
+        geo.setLeft(geo.right() - width + 1)
         window.setGeometry(geo)
 
     def resizeTop(self, delta):
         window = self.window()
-        height = max(window.minimumHeight(), window.height() - delta.y())
-        geo = window.geometry()
-        geo.setTop(geo.bottom() - height)
+        geo = QRect(self.pressGeometry)
+        height = max(window.minimumHeight(), geo.height() - delta.y())
+        geo.setTop(geo.bottom() - height + 1)
         window.setGeometry(geo)
 
     def resizeRight(self, delta):
         window = self.window()
-        width = max(window.minimumWidth(), window.width() + delta.x())
+        width = max(window.minimumWidth(), self.pressGeometry.width() + delta.x())
         window.resize(width, window.height())
 
     def resizeBottom(self, delta):
         window = self.window()
-        height = max(window.minimumHeight(), window.height() + delta.y())
+        height = max(window.minimumHeight(), self.pressGeometry.height() + delta.y())
         window.resize(window.width(), height)
 
+    def applyCursorPosition(self, global_pos):
+        """Resize the window to follow the cursor, called by the coalescer once per frame."""
+        if self.mousePos is not None:
+            self.resizeFunc(global_pos - self.mousePos)
+
     def mousePressEvent(self, event):
         if event.button() == Qt.LeftButton:
-            self.mousePos = event.position().toPoint()
+            if self.system_resize:
+                handle = self.window().windowHandle()
+                if handle is not None and handle.startSystemResize(self.edge):
+                    return  # The window manager drives the resize; no move events follow
+            self.mousePos = event.globalPosition().toPoint()
+            self.pressGeometry = self.window().geometry()
 
     def mouseMoveEvent(self, event):
         if self.mousePos is not None:
-            delta = event.position().toPoint() - self.mousePos
-            self.resizeFunc(delta)
+            self.resizeCoalescer.submit(event.globalPosition().toPoint())
 
     def mouseReleaseEvent(self, event):
-        self.mousePos = None
\ No newline at end of file
+        self.resizeCoalescer.flush()  # Land exactly where the cursor was released
+        self.mousePos = None
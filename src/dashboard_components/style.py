@@ -1,5 +1,51 @@
+import re
+
+from PySide6.QtGui import QColor, QPalette
+
+# Object names that scope each component's rules in the application-level stylesheet, in cascade order:
+# components nested inside another one come after it so their rules win ties in specificity.
+COMPONENT_SCOPES = (
+    ("navigation", "navigationContent"),
+    ("titlebar", "titleBar"),
+    ("mainwindow", "mainWindow"),
+    ("svg_template_generator", "svgTemplateGenerator"),
+    ("excel_processing", "excelProcessing"),
+)
+
+_RULE_PATTERN = re.compile(r"([^{}]+)\{([^{}]*)\}")
+_SELECTOR_PATTERN = re.compile(r"^([A-Za-z_][\w-]*|\*)(.*)$")
+
+
+def scope_stylesheet(stylesheet, object_name):
+    """Restrict every rule of a widget-level stylesheet to the widget named object_name.
+
+    A stylesheet set on a widget applies to the widget itself and to its children, so each
+    selector ``Type:state`` becomes ``Type#name:state, #name Type:state``.
+    """
+    rules = []
+    for selectors, body in _RULE_PATTERN.findall(stylesheet):
+        scoped = []
+        for selector in selectors.split(","):
+            selector = selector.strip()
+            match = _SELECTOR_PATTERN.match(selector)
+            if match and " " not in selector:
+                scoped.append(f"{match.group(1)}#{object_name}{match.group(2)}")
+            scoped.append(f"#{object_name} {selector}")
+        rules.append(f"{', '.join(scoped)} {{{body}}}")
+    return "\n".join(rules)
+
+
 class StyleManager:
     def __init__(self):
+        # "widget": every component calls setStyleSheet on its own subtree.
+        # "application": one stylesheet scoped by object names is applied once at the top-level window.
+        # "palette": no stylesheets; themes are QPalettes swapped with QApplication.setPalette.
+        self.styling_mode = "widget"
+
+        # Compiled stylesheets keyed by (component, mode, font size, palette version)
+        self._stylesheet_cache = {}
+        self.version = 0  # Bumped whenever a palette attribute or the font size changes
+
         self.current_mode = "dark"  # Default mode
         self.font_size = 10  # Default font size
 
@@ -21,35 +67,104 @@ class StyleManager:
         self.bright_window_bgcolor = "#FFFFFF"
         self.bright_content_bgcolor = "#D0D0D0"
 
+    def __setattr__(self, name, value):
+        # Palette attributes and the font size feed every stylesheet; changing one drops the compiled sheets
+        if (name == "font_size" or name.startswith(("dark_", "bright_"))) and getattr(self, name, value) != value:
+            self._stylesheet_cache.clear()
+            object.__setattr__(self, "version", self.version + 1)
+        object.__setattr__(self, name, value)
+
+    def style_token(self):
+        """Return a token that changes whenever the stylesheets returned for the current mode change.
+
+        Widgets can compare it with the token of their last setStyleSheet call and skip re-applying.
+        """
+        return self.current_mode, self.version
+
+    def apply_stylesheet(self, widget, get_stylesheet, styling_mode="widget"):
+        """Set get_stylesheet() on widget while styling in styling_mode, skipping the re-polish when nothing changed.
+
+        The style_token() of the last stylesheet set is kept on the widget; returns whether one was set.
+        """
+        if self.styling_mode != styling_mode:
+            return False
+        token = self.style_token()
+        if token == getattr(widget, "_style_token", None):
+            return False
+        widget._style_token = token
+        widget.setStyleSheet(get_stylesheet())
+        return True
+
+    def _cached_stylesheet(self, component, build):
+        key = (component, self.current_mode, self.font_size, self.version)
+        stylesheet = self._stylesheet_cache.get(key)
+        if stylesheet is None:
+            stylesheet = self._stylesheet_cache[key] = build()
+        return stylesheet
+
     def get_stylesheet(self):
         """Return the combined stylesheet for the application based on the current mode."""
-        return (
+        return self._cached_stylesheet("combined", lambda: (
             self.get_navigation_stylesheet() +
             self.get_titlebar_stylesheet() +
             self.get_mainwindow_stylesheet() +
             self.get_svg_template_generator_stylesheet() +
             self.get_excel_processing_stylesheet()
-        )
+        ))
+
+    def get_application_stylesheet(self):
+        """Return every component's stylesheet scoped to its object name, to be applied once at the root."""
+        return self._cached_stylesheet("application", lambda: "\n".join(
+            scope_stylesheet(getattr(self, f"get_{component}_stylesheet")(), object_name)
+            for component, object_name in COMPONENT_SCOPES
+        ))
+
+    def get_palette(self, mode=None):
+        """Return the theme of the given mode (the current one by default) as a QPalette.
+
+        The dark_*/bright_* color attributes stay the source of truth:
+        Window is the main window background, Base the content background, AlternateBase and Button
+        the navigation background, Mid the hover color and Highlight the pressed/selected color.
+        """
+        mode = mode or self.current_mode
+
+        def build():
+            color = lambda name: QColor(getattr(self, f"{mode}_{name}"))
+            palette = QPalette(color("navi_bgcolor"), color("window_bgcolor"))
+            palette.setColor(QPalette.Base, color("content_bgcolor"))
+            palette.setColor(QPalette.AlternateBase, color("navi_bgcolor"))
+            for role in (QPalette.WindowText, QPalette.Text, QPalette.ButtonText, QPalette.HighlightedText,
+                         QPalette.BrightText, QPalette.PlaceholderText):
+                palette.setColor(role, color("font_color"))
+            palette.setColor(QPalette.Mid, color("hover"))
+            palette.setColor(QPalette.Highlight, color("pressed"))
+            return palette
+
+        key = ("palette", mode, self.font_size, self.version)
+        palette = self._stylesheet_cache.get(key)
+        if palette is None:
+            palette = self._stylesheet_cache[key] = build()
+        return palette
 
     def get_navigation_stylesheet(self):
         """Return the navigation pane stylesheet based on the current mode."""
-        return self.dark_mode_navigation_stylesheet() if self.current_mode == "dark" else self.bright_mode_navigation_stylesheet()
+        return self._cached_stylesheet("navigation", self.dark_mode_navigation_stylesheet if self.current_mode == "dark" else self.bright_mode_navigation_stylesheet)
 
     def get_titlebar_stylesheet(self):
         """Return the title bar stylesheet based on the current mode."""
-        return self.dark_mode_titlebar_stylesheet() if self.current_mode == "dark" else self.bright_mode_titlebar_stylesheet()
+        return self._cached_stylesheet("titlebar", self.dark_mode_titlebar_stylesheet if self.current_mode == "dark" else self.bright_mode_titlebar_stylesheet)
 
     def get_mainwindow_stylesheet(self):
         """Return the main window stylesheet based on the current mode."""
-        return self.dark_mode_mainwindow_stylesheet() if self.current_mode == "dark" else self.bright_mode_mainwindow_stylesheet()
+        return self._cached_stylesheet("mainwindow", self.dark_mode_mainwindow_stylesheet if self.current_mode == "dark" else self.bright_mode_mainwindow_stylesheet)
 
     def get_svg_template_generator_stylesheet(self):
         """Return the SVG Template Generator stylesheet based on the current mode."""
-        return self.dark_mode_svg_template_generator_stylesheet() if self.current_mode == "dark" else self.bright_mode_svg_template_generator_stylesheet()
+        return self._cached_stylesheet("svg_template_generator", self.dark_mode_svg_template_generator_stylesheet if self.current_mode == "dark" else self.bright_mode_svg_template_generator_stylesheet)
 
     def get_excel_processing_stylesheet(self):
         """Return the Excel Processing widget stylesheet based on the current mode."""
-        return self.dark_mode_excel_processing_stylesheet() if self.current_mode == "dark" else self.bright_mode_excel_processing_stylesheet()
+        return self._cached_stylesheet("excel_processing", self.dark_mode_excel_processing_stylesheet if self.current_mode == "dark" else self.bright_mode_excel_processing_stylesheet)
 
     def common_button_styles(self, bg_color, font_color):
         return f"""
@@ -122,12 +237,13 @@ class StyleManager:
     def dark_mode_navigation_stylesheet(self):
         return f"""
            QWidget {{ background-color: {self.dark_navi_bgcolor}; }}
-           QListWidget {{ border: none; outline: 0; background-color: {self.dark_navi_bgcolor}; color: {self.dark_font_color}; font-size: {self.font_size}px;}}
-           QListWidget::item {{ border: none; padding-left: 5px; padding-top: 5px; font-size: {self.font_size}px;}}
-           QListWidget::item:hover {{ background-color: {self.dark_hover}; font-size: {self.font_size}px;}}
-           QListWidget::item:selected {{ background-color: {self.dark_pressed}; color: {self.dark_font_color}; border-left: 1px solid #3058a4; font-size: {self.font_size}px;}}
+           QListView {{ border: none; outline: 0; background-color: {self.dark_navi_bgcolor}; color: {self.dark_font_color}; font-size: {self.font_size}px;}}
+           QListView::item {{ border: none; padding-left: 5px; padding-top: 5px; font-size: {self.font_size}px;}}
+           QListView::item:hover {{ background-color: {self.dark_hover}; font-size: {self.font_size}px;}}
+           QListView::item:selected {{ background-color: {self.dark_pressed}; color: {self.dark_font_color}; border-left: 1px solid #3058a4; font-size: {self.font_size}px;}}
            QStackedWidget {{ background-color: {self.dark_content_bgcolor}; font-size: {self.font_size}px;}}
            QSplitter::handle {{ background-color: {self.dark_hover}; }}
+           QLineEdit#navigationSearch {{ background-color: {self.dark_hover}; color: {self.dark_font_color}; border: none; border-radius: 6px; padding: 4px; margin: 2px; font-size: {self.font_size}px;}}
            {self.common_button_styles(self.dark_navi_button_bg, self.dark_font_color)}
            {self.common_label_styles(self.dark_font_color)}
            {self.common_input_styles(self.dark_navi_bgcolor, self.dark_font_color)}
@@ -136,12 +252,13 @@ class StyleManager:
     def bright_mode_navigation_stylesheet(self):
         return f"""
            QWidget {{ background-color: {self.bright_navi_bgcolor}; }}
-           QListWidget {{ border: none; outline: 0; background-color: {self.bright_navi_bgcolor}; color: {self.bright_font_color}; font-size: {self.font_size}px;}}
-           QListWidget::item {{ border: none; padding-left: 5px; padding-top: 5px; font-size: {self.font_size}px;}}
-           QListWidget::item:hover {{ background-color: {self.bright_hover}; font-size: {self.font_size}px;}}
-           QListWidget::item:selected {{ background-color: {self.bright_pressed}; color: {self.bright_font_color}; border-left: 1px solid blue; font-size: {self.font_size}px;}}
+           QListView {{ border: none; outline: 0; background-color: {self.bright_navi_bgcolor}; color: {self.bright_font_color}; font-size: {self.font_size}px;}}
+           QListView::item {{ border: none; padding-left: 5px; padding-top: 5px; font-size: {self.font_size}px;}}
+           QListView::item:hover {{ background-color: {self.bright_hover}; font-size: {self.font_size}px;}}
+           QListView::item:selected {{ background-color: {self.bright_pressed}; color: {self.bright_font_color}; border-left: 1px solid blue; font-size: {self.font_size}px;}}
            QStackedWidget {{ background-color: {self.bright_content_bgcolor}; font-size: {self.font_size}px;}}
            QSplitter::handle {{ background-color: #E0E0E0; }}
+           QLineEdit#navigationSearch {{ background-color: {self.bright_hover}; color: {self.bright_font_color}; border: none; border-radius: 6px; padding: 4px; margin: 2px; font-size: {self.font_size}px;}}
            {self.common_button_styles(self.bright_navi_button_bg, self.bright_font_color)}
            {self.common_label_styles(self.bright_font_color)}
            {self.common_input_styles(self.bright_navi_bgcolor, self.bright_font_color)}
@@ -285,7 +402,17 @@ class StyleManager:
                 background-color: {self.dark_hover};
             }}
             {self.common_table_view_styles(self.dark_navi_bgcolor, self.dark_font_color)}
-            QDateEdit {{
+            QProgressBar {{
+                background-color: {self.dark_navi_bgcolor};
+                border: none;
+                border-radius: 4px;
+                max-height: 8px;
+            }}
+            QProgressBar::chunk {{
+                background-color: #0078d7;
+                border-radius: 4px;
+            }}
+            QDateEdit, QComboBox {{
                 background-color: {self.dark_navi_bgcolor};
                 color: {self.dark_font_color};
                 font-size: {self.font_size}px;
@@ -316,7 +443,17 @@ class StyleManager:
                 background-color: {self.bright_pressed};
             }}
             {self.common_table_view_styles(self.bright_navi_bgcolor, self.bright_font_color)}
-            QDateEdit {{
+            QProgressBar {{
+                background-color: {self.bright_navi_bgcolor};
+                border: none;
+                border-radius: 4px;
+                max-height: 8px;
+            }}
+            QProgressBar::chunk {{
+                background-color: #0078d7;
+                border-radius: 4px;
+            }}
+            QDateEdit, QComboBox {{
                 background-color: {self.bright_navi_bgcolor};
                 color: {self.bright_font_color};
                 font-size: {self.font_size}px;
@@ -0,0 +1,170 @@
+"""On-disk cache of parsed tables, reopened as memory-mapped .npy columns."""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .icon_store import atomic_write
+
+
+class Fingerprint(NamedTuple):
+    """Identity of a source file: where it is, its size and modification time, and a digest of its contents."""
+    source: str
+    size: int
+    mtime_ns: int
+    digest: str
+
+
+def file_digest(path: str, block_size: int = 1 << 20) -> str:
+    """Return the BLAKE2b digest of a file; hashlib releases the GIL while hashing each block."""
+    digest = hashlib.blake2b(digest_size=20)
+    with open(path, "rb") as file:
+        for block in iter(lambda: file.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def default_cache_directory() -> str:
+    from PySide6.QtCore import QStandardPaths
+    return os.path.join(QStandardPaths.writableLocation(QStandardPaths.GenericCacheLocation),
+                        "my-pyside6-dashboard", "tables")
+
+
+def _stored_nbytes(column: np.ndarray) -> int:
+    """Return the size of a column once stored, without converting it; text takes 4 bytes per character of its longest cell."""
+    if column.dtype.kind != "O":
+        return column.nbytes
+    return 4 * max(max(map(len, map(str, column)), default=0), 1) * len(column)
+
+
+class TableCache:
+    """Parsed tables stored as one .npy file per column and opened again with np.load(mmap_mode="r").
+
+    Entries are named by the digest of the source file and remember its path, size and modification
+    time: an unchanged file is found from os.stat alone, a touched or copied one by hashing it, and
+    reopening either maps the columns without parsing anything. Least recently used entries are
+    evicted once the cache exceeds max_bytes. Safe to use from several threads.
+    """
+    index_name = "index.json"
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: int = 2 << 30):
+        self.directory = directory or default_cache_directory()
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.RLock()
+        self._index: Optional[Dict[str, dict]] = None  # Digest -> entry, read on first use
+
+    def find(self, path: str) -> Tuple[Fingerprint, Optional[Tuple[List[str], List[np.ndarray]]]]:
+        """Return the file's fingerprint and its cached (names, columns), or None on a miss."""
+        stat = os.stat(path)
+        source = os.path.abspath(path)
+        with self._lock:
+            digest = next((digest for digest, entry in self._entries().items()
+                           if (entry["source"], entry["size"], entry["mtime_ns"]) == (source, stat.st_size, stat.st_mtime_ns)),
+                          None)
+        if digest is None:
+            digest = file_digest(path)
+        fingerprint = Fingerprint(source, stat.st_size, stat.st_mtime_ns, digest)
+        with self._lock:
+            entry = self._entries().get(digest)
+            if entry is not None:
+                try:
+                    table = self._open(digest, entry)
+                except (OSError, ValueError):  # Damaged or partly deleted; parse the file again
+                    self._remove(digest)
+                    self._save_index()
+                else:
+                    self.hits += 1
+                    entry.update(source=source, size=stat.st_size, mtime_ns=stat.st_mtime_ns, last_used=time.time())
+                    self._save_index()
+                    return fingerprint, table
+            self.misses += 1
+        return fingerprint, None
+
+    def store(self, fingerprint: Fingerprint, names: Sequence[str], columns: Sequence[np.ndarray]) -> bool:
+        """Write a parsed table; returns False when it alone is larger than the cache."""
+        size = sum(_stored_nbytes(column) for column in columns)
+        if size > self.max_bytes:
+            return False
+        os.makedirs(self.directory, exist_ok=True)
+        staging = tempfile.mkdtemp(dir=self.directory, prefix=".", suffix=".tmp")
+        try:
+            for position, column in enumerate(columns):
+                # Text columns are written as fixed-width unicode, since object arrays cannot be memory-mapped
+                array = column.astype(str) if column.dtype.kind == "O" else column
+                np.save(os.path.join(staging, f"{position}.npy"), array)
+                del array
+            with self._lock:
+                self._remove(fingerprint.digest)
+                os.replace(staging, os.path.join(self.directory, fingerprint.digest))
+                self._entries()[fingerprint.digest] = {
+                    "source": fingerprint.source, "size": fingerprint.size, "mtime_ns": fingerprint.mtime_ns,
+                    "names": list(names), "bytes": size, "last_used": time.time(),
+                }
+                self._evict(keep=fingerprint.digest)
+                self._save_index()
+        except BaseException:
+            shutil.rmtree(staging, ignore_errors=True)
+            raise
+        return True
+
+    def total_bytes(self) -> int:
+        with self._lock:
+            return sum(entry["bytes"] for entry in self._entries().values())
+
+    def info(self) -> Dict[str, int]:
+        """Return the hit and miss counts of this session and the size of the cache."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "entries": len(self._entries()),
+                    "bytes": self.total_bytes(), "max_bytes": self.max_bytes}
+
+    def clear(self) -> None:
+        with self._lock:
+            for digest in list(self._entries()):
+                self._remove(digest)
+            self._save_index()
+
+    def _open(self, digest: str, entry: dict) -> Tuple[List[str], List[np.ndarray]]:
+        directory = os.path.join(self.directory, digest)
+        columns = [np.load(os.path.join(directory, f"{position}.npy"), mmap_mode="r")
+                   for position in range(len(entry["names"]))]
+        return list(entry["names"]), columns
+
+    def _evict(self, keep: str) -> None:
+        entries = self._entries()
+        total = sum(entry["bytes"] for entry in entries.values())
+        for digest in sorted(entries, key=lambda digest: entries[digest]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            if digest != keep:
+                total -= entries[digest]["bytes"]
+                self._remove(digest)
+
+    def _remove(self, digest: str) -> None:
+        directory = os.path.join(self.directory, digest)
+        try:
+            if os.path.isdir(directory):
+                shutil.rmtree(directory)
+        except OSError:
+            return  # Still mapped on a platform that forbids deleting it; retried on a later eviction
+        self._entries().pop(digest, None)
+
+    def _entries(self) -> Dict[str, dict]:
+        if self._index is None:
+            try:
+                with open(os.path.join(self.directory, self.index_name), "r", encoding="utf-8") as file:
+                    self._index = json.load(file)
+            except (OSError, ValueError):
+                self._index = {}
+        return self._index
+
+    def _save_index(self) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        atomic_write(os.path.join(self.directory, self.index_name), json.dumps(self._entries(), indent=1).encode("utf-8"))
@@ -0,0 +1,69 @@
+import math
+import time
+
+from PySide6.QtCore import QObject, Qt, QTimer
+from PySide6.QtGui import QGuiApplication
+
+_NOTHING = object()
+
+
+def frame_interval(widget=None) -> float:
+    """Seconds between two frames of the screen showing widget, or of the primary screen."""
+    screen = widget.screen() if widget is not None else QGuiApplication.primaryScreen()
+    refresh_rate = screen.refreshRate() if screen is not None else 0
+    return 1.0 / (refresh_rate if refresh_rate > 0 else 60.0)
+
+
+class FrameCoalescer(QObject):
+    """Hands the latest of a burst of values to a callback, at most once per display frame.
+
+    The first value after a quiet frame is applied right away; values arriving later in the same
+    frame replace each other and only the last one is applied, when the frame is over.
+    """
+
+    slack = 0.9  # Timer and input ticks jitter around the refresh interval; this close counts as a frame
+
+    def __init__(self, callback, interval=None, parent=None):
+        super().__init__(parent)
+        self.callback = callback
+        self.interval = frame_interval() if interval is None else interval  # Seconds; 0 applies every value
+        self.submitted = 0
+        self.applied = 0
+        self._pending = _NOTHING
+        self._last_applied = None
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.PreciseTimer)
+        self._timer.timeout.connect(self.flush)
+
+    def submit(self, value) -> None:
+        """Queue value, replacing any value not applied yet."""
+        self.submitted += 1
+        self._pending = value
+        if self._timer.isActive():
+            return
+        remaining = 0.0
+        if self._last_applied is not None:
+            remaining = self.interval * self.slack - (time.perf_counter() - self._last_applied)
+        if remaining <= 0:
+            self.flush()
+        else:
+            self._timer.start(math.ceil(remaining * 1000))
+
+    def flush(self) -> None:
+        """Apply the queued value now, if there is one."""
+        self._timer.stop()
+        if self._pending is _NOTHING:
+            return
+        value, self._pending = self._pending, _NOTHING
+        self._last_applied = time.perf_counter()
+        self.applied += 1
+        self.callback(value)
+
+    def cancel(self) -> None:
+        """Drop the queued value without applying it."""
+        self._timer.stop()
+        self._pending = _NOTHING
+
+    def is_pending(self) -> bool:
+        return self._pending is not _NOTHING
@@ -3,12 +3,55 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QIcon
 from dashboard_components.icon import SVGIconManager
 from dashboard_components.style import StyleManager
+from dashboard_components.throttle import FrameCoalescer
+
+
+class WindowDragger:
+    """Moves a frameless window by mouse drag.
+
+    The first move of a drag hands it to the window manager through QWindow.startSystemMove where the
+    platform supports it. Otherwise the window follows the cursor, moved at most once per display frame.
+    """
+
+    def __init__(self, window, system_move=True):
+        self.window = window
+        self.system_move = system_move
+        self.drag_position = None  # Cursor offset from the window's top-left corner during a manual drag
+        self.system_moving = False
+        self.move_coalescer = FrameCoalescer(self.window.move, parent=window)
+
+    def press(self, event):
+        if event.button() != Qt.LeftButton:
+            return False
+        self.drag_position = event.globalPosition().toPoint() - self.window.frameGeometry().topLeft()
+        self.system_moving = False
+        return True
+
+    def move(self, event):
+        if self.drag_position is None or not event.buttons() & Qt.LeftButton:
+            return False
+        if self.system_moving:
+            return True
+        # Started on the first move rather than the press so double-clicks still reach the widget
+        handle = self.window.windowHandle()
+        if self.system_move and handle is not None and handle.startSystemMove():
+            self.system_moving = True
+            return True
+        self.move_coalescer.submit(event.globalPosition().toPoint() - self.drag_position)
+        return True
+
+    def release(self, event):
+        self.move_coalescer.flush()
+        self.drag_position = None
+        self.system_moving = False
+
 
 class CustomTitleBar(QWidget):
     def __init__(self, style_manager, icon_manager=None, parent=None, button_size=30):
         super().__init__(parent)
         self.style_manager = style_manager
         self.icon_manager = icon_manager  # Pass the icon manager to manage icons
+        self.setObjectName("titleBar")
         self.setFixedHeight(30)
         self.button_size = button_size
 
@@ -42,13 +85,13 @@ class CustomTitleBar(QWidget):
         layout.addWidget(self.close_button)
 
         self.parent = parent
-        self.is_maximized = False
+        self.dragger = WindowDragger(parent) if parent is not None else None  # Nothing to drag without a window
 
         self.applyStyles()
 
     def applyStyles(self):
         """Apply styles using the style manager."""
-        self.setStyleSheet(self.style_manager.get_titlebar_stylesheet())
+        self.style_manager.apply_stylesheet(self, self.style_manager.get_titlebar_stylesheet)
 
     def refresh_icons(self):
         """Refresh the icons with the current fill color."""
@@ -56,26 +99,37 @@ class CustomTitleBar(QWidget):
         self.maximize_button.setIcon(QIcon(self.icon_manager.render_icon("Maximize", size=10)))
         self.close_button.setIcon(QIcon(self.icon_manager.render_icon("Close", size=10)))
 
+    def prerender_icons(self, fills):
+        """Rasterize the window button icons for the given fills in the background."""
+        self.icon_manager.prerender(["Minimize", "Maximize", "Close"], sizes=[10], fills=fills)
+
     def minimize_window(self):
         self.parent.showMinimized()
 
+    @property
+    def is_maximized(self):
+        return bool(self.parent.windowState() & Qt.WindowMaximized)
+
     def maximize_restore_window(self):
-        if self.is_maximized:
-            self.parent.showNormal()
-            self.is_maximized = False
-        else:
-            self.parent.showMaximized()
-            self.is_maximized = True
+        # One window state change; showMaximized/showNormal also re-show the window and relayout it twice
+        self.parent.setWindowState(self.parent.windowState() ^ Qt.WindowMaximized)
 
     def close_window(self):
         self.parent.close()
 
     def mousePressEvent(self, event):
-        if event.button() == Qt.LeftButton:
-            self.parent.drag_position = event.globalPosition().toPoint() - self.parent.frameGeometry().topLeft()
+        if self.dragger is not None and self.dragger.press(event):
             event.accept()
 
     def mouseMoveEvent(self, event):
-        if event.buttons() == Qt.LeftButton:
-            self.parent.move(event.globalPosition().toPoint() - self.parent.drag_position)
+        if self.dragger is not None and self.dragger.move(event):
+            event.accept()
+
+    def mouseReleaseEvent(self, event):
+        if self.dragger is not None:
+            self.dragger.release(event)
+
+    def mouseDoubleClickEvent(self, event):
+        if event.button() == Qt.LeftButton:
+            self.maximize_restore_window()
             event.accept()
\ No newline at end of file
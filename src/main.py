@@ -1,22 +1,99 @@
 #!/Users/huongnguyen105/Desktop/Tu-Anh/my-pyside6-dashboard/venv/bin/python
+import time
+_importStart = time.perf_counter()
 import sys
 import os
 from PySide6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QLabel, QSizeGrip
-from PySide6.QtCore import Qt, QRect
-from PySide6.QtGui import QIcon, QFont, QFontDatabase
+from PySide6.QtCore import Qt, QEvent, QRect, QTimer, Signal
+from PySide6.QtGui import QIcon, QFont, QFontDatabase, QKeySequence, QShortcut
 from dashboard_components.style import StyleManager
 from dashboard_components.navbar import CustomNavigationContentWidget
-from dashboard_components.titlebar import CustomTitleBar
+from dashboard_components.titlebar import CustomTitleBar, WindowDragger
 from dashboard_components.sidegrip import SideGrip
 from dashboard_components.icon import SVGIconManager, SVGTemplateGenerator
 
+FONT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                         "fonts", "ttf", "JetBrainsMono-Regular.ttf")
+
+
+class StartupProfile:
+    """Durations of the startup phases, each measured from the end of the previous one."""
+
+    def __init__(self, start: float):
+        self.phases = []
+        self._last = start
+
+    def mark(self, phase: str) -> None:
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last))
+        self._last = now
+
+    def report(self, stream=None) -> None:
+        stream = stream or sys.stderr
+        for phase, seconds in self.phases:
+            print(f"{phase:<18} {seconds * 1000:8.1f} ms", file=stream)
+        print(f"{'total':<18} {sum(seconds for _, seconds in self.phases) * 1000:8.1f} ms", file=stream)
+
+
+def load_application_font(app: QApplication) -> None:
+    """Register the bundled font and make it the application font, if it is present."""
+    font_id = QFontDatabase.addApplicationFont(FONT_PATH)
+    if font_id != -1:
+        font_family = QFontDatabase.applicationFontFamilies(font_id)[0]
+        app.setFont(QFont(font_family))
+
+
 class MainWindow(QMainWindow):
     _gripSize = 8
+    _iconFills = {"dark": "#FFFFFF", "bright": "#000000"}
+    _maxResidentPages = 8  # Lazily built pages kept alive before the least recently shown one is unloaded
+    _systemResize = False  # Let the platform resize the window from the side grips where it supports it
+    firstPaint = Signal()  # Emitted once, right after the window's first paint pass
 
-    def __init__(self):
+    def __init__(self, styling_mode: str = "widget", startup_profile: StartupProfile = None, instrument: bool = False):
         super().__init__()
+        self.styling_mode = styling_mode
+        self.startup_profile = startup_profile
+        self._firstPaintSeen = False
+        self.instrumentation = None
+        if instrument:
+            self.setupInstrumentation()
         self.icon_manager = SVGIconManager()
+        self.markStartup("icon load")
         self.initUI()
+        if instrument:
+            self.setupInstrumentationOverlay()
+
+    def setupInstrumentation(self) -> None:
+        """Start measuring the GUI thread; run before initUI so the navigation pane connects to the timed toggle_mode."""
+        from dashboard_components.instrumentation import Instrumentation
+
+        self.instrumentation = Instrumentation(parent=self)
+        self.instrumentation.install()
+        self.instrumentation.wrap(self, "toggle_mode")
+        self.instrumentation.wrap(self, "updateGrips")
+
+    def setupInstrumentationOverlay(self) -> None:
+        """Time the icon refreshes and add the overlay to the title bar, toggled with Ctrl+Shift+I."""
+        from dashboard_components.instrumentation import InstrumentationOverlay
+
+        self.instrumentation.wrap(self.navigationContentWidget, "refresh_icons", "navigation.refresh_icons")
+        self.instrumentation.wrap(self.titleBar, "refresh_icons", "titleBar.refresh_icons")
+        self.instrumentationOverlay = InstrumentationOverlay(self.instrumentation, self.titleBar)
+        self.instrumentationOverlay.hide()
+        self.titleBar.layout().insertWidget(1, self.instrumentationOverlay)
+        QShortcut(QKeySequence("Ctrl+Shift+I"), self, self.instrumentationOverlay.toggle)
+
+    def closeEvent(self, event) -> None:
+        if self.instrumentation is not None:
+            self.instrumentation.uninstall()
+        if self.processesPage is not None:
+            self.processesPage.ingestor.cancel()  # Lets the worker return before the thread pool is joined
+        super().closeEvent(event)
+
+    def markStartup(self, phase: str) -> None:
+        if self.startup_profile is not None:
+            self.startup_profile.mark(phase)
 
     def initUI(self) -> None:
         """Initialize the user interface."""
@@ -29,7 +106,14 @@ class MainWindow(QMainWindow):
         mainLayout.setContentsMargins(0, 0, 0, 0)
         mainLayout.setSpacing(0)
 
+        self.setObjectName("mainWindow")
         self.style_manager = StyleManager()
+        self.style_manager.styling_mode = self.styling_mode
+        self.buildStylesheets()
+        self.markStartup("stylesheet build")
+        if self.styling_mode == "palette":
+            self.setupPaletteTheming()
+        self.windowDragger = WindowDragger(self)
         self.setupTitleBar(mainLayout)
         self.setupNavigationContent(mainLayout)
 
@@ -37,6 +121,44 @@ class MainWindow(QMainWindow):
         self.navigationContentWidget.switchToPage(0)  # Show "Home Page"
         self.applyStyles()
         self.addGrips()
+        self.markStartup("widgets")
+        # Icons of the other theme are rasterized after the first paint; see onFirstPaint
+
+    def buildStylesheets(self) -> None:
+        """Build the stylesheets (or palette) of the styling mode up front; components reuse the cached result."""
+        if self.styling_mode == "application":
+            self.style_manager.get_application_stylesheet()
+        elif self.styling_mode == "palette":
+            self.style_manager.get_palette()
+        else:
+            self.style_manager.get_navigation_stylesheet()
+            self.style_manager.get_titlebar_stylesheet()
+            self.style_manager.get_mainwindow_stylesheet()
+
+    def event(self, event) -> bool:
+        if event.type() == QEvent.Paint and not self._firstPaintSeen:
+            self._firstPaintSeen = True
+            QTimer.singleShot(0, self.onFirstPaint)  # Runs once the whole paint pass is done
+        return super().event(event)
+
+    def onFirstPaint(self) -> None:
+        """Start the work deferred until the window is on screen."""
+        self.markStartup("first paint")
+        self.firstPaint.emit()
+        self.prerenderThemeIcons()
+
+    def setupPaletteTheming(self) -> None:
+        """Prepare the application for palette-only theming.
+
+        Fusion draws every control from the palette. No stylesheet is installed: Qt resolves
+        palette() references in stylesheets at polish time and pins the palette of every polished
+        widget, so a stylesheet would defeat theme switches through QApplication.setPalette.
+        """
+        app = QApplication.instance()
+        app.setStyle("Fusion")
+        font = app.font()
+        font.setPixelSize(self.style_manager.font_size)
+        app.setFont(font)
 
     def setupTitleBar(self, layout: QVBoxLayout) -> None:
         """Set up the custom title bar."""
@@ -44,51 +166,95 @@ class MainWindow(QMainWindow):
         layout.addWidget(self.titleBar)
 
     def setupNavigationContent(self, layout: QVBoxLayout) -> None:
-        """Set up the custom navigation and content widget."""
-        self.navigationContentWidget = CustomNavigationContentWidget(self.style_manager, self.icon_manager, self)
+        """Set up the custom navigation and content widget; pages other than Home are built on first use."""
+        self.navigationContentWidget = CustomNavigationContentWidget(self.style_manager, self.icon_manager, self,
+                                                                     prewarm_pages=True, animated_collapse=True,
+                                                                     max_resident_pages=self._maxResidentPages)
+        self.navigationContentWidget.pageUnloaded.connect(self.onPageUnloaded)
+        self.iconEditorWidget = None
+        self.processesPage = None
         self.navigationContentWidget.addPageWithNavigationItem(QLabel("Home Page"),
                                                                QIcon(self.icon_manager.render_icon("Home")), "Home",
                                                                "Home")
-        self.navigationContentWidget.addPageWithNavigationItem(QLabel("Processes Page"),
+        self.navigationContentWidget.addPageWithNavigationItem(self.buildProcessesPage,
                                                                QIcon(self.icon_manager.render_icon("Folder")),
                                                                "Processes", "Folder")
-        self.iconEditorWidget = SVGTemplateGenerator(self.icon_manager, self.style_manager, self)
-        self.navigationContentWidget.addPageWithNavigationItem(self.iconEditorWidget,
+        self.navigationContentWidget.addPageWithNavigationItem(self.buildIconEditor,
                                                                QIcon(self.icon_manager.render_icon("Setting")),
                                                                "Settings", "Setting", align_bottom=True)
-        self.navigationContentWidget.addPageWithNavigationItem(QLabel("Info Page"),
+        self.navigationContentWidget.addPageWithNavigationItem(lambda: QLabel("Info Page"),
                                                                QIcon(self.icon_manager.render_icon("Info")), "Info",
                                                                "Info", align_bottom=True)
         layout.addWidget(self.navigationContentWidget)
 
+    def onPageUnloaded(self, page_widget: QWidget) -> None:
+        """Forget references to pages the navigation widget is about to destroy."""
+        if page_widget is self.iconEditorWidget:
+            self.iconEditorWidget = None
+        elif page_widget is self.processesPage:
+            self.processesPage.ingestor.cancel()
+            self.processesPage = None
+
+    def buildProcessesPage(self) -> QWidget:
+        """Construct the spreadsheet page the first time it is shown; NumPy is only imported then."""
+        from dashboard_components.processes import ProcessesPage
+
+        self.processesPage = ProcessesPage(self.style_manager, self)
+        return self.processesPage
+
+    def buildIconEditor(self) -> SVGTemplateGenerator:
+        """Construct the icon editor page the first time it is shown."""
+        self.iconEditorWidget = SVGTemplateGenerator(self.icon_manager, self.style_manager, self)
+        return self.iconEditorWidget
+
+    def prerenderThemeIcons(self) -> None:
+        """Rasterize the icons of both themes in the background so toggle_mode only swaps cached pixmaps."""
+        fills = list(self._iconFills.values())
+        self.navigationContentWidget.prerender_icons(fills)
+        self.titleBar.prerender_icons(fills)
+
     def applyStyles(self) -> None:
         """Apply styles using the style manager."""
-        self.setStyleSheet(self.style_manager.get_mainwindow_stylesheet())
+        if self.style_manager.styling_mode == "palette":
+            # Swapping the palette repaints with the new colors without parsing or polishing stylesheets;
+            # Qt ignores setting the palette it already has
+            QApplication.instance().setPalette(self.style_manager.get_palette())
+        # In application mode: one polish pass over the whole window instead of one per component subtree.
+        # Setting the same sheet through QApplication.setStyleSheet re-polishes every widget several times and
+        # measured slower.
+        self.style_manager.apply_stylesheet(self, self.style_manager.get_application_stylesheet, "application")
+        self.style_manager.apply_stylesheet(self, self.style_manager.get_mainwindow_stylesheet)
 
     def addGrips(self) -> None:
         """Add side and corner grips for resizing."""
         self.sideGrips = [
-            SideGrip(self, Qt.LeftEdge),
-            SideGrip(self, Qt.TopEdge),
-            SideGrip(self, Qt.RightEdge),
-            SideGrip(self, Qt.BottomEdge),
+            SideGrip(self, Qt.LeftEdge, self._systemResize),
+            SideGrip(self, Qt.TopEdge, self._systemResize),
+            SideGrip(self, Qt.RightEdge, self._systemResize),
+            SideGrip(self, Qt.BottomEdge, self._systemResize),
         ]
         self.cornerGrips = [QSizeGrip(self) for _ in range(4)]
         for grip in self.cornerGrips + self.sideGrips:
             grip.setStyleSheet("background-color: transparent;")
+            grip.raise_()  # Created after the central widget; raising once keeps them above it
+        self.updateGrips()
 
     def toggle_mode(self) -> None:
         """Toggle the mode and update all components."""
         self.style_manager.toggle_mode()
         print(self.style_manager.current_mode)
         print(self.icon_manager.icon_fill)
-        self.icon_manager.set_icon_fill("#FFFFFF" if self.style_manager.current_mode == "dark" else "#000000")
+        self.icon_manager.set_icon_fill(self._iconFills[self.style_manager.current_mode])
         self.navigationContentWidget.refresh_icons()
         self.titleBar.refresh_icons()
-        self.iconEditorWidget.display_selected_icon()
+        if self.iconEditorWidget is not None:
+            self.iconEditorWidget.display_selected_icon()
         self.titleBar.applyStyles()
         self.navigationContentWidget.applyStyles()
-        self.iconEditorWidget.applyStyles()
+        if self.iconEditorWidget is not None:
+            self.iconEditorWidget.applyStyles()
+        if self.processesPage is not None:
+            self.processesPage.applyStyles()
         self.applyStyles()
 
     def resizeEvent(self, event) -> None:
@@ -106,26 +272,60 @@ class MainWindow(QMainWindow):
         self.sideGrips[1].setGeometry(inRect.left(), 0, inRect.width(), self._gripSize)
         self.sideGrips[2].setGeometry(inRect.left() + inRect.width(), inRect.top(), self._gripSize, inRect.height())
         self.sideGrips[3].setGeometry(self._gripSize, inRect.top() + inRect.height(), inRect.width(), self._gripSize)
-        [grip.raise_() for grip in self.sideGrips + self.cornerGrips]
 
     def mousePressEvent(self, event) -> None:
         """Capture the mouse press event to enable window dragging."""
-        if event.button() == Qt.LeftButton:
-            self.drag_position = event.globalPosition().toPoint() - self.frameGeometry().topLeft()
+        if self.windowDragger.press(event):
             event.accept()
 
     def mouseMoveEvent(self, event) -> None:
         """Capture the mouse move event to enable window dragging."""
-        if event.buttons() == Qt.LeftButton:
-            self.move(event.globalPosition().toPoint() - self.drag_position)
+        if self.windowDragger.move(event):
             event.accept()
 
-if __name__ == "__main__":
-    app = QApplication(sys.argv)
-    font_id = QFontDatabase.addApplicationFont("fonts/ttf/JetBrainsMono-Regular.ttf")
-    if font_id != -1:
-        font_family = QFontDatabase.applicationFontFamilies(font_id)[0]
-        app.setFont(QFont(font_family))
-    window = MainWindow()
+    def mouseReleaseEvent(self, event) -> None:
+        self.windowDragger.release(event)
+
+_importEnd = time.perf_counter()
+
+
+def main(argv=None) -> int:
+    import argparse  # Parsing the command line is not part of the window's import cost
+
+    parser = argparse.ArgumentParser(description="PySide6 dashboard")
+    parser.add_argument("--styling", choices=["widget", "application", "palette"], default="widget",
+                        help="apply stylesheets per component subtree, once as one scoped sheet on the window, "
+                             "or theme through QPalette only")
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="print how long each startup phase took, up to the work deferred past the first paint")
+    parser.add_argument("--instrument", action="store_true",
+                        help="time event dispatch and handlers, log GUI stalls with their stack and add an overlay "
+                             "to the title bar (Ctrl+Shift+I)")
+    args, qt_args = parser.parse_known_args(argv)
+
+    profile = StartupProfile(_importEnd)
+    profile.phases.append(("imports", _importEnd - _importStart))
+    if args.instrument:
+        from dashboard_components.instrumentation import InstrumentedApplication
+        app = InstrumentedApplication(sys.argv[:1] + qt_args)
+    else:
+        app = QApplication(sys.argv[:1] + qt_args)
+    profile.mark("QApplication")
+    window = MainWindow(styling_mode=args.styling, startup_profile=profile, instrument=args.instrument)
     window.show()
-    sys.exit(app.exec())
\ No newline at end of file
+    profile.mark("show")
+
+    def finishStartup():
+        # Registering the font re-polishes every widget, so it waits until the window is on screen
+        load_application_font(app)
+        profile.mark("deferred fonts")
+        window.startup_profile = None
+        if args.startup_profile:
+            profile.report()
+
+    window.firstPaint.connect(finishStartup)
+    return app.exec()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
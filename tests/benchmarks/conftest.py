@@ -0,0 +1,25 @@
+"""Fixtures of the headless benchmark suite; see the Benchmarks section of the README."""
+import os
+
+import pytest
+
+
+@pytest.fixture
+def icon_dir(icon_file, monkeypatch):
+    """Work in the directory of a private icons.txt copy, which MainWindow loads by relative path."""
+    monkeypatch.chdir(os.path.dirname(icon_file))
+    return os.path.dirname(icon_file)
+
+
+@pytest.fixture
+def main_window(qapp, icon_dir):
+    from main import MainWindow
+
+    window = MainWindow()
+    window.resize(1000, 700)
+    window.show()
+    qapp.processEvents()
+    yield window
+    window.close()
+    window.deleteLater()
+    qapp.processEvents()
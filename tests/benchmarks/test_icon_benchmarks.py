@@ -0,0 +1,44 @@
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+pytestmark = pytest.mark.benchmark  # Deselected by default; see pytest.ini
+
+from dashboard_components.icon import SVGIconManager
+
+
+@pytest.fixture
+def icon_manager(qapp, icon_file):
+    manager = SVGIconManager(icon_file, cache_size=1024)  # Imports icons.txt into icons.jsonl once
+    yield manager
+    manager.icons.close()
+
+
+def test_load_icons(benchmark, icon_manager):
+    path = icon_manager.icons.file_path
+
+    def load():
+        manager = SVGIconManager(path)
+        names = list(manager.icons)
+        manager.icons.close()
+        return names
+
+    assert benchmark(load)
+
+
+def test_render_all_icons_uncached(benchmark, icon_manager):
+    names = list(icon_manager.icons)
+
+    def render():
+        icon_manager.clear_cache()
+        icon_manager._renderer_pool.clear()
+        return [icon_manager.render_icon(name) for name in names]
+
+    assert all(pixmap is not None for pixmap in benchmark(render))
+
+
+def test_render_all_icons_cached(benchmark, icon_manager):
+    names = list(icon_manager.icons)
+    for name in names:
+        icon_manager.render_icon(name)
+    benchmark(lambda: [icon_manager.render_icon(name) for name in names])
+    assert icon_manager.cache_info()["hits"] > 0
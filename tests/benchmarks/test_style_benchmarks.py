@@ -0,0 +1,23 @@
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+pytestmark = pytest.mark.benchmark  # Deselected by default; see pytest.ini
+
+from dashboard_components.style import StyleManager
+
+
+@pytest.mark.parametrize("styling", ["widget", "application"])
+def test_stylesheet_generation(benchmark, styling):
+    def build():
+        style_manager = StyleManager()  # Fresh manager, so nothing comes from the stylesheet cache
+        if styling == "application":
+            return style_manager.get_application_stylesheet()
+        return style_manager.get_stylesheet()
+
+    assert benchmark(build)
+
+
+def test_cached_stylesheet_lookup(benchmark):
+    style_manager = StyleManager()
+    style_manager.get_stylesheet()
+    assert benchmark(style_manager.get_stylesheet)
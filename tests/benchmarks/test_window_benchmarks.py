@@ -0,0 +1,78 @@
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+pytestmark = pytest.mark.benchmark  # Deselected by default; see pytest.ini
+
+from PySide6.QtCore import QEvent, QPointF, Qt
+from PySide6.QtGui import QIcon, QMouseEvent
+from PySide6.QtWidgets import QApplication, QLabel, QWidget
+
+from dashboard_components.icon import SVGIconManager
+from dashboard_components.navbar import CustomNavigationContentWidget
+from dashboard_components.style import StyleManager
+
+
+def test_main_window_construction(benchmark, qapp, icon_dir):
+    from main import MainWindow
+
+    def construct():
+        window = MainWindow()
+        window.deleteLater()
+        qapp.processEvents()
+
+    benchmark(construct)
+
+
+def test_toggle_mode(benchmark, qapp, main_window):
+    def toggle():
+        main_window.toggle_mode()
+        qapp.processEvents()
+
+    benchmark(toggle)
+
+
+class Host(QWidget):
+    def toggle_mode(self):
+        pass
+
+
+@pytest.mark.parametrize("items", [10, 500])
+def test_toggle_sidebar(benchmark, qapp, icon_file, items):
+    host = Host()
+    navigation = CustomNavigationContentWidget(StyleManager(), SVGIconManager(icon_file), host)
+    for i in range(items):
+        navigation.addPageWithNavigationItem(lambda i=i: QLabel(f"Page {i}"), QIcon(), f"Page {i}", "Home")
+    host.resize(1000, 700)
+    host.show()
+    qapp.processEvents()
+
+    def toggle():
+        navigation.toggle_sidebar()
+        qapp.processEvents()
+
+    benchmark(toggle)
+    host.deleteLater()
+
+
+@pytest.mark.parametrize("coalesced", [False, True], ids=["per-event", "coalesced"])
+def test_side_grip_resize_sequence(benchmark, qapp, main_window, coalesced):
+    grip = main_window.sideGrips[2]
+    if not coalesced:
+        grip.resizeCoalescer.interval = 0
+    origin = QPointF(grip.mapToGlobal(grip.rect().center()))
+
+    def send(event_type, x, buttons=Qt.LeftButton):
+        QApplication.sendEvent(grip, QMouseEvent(event_type, QPointF(1, 1), origin + QPointF(x, 0), Qt.LeftButton,
+                                                 buttons, Qt.NoModifier))
+
+    def drag():
+        # 100 moves as a 1,000 Hz mouse reports them during a tenth of a second
+        send(QEvent.MouseButtonPress, 0)
+        for step in range(100):
+            send(QEvent.MouseMove, step * 2)
+        send(QEvent.MouseButtonRelease, 200, Qt.NoButton)
+        qapp.processEvents()
+        main_window.resize(1000, 700)
+        qapp.processEvents()
+
+    benchmark(drag)
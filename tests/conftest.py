@@ -0,0 +1,27 @@
+import os
+import sys
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+sys.path.insert(0, os.path.join(REPO_ROOT, "src"))
+
+ICONS_PATH = os.path.join(REPO_ROOT, "icons.txt")
+
+
+@pytest.fixture(scope="session")
+def qapp():
+    from PySide6.QtWidgets import QApplication
+    app = QApplication.instance() or QApplication([])
+    yield app
+
+
+@pytest.fixture
+def icon_file(tmp_path):
+    """A private copy of the shipped icon set."""
+    path = tmp_path / "icons.txt"
+    with open(ICONS_PATH, "r", encoding="utf-8") as source:
+        path.write_text(source.read(), encoding="utf-8")
+    return str(path)
@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from dashboard_components.aggregate import AggregationEngine, factorize
+
+
+def engine():
+    aggregation = AggregationEngine()
+    aggregation.setColumns(
+        ["Date", "Status", "Amount", "Units"],
+        [np.array(["2024-01-01T08:00", "2024-01-01T17:00", "2024-01-02T09:00", "2024-01-03T10:00", "2024-01-03T11:00"],
+                  dtype="datetime64[m]"),
+         np.array(["open", "closed", "open", "open", "closed"], dtype=object),
+         np.array([10.0, 2.5, np.nan, 4.0, 1.0]),
+         np.array([1, 2, 3, 4, 5], dtype=np.int64)])
+    return aggregation
+
+
+def test_factorize_groups_dates_by_day():
+    keys, codes = factorize(np.array(["2024-01-02T10:00", "2024-01-01T00:00", "2024-01-02T23:00"], dtype="datetime64[m]"))
+    assert list(keys) == list(np.array(["2024-01-01", "2024-01-02"], dtype="datetime64[D]"))
+    assert list(codes) == [1, 0, 1]
+
+
+def test_group_by_functions():
+    aggregation = engine()
+    names, (days, counts) = aggregation.aggregate(0, "count")
+    assert names == ["Date", "count"] and list(counts) == [2, 1, 2]
+    _, (_, sums) = aggregation.aggregate(0, "sum", value=2)
+    assert list(sums) == [12.5, 0.0, 5.0]  # The NaN amount is skipped
+    names, (statuses, means) = aggregation.aggregate(1, "mean", value=2)
+    assert names == ["Status", "mean(Amount)"] and list(statuses) == ["closed", "open"]
+    assert list(means) == [1.75, 7.0]
+    _, (_, lowest) = aggregation.aggregate(1, "min", value=3)
+    _, (_, totals) = aggregation.aggregate(1, "sum", value=3)
+    assert list(lowest) == [2.0, 1.0] and totals.dtype == np.int64 and list(totals) == [7, 8]
+    with pytest.raises(ValueError):
+        aggregation.aggregate(1, "sum")
+    with pytest.raises(TypeError):
+        aggregation.aggregate(0, "sum", value=1)
+
+
+def test_pivot_and_filtered_rows_reuse_factorization():
+    aggregation = engine()
+    names, columns = aggregation.aggregate(0, "sum", value=3, pivot=1)
+    assert names == ["Date", "closed", "open"]
+    assert [list(column) for column in columns[1:]] == [[2, 0, 5], [1, 3, 4]]
+    assert aggregation.factorizations == 2
+
+    names, columns = aggregation.aggregate(0, "sum", value=3, pivot=1, rows=slice(2, 4))
+    assert names == ["Date", "open"] and list(columns[1]) == [3, 4]
+    _, (statuses, counts) = aggregation.aggregate(1, "count", rows=np.array([4, 0, 1]))
+    assert list(statuses) == ["closed", "open"] and list(counts) == [2, 1]
+    assert aggregation.factorizations == 2  # Only the rows changed
+
+    aggregation.setColumns(aggregation.names, [column[:2] for column in aggregation.columns])
+    aggregation.aggregate(1, "count")
+    assert aggregation.factorizations == 3
@@ -0,0 +1,59 @@
+import numpy as np
+import pytest
+from PySide6.QtCore import Qt
+
+from dashboard_components.columnar_model import ColumnarTableModel, sample_columns
+
+
+def test_cells_are_formatted_per_block(qapp):
+    names = ["Date", "Count", "Price", "Name"]
+    columns = [
+        np.array(["2024-01-05", "2024-02-10", "2024-03-15"], dtype="datetime64[D]"),
+        np.array([1, 2000, 3], dtype=np.int64),
+        np.array([1.5, 2.25, 1234.5], dtype=np.float32),
+        np.array(["a", "b", "c"], dtype=object),
+    ]
+    model = ColumnarTableModel(names, columns, block_rows=2, cache_blocks=2)
+    assert (model.rowCount(), model.columnCount()) == (3, 4)
+    assert model.headerData(2, Qt.Horizontal) == "Price" and model.headerData(0, Qt.Vertical) == "1"
+    assert model.index(1, 0).data() == "2024-02-10"
+    assert model.index(1, 1).data() == "2,000"
+    assert model.index(2, 2).data() == "1,234.50"
+    assert model.index(2, 3).data() == "c"
+    assert model.index(0, 2).data(Qt.TextAlignmentRole) & Qt.AlignRight
+
+    model.index(0, 0).data()
+    assert model.cache_info() == {"blocks": 2, "max_blocks": 2, "formatted": 5}
+
+
+def test_columns_must_have_equal_length(qapp):
+    with pytest.raises(ValueError):
+        ColumnarTableModel(["a", "b"], [np.zeros(2), np.zeros(3)])
+
+
+def test_large_model_formats_only_requested_blocks(qapp):
+    names, columns = sample_columns(1_000_000, 5)
+    model = ColumnarTableModel(names, columns)
+    assert model.rowCount() == 1_000_000
+    model.index(999_999, 4).data()
+    model.index(500_000, 0).data()
+    assert model.cache_info()["formatted"] == 2
+
+
+def test_append_rows_grows_and_promotes_columns(qapp):
+    model = ColumnarTableModel(["Id", "Date"], [np.array([1, 2]), np.array(["2024-01-01", "2024-01-02"], dtype="datetime64[D]")],
+                               block_rows=2)
+    inserted = []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append((first, last)))
+    assert model.index(1, 0).data() == "2"
+
+    model.appendRows([np.array([3]), np.array(["2024-01-03"], dtype="datetime64[D]")])
+    model.appendRows([np.array([4.5, 5.0]), np.array(["text", "more"], dtype=object)])
+    assert inserted == [(2, 2), (3, 4)]
+    assert model.rowCount() == 5
+    assert model.columnData(0).dtype == np.float64 and model.columnData(1).dtype == object
+    assert [model.index(row, 0).data() for row in range(5)] == ["1.00", "2.00", "3.00", "4.50", "5.00"]
+    assert model.index(2, 1).data() == "2024-01-03" and model.index(4, 1).data() == "more"
+
+    with pytest.raises(ValueError):
+        model.appendRows([np.array([1])])
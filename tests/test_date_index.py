@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+from PySide6.QtCore import Qt
+
+from dashboard_components.columnar_model import ColumnarTableModel
+from dashboard_components.date_index import DateIndex
+
+
+def days(*values):
+    return np.array(values, dtype="datetime64[D]")
+
+
+def test_sorted_column_queries_return_slices():
+    index = DateIndex(days("2024-01-01", "2024-01-01", "2024-01-03", "2024-01-05"))
+    assert index.order is None
+    assert index.bounds() == (np.datetime64("2024-01-01"), np.datetime64("2024-01-05"))
+    assert index.rows(np.datetime64("2024-01-01"), np.datetime64("2024-01-03")) == slice(0, 3)
+    assert index.rows(np.datetime64("2024-01-02"), np.datetime64("2024-01-04")) == slice(2, 3)
+    assert index.rows(np.datetime64("2024-01-04"), np.datetime64("2024-01-02")) == slice(3, 3)
+
+
+def test_unsorted_column_queries_return_rows_in_date_order():
+    dates = np.array(["2024-01-03T12:00", "NaT", "2024-01-01T08:00", "2024-01-02T23:59"], dtype="datetime64[m]")
+    index = DateIndex(dates)
+    assert len(index) == 3
+    assert index.bounds() == (np.datetime64("2024-01-01"), np.datetime64("2024-01-03"))
+    assert list(index.rows(np.datetime64("2024-01-02"), np.datetime64("2024-01-03"))) == [3, 0]
+    assert list(index.rows(np.datetime64("2020-01-01"), np.datetime64("2030-01-01"))) == [2, 3, 0]
+    with pytest.raises(TypeError):
+        DateIndex(np.arange(3))
+
+
+def test_model_row_map_shows_a_subset_without_copying(qapp):
+    model = ColumnarTableModel(["n"], [np.arange(1000, dtype=np.int64)], block_rows=16)
+    model.setRowMap(slice(100, 200))
+    assert model.rowCount() == 100 and model.sourceRowCount() == 1000
+    assert model.index(0, 0).data() == "100" and model.index(99, 0).data() == "199"
+    assert model.headerData(0, Qt.Vertical) == "101"
+
+    model.setRowMap(np.array([5, 900, 7]))
+    assert [model.index(row, 0).data() for row in range(3)] == ["5", "900", "7"]
+    with pytest.raises(RuntimeError):
+        model.appendRows([np.arange(2)])
+    model.setRowMap(None)
+    assert model.rowCount() == 1000
@@ -0,0 +1,135 @@
+from dashboard_components.icon import SVGIconManager
+
+
+def test_render_icon_reuses_cached_pixmap(qapp, icon_file):
+    manager = SVGIconManager(icon_file)
+    first = manager.render_icon("Home")
+    second = manager.render_icon("Home")
+    assert first.cacheKey() == second.cacheKey()
+    assert manager.cache_info()["hits"] == 1
+    assert manager.cache_info()["misses"] == 1
+
+
+def test_fill_change_is_a_separate_cache_entry(qapp, icon_file):
+    manager = SVGIconManager(icon_file)
+    manager.render_icon("Home")
+    manager.set_icon_fill("#000000")
+    manager.render_icon("Home")
+    manager.set_icon_fill("#FFFFFF")
+    manager.render_icon("Home")
+    assert manager.cache_info() == {"hits": 1, "misses": 2, "size": 2, "max_size": 256, "prerendered": 0}
+
+
+def test_cache_evicts_least_recently_used(qapp, icon_file):
+    manager = SVGIconManager(icon_file, cache_size=2)
+    manager.render_icon("Home")
+    manager.render_icon("Menu")
+    manager.render_icon("Home")
+    manager.render_icon("Folder")
+    manager.render_icon("Home")
+    manager.render_icon("Menu")
+    assert manager.cache_info()["hits"] == 2
+    assert manager.cache_info()["misses"] == 4
+
+
+def test_add_and_delete_invalidate_cached_pixmaps(qapp, icon_file):
+    manager = SVGIconManager(icon_file)
+    manager.render_icon("Home")
+    manager.add_icon("Home", manager.get_icon("Menu"))
+    manager.render_icon("Home")
+    assert manager.cache_info()["misses"] == 2
+    manager.delete_icon("Home")
+    assert manager.render_icon("Home") is None
+    assert manager.cache_info()["size"] == 0
+
+
+def test_renderer_is_parsed_once_and_tinted_per_fill(qapp, icon_file):
+    manager = SVGIconManager(icon_file)
+    manager.set_icon_fill("#FF0000")
+    red = manager.render_icon("Home").toImage()
+    renderer = manager.get_renderer("Home")
+    manager.set_icon_fill("#0000FF")
+    blue = manager.render_icon("Home").toImage()
+    assert manager.get_renderer("Home") is renderer
+    opaque = [(x, y) for x in range(16) for y in range(16) if red.pixelColor(x, y).alpha() == 255]
+    assert opaque
+    x, y = opaque[0]
+    assert red.pixelColor(x, y).red() == 255 and blue.pixelColor(x, y).blue() == 255
+
+
+def test_prerender_fills_both_themes_off_the_gui_thread(qapp, icon_file):
+    manager = SVGIconManager(icon_file)
+    assert manager.prerender(["Home", "Menu", "Missing"], sizes=[10, 16], fills=["#FFFFFF", "#000000"]) == 8
+    assert manager.wait_for_prerender(5000)
+    assert manager.cache_info()["prerendered"] == 8
+    for fill in ("#FFFFFF", "#000000"):
+        manager.set_icon_fill(fill)
+        for name in ("Home", "Menu"):
+            assert not manager.render_icon(name, size=16).isNull()
+    assert manager.cache_info()["misses"] == 0
+    assert manager.prerender(["Home"], sizes=[16], fills=["#000000"]) == 0
+
+
+def test_invalidated_icon_drops_prerendered_images(qapp, icon_file):
+    manager = SVGIconManager(icon_file)
+    manager.prerender(["Home"])
+    manager.wait_for_prerender(5000)
+    manager.add_icon("Home", manager.get_icon("Menu"))
+    assert manager.cache_info()["prerendered"] == 0
+    manager.render_icon("Home")
+    assert manager.cache_info()["misses"] == 1
+
+
+def test_atlas_packs_icons_into_one_sheet(qapp, icon_file):
+    manager = SVGIconManager(icon_file)
+    atlas = manager.build_atlas(["Home", "Menu", "Folder", "Missing"], size=16, fill="#FF0000")
+    assert set(atlas.rects) == {"Home", "Menu", "Folder"}
+    assert manager.build_atlas(["Home", "Menu", "Folder", "Missing"], size=16, fill="#FF0000") is atlas
+    pixmap = atlas.icon("Home").pixmap(16, 16)
+    assert pixmap.toImage() == manager.rasterize(manager.get_renderer("Home"), 16, "#FF0000")
+    assert atlas.icon("Missing").isNull()
+    manager.add_icon("Home", manager.get_icon("Menu"))
+    assert manager.build_atlas(["Home", "Menu", "Folder", "Missing"], size=16, fill="#FF0000") is not atlas
+
+
+def test_atlas_cache_keeps_the_latest_sheet_per_size_fill_and_ratio(qapp, icon_file):
+    manager = SVGIconManager(icon_file)
+    manager.build_atlas(["Home", "Menu"], size=16, fill="#FF0000")
+    reordered = manager.build_atlas(["Menu", "Home"], size=16, fill="#FF0000")
+    assert len(manager._atlas_cache) == 1 and manager.build_atlas(["Menu", "Home"], size=16, fill="#FF0000") is reordered
+    for fill in ("#000001", "#000002", "#000003", "#000004"):
+        manager.build_atlas(["Home"], size=16, fill=fill)
+    assert len(manager._atlas_cache) == manager.atlas_cache_size
+    assert (16, "#FF0000", manager._device_pixel_ratio()) not in manager._atlas_cache
+
+
+def test_template_generation_is_debounced_and_previews(qapp, icon_file):
+    from dashboard_components.icon import SVGTemplateGenerator
+    from dashboard_components.style import StyleManager
+
+    generator = SVGTemplateGenerator(SVGIconManager(icon_file), StyleManager())
+    generator.name_input.setText("Dot")
+    generator.svg_input.setPlainText('<svg width="16" height="16" fill="red" viewBox="0 0 16 16">'
+                                     '<circle cx="8" cy="8" r="8"/></svg>')
+    assert generator.output_display.toPlainText() == ""
+    assert generator._generate_timer.isActive()
+
+    generator.generate_template()
+    assert 'width="{width}" height="{height}" fill="{fill}"' in generator.output_display.toPlainText()
+    assert not generator.preview_display.pixmap().isNull()
+
+
+def test_large_template_is_generated_off_the_gui_thread(qapp, icon_file):
+    from PySide6.QtCore import QThreadPool
+    from dashboard_components.icon import SVGTemplateGenerator
+    from dashboard_components.style import StyleManager
+
+    generator = SVGTemplateGenerator(SVGIconManager(icon_file), StyleManager())
+    generator.name_input.setText("Big")
+    paths = "".join(f'<path fill="red" d="M{i % 16} 0h1v1h-1z"/>' for i in range(2000))
+    generator.svg_input.setPlainText(f'<svg width="16" height="16" viewBox="0 0 16 16">{paths}</svg>')
+    generator.generate_template()
+    assert generator.output_display.toPlainText() == ""
+    QThreadPool.globalInstance().waitForDone(5000)
+    qapp.processEvents()
+    assert 'fill="{fill}"' in generator.output_display.toPlainText()
@@ -0,0 +1,56 @@
+import pytest
+
+from dashboard_components.icon_pack import IconPackStore, build_icon_pack, load_svg_directory, main
+from dashboard_components.icon_store import ReadOnlyIconStoreError, open_icon_store, read_legacy_icons
+
+
+def test_pack_round_trips_icons_txt(tmp_path, icon_file):
+    pack_path = str(tmp_path / "icons.svgpack")
+    main([pack_path, icon_file])
+    store = open_icon_store(pack_path)
+    assert isinstance(store, IconPackStore)
+    legacy = read_legacy_icons(icon_file)
+    assert len(store) == len(legacy)
+    assert sorted(store) == sorted(legacy)
+    assert all(store[name] == legacy[name] for name in legacy)
+    assert "Missing" not in store
+    with pytest.raises(KeyError):
+        store["Missing"]
+    with pytest.raises(ReadOnlyIconStoreError):
+        store["Home"] = "<svg/>"
+    store.close()
+
+
+def test_pack_from_svg_directory(tmp_path):
+    svg_dir = tmp_path / "svg"
+    svg_dir.mkdir()
+    (svg_dir / "house.svg").write_text(
+        '<svg width="16" height="16" fill="currentColor" class="bi bi-house"><path d="M0 0"/></svg>')
+    (svg_dir / "readme.txt").write_text("not an icon")
+    icons = load_svg_directory(str(svg_dir))
+    assert icons == {"house": '<svg width="{width}" height="{height}" fill="{fill}" class="{class_name}">'
+                              '<path d="M0 0"/></svg>'}
+
+    pack_path = str(tmp_path / "icons.svgpack")
+    build_icon_pack(pack_path, icons)
+    store = IconPackStore(pack_path)
+    assert dict(store) == icons
+    store.close()
+
+
+def test_empty_pack(tmp_path):
+    pack_path = str(tmp_path / "empty.svgpack")
+    build_icon_pack(pack_path, {})
+    store = IconPackStore(pack_path)
+    assert len(store) == 0 and "Home" not in store
+    store.close()
+
+
+def test_icon_manager_renders_from_pack(qapp, tmp_path, icon_file):
+    from dashboard_components.icon import SVGIconManager
+
+    pack_path = str(tmp_path / "icons.svgpack")
+    main([pack_path, icon_file])
+    manager = SVGIconManager(pack_path)
+    assert manager.render_icon("Home") is not None
+    assert manager.render_icon("Missing") is None
@@ -0,0 +1,66 @@
+import os
+
+import pytest
+
+from dashboard_components.icon_store import (
+    JsonLinesStore, LegacyDictStore, SQLiteStore, open_icon_store, read_legacy_icons
+)
+
+
+def test_legacy_file_is_migrated_to_jsonl(icon_file):
+    legacy = read_legacy_icons(icon_file)
+    store = open_icon_store(icon_file)
+    assert isinstance(store, JsonLinesStore)
+    assert store.file_path == icon_file[:-len(".txt")] + ".jsonl"
+    assert dict(store) == legacy
+    assert read_legacy_icons(icon_file) == legacy
+
+
+def test_jsonl_store_is_the_source_of_truth_after_the_import(icon_file):
+    legacy = read_legacy_icons(icon_file)
+    store = open_icon_store(icon_file)
+    store["Added"] = "<svg>added</svg>"
+    del store["Home"]
+    store.close()
+    assert read_legacy_icons(icon_file) == legacy  # One-icon edits never rewrite the legacy file
+
+    with open(icon_file, "w", encoding="utf-8") as file:
+        file.write(str({"Other": "<svg>other</svg>"}))
+    reopened = open_icon_store(icon_file)
+    assert "Added" in reopened and "Home" not in reopened and "Other" not in reopened
+
+
+def test_jsonl_bodies_are_loaded_lazily(icon_file):
+    open_icon_store(icon_file)
+    store = JsonLinesStore(icon_file[:-len(".txt")] + ".jsonl")
+    assert "Home" in store and not store._bodies
+    assert store["Home"].startswith("<svg")
+    assert list(store._bodies) == ["Home"]
+
+
+@pytest.mark.parametrize("store_type, name", [(JsonLinesStore, "icons.jsonl"), (SQLiteStore, "icons.db"),
+                                              (LegacyDictStore, "icons.txt")])
+def test_upsert_and_delete_persist(tmp_path, store_type, name):
+    path = str(tmp_path / name)
+    store = store_type(path)
+    store["A"] = "<svg>a</svg>"
+    store["B"] = "<svg>b</svg>"
+    store["A"] = "<svg>a2</svg>"
+    del store["B"]
+    store.close()
+
+    reopened = store_type(path)
+    assert dict(reopened) == {"A": "<svg>a2</svg>"}
+    with pytest.raises(KeyError):
+        del reopened["B"]
+
+
+def test_jsonl_compaction_rewrites_live_records_only(tmp_path):
+    path = str(tmp_path / "icons.jsonl")
+    store = JsonLinesStore(path)
+    for version in range(JsonLinesStore.compact_threshold * 2):
+        store["A"] = f"<svg>{version}</svg>"
+    with open(path, "rb") as file:
+        assert len(file.readlines()) < JsonLinesStore.compact_threshold + 2
+    assert JsonLinesStore(path)["A"] == store["A"]
+    assert not [name for name in os.listdir(tmp_path) if name.endswith(".tmp")]
@@ -0,0 +1,144 @@
+import os
+import time
+
+import numpy as np
+from PySide6.QtCore import QThreadPool
+
+from dashboard_components.columnar_model import ColumnarTableModel
+from dashboard_components.ingest import TableIngestor, read_csv_chunks, typed_column
+from dashboard_components.table_cache import TableCache
+
+
+def wait_until(qapp, condition, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        qapp.processEvents()
+        time.sleep(0.005)
+
+
+def test_typed_column_picks_the_narrowest_type():
+    assert typed_column(["1", "-20", "300"]).dtype == np.int64
+    floats = typed_column(["1", "", "2.5"])
+    assert floats.dtype == np.float64 and np.isnan(floats[1])
+    assert typed_column(["2024-01-31", "", "2024-02-01"]).dtype == np.dtype("datetime64[D]")
+    assert typed_column(["2024-01-31 10:30:00", "2024-02-01"]).dtype == np.dtype("datetime64[s]")
+    assert list(typed_column(["a", "1", ""])) == ["a", "1", ""]
+    for text in (["007", "1"], ["1_000"], ["nan", "1.5"], ["-inf"]):
+        assert list(typed_column(text)) == text
+    assert typed_column(["0", "0.5", "-0.25"]).dtype == np.float64
+
+
+def test_leading_zeros_survive_a_chunk_boundary(qapp, tmp_path):
+    path = tmp_path / "zip.csv"
+    path.write_text("Zip\n10001\n20002\n00501\n30003\n")
+    model = ColumnarTableModel()
+    assert load(qapp, TableIngestor(model, chunk_rows=3), path) == 4
+    assert [model.index(row, 0).data() for row in range(4)] == ["10001", "20002", "00501", "30003"]
+
+
+def test_csv_is_read_in_chunks(tmp_path):
+    path = tmp_path / "table.csv"
+    path.write_text("a,b\n" + "".join(f"{i},{i * 2}\n" for i in range(10)))
+    chunks = list(read_csv_chunks(str(path), 4))
+    assert [len(rows) for rows, _ in chunks] == [4, 4, 3]  # The header is the first row
+    assert chunks[-1][1] == 1.0
+
+
+def test_ingestor_appends_chunks_in_the_background(qapp, tmp_path):
+    path = tmp_path / "table.csv"
+    path.write_text("Date,Count,Name,\n" + "".join(f"2024-01-{i % 28 + 1:02d},{i},row {i}\n" for i in range(1000)))
+    model = ColumnarTableModel()
+    ingestor = TableIngestor(model, chunk_rows=100)
+    inserted, results = [], []
+    model.rowsInserted.connect(lambda parent, first, last: inserted.append(last - first + 1))
+    ingestor.finished.connect(lambda rows, cancelled: results.append((rows, cancelled)))
+
+    ingestor.load(str(path))
+    wait_until(qapp, lambda: results)
+    assert results == [(1000, False)]
+    assert inserted == [100] * 9 + [1]  # Header plus 99 rows, then one insertion per chunk
+    assert model.columnNames() == ["Date", "Count", "Name", "Column 4"]
+    assert model.index(999, 1).data() == "999" and model.index(999, 2).data() == "row 999"
+    assert model.columnData(0).dtype == np.dtype("datetime64[D]")
+    assert not ingestor.isRunning()
+
+
+def test_ingestor_cancel_and_failure(qapp, tmp_path):
+    path = tmp_path / "table.csv"
+    path.write_text("n\n" + "".join(f"{i}\n" for i in range(10_000)))
+    model = ColumnarTableModel()
+    ingestor = TableIngestor(model, chunk_rows=10, max_pending=1)
+    results, failures = [], []
+    ingestor.finished.connect(lambda rows, cancelled: results.append((rows, cancelled)))
+    ingestor.failed.connect(failures.append)
+
+    ingestor.load(str(path))
+    wait_until(qapp, lambda: model.rowCount() > 0)
+    ingestor.cancel()
+    wait_until(qapp, lambda: results)
+    assert results[0][1] is True and results[0][0] < 10_000
+
+    ingestor.load(str(tmp_path / "table.ods"))
+    wait_until(qapp, lambda: failures)
+    assert "Unsupported file type" in failures[0]
+    QThreadPool.globalInstance().waitForDone()
+
+
+def load(qapp, ingestor, path):
+    results = []
+    ingestor.finished.connect(lambda rows, cancelled: results.append(rows))
+    ingestor.load(str(path))
+    wait_until(qapp, lambda: results)
+    QThreadPool.globalInstance().waitForDone()  # The cache is written in the background
+    qapp.processEvents()
+    ingestor.finished.disconnect()
+    return results[0]
+
+
+def test_cached_table_reopens_memory_mapped(qapp, tmp_path):
+    path = tmp_path / "table.csv"
+    path.write_text("Date,Count,Name\n" + "".join(f"2024-01-{i % 28 + 1:02d},{i},row {i}\n" for i in range(500)))
+    cache = TableCache(str(tmp_path / "cache"))
+    model = ColumnarTableModel()
+    ingestor = TableIngestor(model, chunk_rows=100, cache=cache)
+
+    assert load(qapp, ingestor, path) == 500
+    assert (cache.hits, cache.misses) == (0, 1)
+    assert cache.info()["entries"] == 1 and cache.total_bytes() > 0
+
+    reopened = ColumnarTableModel()
+    assert load(qapp, TableIngestor(reopened, cache=cache), path) == 500
+    assert (cache.hits, cache.misses) == (1, 1)
+    assert isinstance(reopened.columnData(1), np.memmap)
+    assert reopened.columnNames() == ["Date", "Count", "Name"]
+    assert reopened.index(499, 2).data() == "row 499" and reopened.index(3, 0).data() == "2024-01-04"
+
+    os.utime(path, ns=(0, 0))  # Touched but unchanged: found again by its content digest
+    assert load(qapp, TableIngestor(ColumnarTableModel(), cache=cache), path) == 500
+    assert cache.hits == 2
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = TableCache(str(tmp_path / "cache"), max_bytes=2500)
+    fingerprints = []
+    for number in range(3):
+        path = tmp_path / f"{number}.csv"
+        path.write_text(f"table {number}")
+        fingerprint, table = cache.find(str(path))
+        assert table is None
+        assert cache.store(fingerprint, ["n"], [np.arange(100, dtype=np.int64)])  # 800 bytes each
+        fingerprints.append(fingerprint)
+    cache.find(str(tmp_path / "0.csv"))  # Now more recently used than table 1
+
+    path = tmp_path / "3.csv"
+    path.write_text("table 3")
+    assert cache.store(cache.find(str(path))[0], ["n"], [np.arange(100, dtype=np.int64)])
+    assert cache.find(str(tmp_path / "1.csv"))[1] is None
+    assert cache.find(str(tmp_path / "0.csv"))[1] is not None
+    assert not os.path.exists(tmp_path / "cache" / fingerprints[1].digest)
+    assert not cache.store(fingerprints[0], ["n"], [np.zeros(1000)])  # Larger than the whole cache
+    text = np.array(["x" * 10_000] + ["short"] * 999, dtype=object)  # 40 MB as fixed-width text
+    assert not cache.store(fingerprints[0], ["text"], [text])
+
+    assert TableCache(str(tmp_path / "cache")).info()["entries"] == 3  # The index survives a restart
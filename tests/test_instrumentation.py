@@ -0,0 +1,60 @@
+import time
+
+from PySide6.QtCore import QEvent
+from PySide6.QtWidgets import QApplication, QLabel
+
+from dashboard_components.instrumentation import Instrumentation, InstrumentationOverlay
+
+
+class Handler:
+    def work(self, value):
+        time.sleep(0.002)
+        return value * 2
+
+
+def test_wrapped_handlers_are_timed(qapp):
+    instrumentation = Instrumentation()
+    handler = Handler()
+    instrumentation.wrap(handler, "work")
+    assert handler.work(21) == 42
+    stats = instrumentation.handler_stats["Handler.work"]
+    assert stats.count == 1 and stats.max >= 0.002
+    assert instrumentation.slowest_handlers() == [("Handler.work", stats.max)]
+
+
+def test_watchdog_reports_stalls_with_the_gui_stack(qapp):
+    instrumentation = Instrumentation(stall_threshold_ms=50, heartbeat_ms=10)
+    label = QLabel("painted")
+    label.setObjectName("probe")
+    instrumentation.install(qapp)
+    try:
+        label.show()
+        QApplication.processEvents()
+        time.sleep(0.3)  # Blocks the event loop; the watchdog thread still runs
+        deadline = time.perf_counter() + 1
+        while time.perf_counter() < deadline and not instrumentation.stalls:
+            QApplication.processEvents()
+        time.sleep(0.02)
+        QApplication.processEvents()
+    finally:
+        instrumentation.uninstall()
+        label.deleteLater()
+
+    assert len(instrumentation.stalls) == 1
+    seconds, stack = instrumentation.stalls[0]
+    assert seconds >= 0.25 and "test_watchdog_reports_stalls_with_the_gui_stack" in stack
+    assert instrumentation.paint_counts["QLabel#probe"] >= 1
+
+
+def test_dispatch_times_feed_the_overlay(qapp):
+    instrumentation = Instrumentation()
+    window = QLabel()
+    instrumentation.record_dispatch(window, QEvent.UpdateRequest, 0.004)
+    instrumentation.record_dispatch(window, QEvent.MouseMove, 0.001)
+    assert instrumentation.slowest_events(1) == [("UpdateRequest", 0.004)]
+
+    overlay = InstrumentationOverlay(instrumentation)
+    overlay.refresh()
+    assert overlay.text().startswith("frame 4.0 ms")
+    window.deleteLater()
+    overlay.deleteLater()
@@ -1,2 +1,33 @@
+import os
+import time
+
+from PySide6.QtCore import QElapsedTimer
+from PySide6.QtWidgets import QApplication
+
+
 def test_example():
     assert True
+
+
+def test_icon_prerendering_waits_for_the_first_paint(qapp, icon_file, monkeypatch):
+    monkeypatch.chdir(os.path.dirname(icon_file))
+    from main import MainWindow, StartupProfile
+
+    profile = StartupProfile(time.perf_counter())
+    window = MainWindow(startup_profile=profile)
+    painted = []
+    window.firstPaint.connect(lambda: painted.append(True))
+    assert [phase for phase, _ in profile.phases] == ["icon load", "stylesheet build", "widgets"]
+    assert window.icon_manager.cache_info()["prerendered"] == 0
+
+    window.show()
+    timer = QElapsedTimer()
+    timer.start()
+    while not painted and timer.elapsed() < 2000:
+        QApplication.processEvents()
+    assert painted and profile.phases[-1][0] == "first paint"
+    window.icon_manager.wait_for_prerender()
+    QApplication.processEvents()
+    assert window.icon_manager.cache_info()["prerendered"] > 0
+    window.close()
+    window.deleteLater()
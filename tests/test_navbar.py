@@ -0,0 +1,184 @@
+import pytest
+from PySide6.QtCore import QElapsedTimer, QVariantAnimation
+from PySide6.QtGui import QIcon
+from PySide6.QtWidgets import QApplication, QLabel, QVBoxLayout, QWidget
+
+from dashboard_components.icon import SVGIconManager
+from dashboard_components.navbar import CustomNavigationContentWidget
+from dashboard_components.style import StyleManager
+
+
+class Host(QWidget):
+    def toggle_mode(self):
+        pass
+
+
+@pytest.fixture
+def navigation(qapp, icon_file):
+    host = Host()
+    widget = CustomNavigationContentWidget(StyleManager(), SVGIconManager(icon_file), host)
+    yield widget
+    host.deleteLater()
+
+
+def test_factory_pages_are_built_on_first_switch(navigation):
+    built = []
+
+    def factory(name):
+        def build():
+            built.append(name)
+            return QLabel(name)
+        return build
+
+    navigation.addPageWithNavigationItem(QLabel("Home"), QIcon(), "Home", "Home")
+    navigation.addPageWithNavigationItem(factory("Processes"), QIcon(), "Processes", "Folder")
+    navigation.addPageWithNavigationItem(factory("Info"), QIcon(), "Info", "Info", align_bottom=True)
+    navigation.switchToPage(0)
+    assert built == [] and not navigation.isPageBuilt(1)
+
+    navigation.switchToPage(2)
+    assert built == ["Info"]
+    assert navigation.contentStack.currentWidget().text() == "Info"
+    assert navigation.contentStack.indexOf(navigation.contentStack.currentWidget()) == 2
+
+    navigation.switchToPage(2)
+    assert built == ["Info"]
+
+
+def test_prewarm_builds_the_next_page(navigation):
+    navigation.addPageWithNavigationItem(QLabel("Home"), QIcon(), "Home", "Home")
+    navigation.addPageWithNavigationItem(lambda: QLabel("Second"), QIcon(), "Second", "Folder")
+    navigation.addPageWithNavigationItem(lambda: QLabel("Third"), QIcon(), "Third", "Info")
+    navigation.switchToPage(0)
+    navigation.prewarmNextPage()
+    assert navigation.isPageBuilt(1) and not navigation.isPageBuilt(2)
+    assert navigation.contentStack.currentIndex() == 0
+
+
+class StatefulPage(QLabel):
+    def save_state(self):
+        return self.text()
+
+    def restore_state(self, state):
+        self.setText(state)
+
+
+def test_pages_are_unloaded_lru_and_rebuilt_with_state(navigation):
+    unloaded = []
+    navigation.max_resident_pages = 2
+    navigation.pageUnloaded.connect(lambda page: unloaded.append(page.text()))
+    navigation.addPageWithNavigationItem(QLabel("Home"), QIcon(), "Home", "Home")
+    for name in ("A", "B", "C"):
+        navigation.addPageWithNavigationItem(lambda name=name: StatefulPage(name), QIcon(), name, "Info")
+
+    navigation.switchToPage(1)
+    navigation.contentStack.currentWidget().setText("A edited")
+    navigation.switchToPage(2)
+    navigation.switchToPage(3)
+    assert unloaded == ["A edited"]
+    assert not navigation.isPageBuilt(1) and navigation.isPageBuilt(2) and navigation.isPageBuilt(3)
+
+    navigation.switchToPage(1)
+    assert navigation.contentStack.currentWidget().text() == "A edited"
+    assert navigation.page_stats()["builds"] == 4
+    assert navigation.page_stats()["evictions"] == 2
+    assert navigation.page_stats()["resident"] == 2
+
+
+def test_memory_budget_unloads_hidden_pages(navigation):
+    navigation.memory_budget = 2 * navigation.widget_memory_estimate
+    navigation.addPageWithNavigationItem(QLabel("Home"), QIcon(), "Home", "Home")
+    for name in ("A", "B", "C"):
+        navigation.addPageWithNavigationItem(lambda name=name: QLabel(name), QIcon(), name, "Info")
+    for index in (1, 2, 3, 0):
+        navigation.switchToPage(index)
+    assert navigation.residentPageMemory() <= navigation.memory_budget
+    assert navigation.page_evictions == 1
+
+
+def test_collapse_and_theme_change_do_not_touch_items(navigation):
+    from PySide6.QtCore import Qt
+
+    for i in range(50):
+        navigation.addPageWithNavigationItem(QLabel(str(i)), QIcon(), f"Page {i}", "Home")
+    model = navigation.nav_model_top
+    changes = []
+    model.dataChanged.connect(lambda *args: changes.append(args))
+
+    navigation.toggle_sidebar()
+    assert navigation.nav_delegate.collapsed and not changes
+    assert model.index(3).data(Qt.DisplayRole) == "Page 3"
+
+    navigation.icon_manager.set_icon_fill("#000000")
+    navigation.refresh_icons()
+    assert len(changes) == 1
+    assert not model.index(3).data(Qt.DecorationRole).isNull()
+
+
+def test_clicking_an_item_switches_to_its_page(navigation):
+    navigation.addPageWithNavigationItem(QLabel("Home"), QIcon(), "Home", "Home")
+    navigation.addPageWithNavigationItem(QLabel("Info"), QIcon(), "Info", "Info", align_bottom=True)
+    navigation.addPageWithNavigationItem(QLabel("Processes"), QIcon(), "Processes", "Folder")
+    navigation.handleTopItemClick(navigation.nav_model_top.index(1))
+    assert navigation.contentStack.currentWidget().text() == "Processes"
+    navigation.handleBottomItemClick(navigation.nav_model_bottom.index(0))
+    assert navigation.contentStack.currentWidget().text() == "Info"
+
+
+def test_search_box_filters_both_lists(navigation):
+    navigation.addPageWithNavigationItem(QLabel("Home"), QIcon(), "Home", "Home")
+    navigation.addPageWithNavigationItem(QLabel("Processes"), QIcon(), "Processes", "Folder")
+    navigation.addPageWithNavigationItem(QLabel("Settings"), QIcon(), "Settings", "Settings", align_bottom=True)
+
+    navigation.searchBox.setText("pro")
+    assert navigation.nav_model_top.rowCount() == 1 and navigation.nav_model_bottom.rowCount() == 0
+    assert navigation.nav_model_top.index(0).data() == "Processes"
+
+    navigation.addPageWithNavigationItem(lambda: QLabel("Projects"), QIcon(), "Projects", "Folder", align_bottom=True)
+    assert navigation.nav_model_bottom.index(0).data() == "Projects"
+
+    navigation.searchBox.setText("proj")
+    navigation.openFirstSearchResult()
+    assert navigation.contentStack.currentWidget().text() == "Projects"
+
+    navigation.searchBox.clear()
+    assert navigation.nav_model_top.rowCount() == 2 and navigation.nav_model_bottom.rowCount() == 2
+
+
+def test_animated_collapse_reaches_the_collapsed_width(navigation):
+    navigation.animated_collapse = True
+    navigation.parent().resize(600, 400)
+    navigation.parent().show()
+    navigation.toggle_sidebar()
+    assert navigation.nav_delegate.collapsed and not navigation.contentStack.updatesEnabled()
+
+    timer = QElapsedTimer()
+    timer.start()
+    while navigation._sidebar_animation.state() == QVariantAnimation.Running and timer.elapsed() < 2000:
+        QApplication.processEvents()
+    assert navigation.navigation_widget.width() == navigation.collapsed_width
+    assert navigation.contentStack.updatesEnabled()
+    stats = navigation.sidebar_frame_stats()
+    assert stats["frames"] >= 2 and stats["max_ms"] > 0
+
+
+def test_switching_pages_during_the_sidebar_animation_resumes_the_suspended_page(navigation):
+    pages = []
+    for name in ("First", "Second"):
+        page = QWidget()
+        QVBoxLayout(page).addWidget(QLabel(name))
+        navigation.addPageWithNavigationItem(page, QIcon(), name, "Home")
+        pages.append(page)
+    navigation.switchToPage(0)
+    navigation.animated_collapse = True
+    navigation.parent().resize(600, 400)
+    navigation.parent().show()
+    navigation.toggle_sidebar()
+    assert not pages[0].layout().isEnabled()
+
+    navigation.switchToPage(1)
+    timer = QElapsedTimer()
+    timer.start()
+    while navigation._sidebar_animation.state() == QVariantAnimation.Running and timer.elapsed() < 2000:
+        QApplication.processEvents()
+    assert pages[0].layout().isEnabled() and pages[1].layout().isEnabled()
@@ -0,0 +1,49 @@
+from dashboard_components.navigation_search import NavigationSearchIndex
+
+
+def make_index():
+    index = NavigationSearchIndex()
+    index.add(0, "Home", "Home")
+    index.add(1, "Processes", "Folder")
+    index.add(2, "Sales report", "Chart")
+    index.add(3, "Settings", "Settings")
+    return index
+
+
+def test_short_terms_match_word_prefixes():
+    index = make_index()
+    assert index.search("s") == [2, 3]
+    assert index.search("re") == [2]
+    assert index.search("") == [0, 1, 2, 3]
+
+
+def test_long_terms_match_substrings_in_titles_and_icon_names():
+    index = make_index()
+    assert index.search("port") == [2]
+    assert index.search("FOLD") == [1]
+    assert index.search("sales cha") == [2]
+    assert index.search("sett zzz") == []
+
+
+def test_extending_a_query_narrows_the_previous_result():
+    index = make_index()
+    results = [index.search(query) for query in ("s", "se", "set", "sett")]
+    assert results == [[2, 3], [3], [3], [3]]
+    assert index.search("p") == [1]
+
+
+def test_extending_a_short_term_into_a_substring_searches_again():
+    index = make_index()
+    index.add(4, "Database", "Server")
+    results = [index.search(query) for query in ("t", "ta", "tab")]
+    assert results == [[], [], [4]]
+
+
+def test_index_is_updated_incrementally():
+    index = make_index()
+    assert index.search("set") == [3]
+    index.add(4, "Reset password", "Settings")
+    assert index.search("set") == [3, 4]
+    index.remove(3)
+    assert index.search("set") == [4]
+    assert 3 not in index and len(index) == 4
@@ -0,0 +1,61 @@
+import time
+
+import numpy as np
+from PySide6.QtCore import QDate
+
+from dashboard_components.processes import ProcessesPage
+from dashboard_components.style import StyleManager
+from dashboard_components.table_cache import TableCache
+
+
+def test_date_filter_narrows_rows_to_the_range(qapp, tmp_path):
+    page = ProcessesPage(StyleManager(), cache=TableCache(str(tmp_path)))
+    dates = np.datetime64("2024-01-01") + np.array([3, 0, 1, 1, 2, 5], dtype="timedelta64[D]")
+    page.setColumns(["Date", "n"], [dates, np.arange(6, dtype=np.int64)])
+    deadline = time.monotonic() + 10
+    while page.date_index is None:
+        assert time.monotonic() < deadline
+        qapp.processEvents()
+    assert not page.filter_bar.isHidden()
+    assert (page.from_date.date(), page.to_date.date()) == (QDate(2024, 1, 1), QDate(2024, 1, 6))
+
+    page.from_date.setDate(QDate(2024, 1, 2))
+    page.to_date.setDate(QDate(2024, 1, 3))
+    assert [page.model.index(row, 1).data() for row in range(page.model.rowCount())] == ["2", "3", "4"]
+    assert page.summary_label.text() == "3 of 6 rows × 2 columns"
+
+    page.clearDateFilter()
+    assert page.model.rowCount() == 6 and page.model.rowMap() is None
+
+    page.setColumns(["n"], [np.arange(3)])
+    assert page.date_index is None and page.filter_bar.isHidden()
+
+
+def test_aggregation_follows_controls_and_date_filter(qapp, tmp_path):
+    page = ProcessesPage(StyleManager(), cache=TableCache(str(tmp_path)))
+    dates = np.datetime64("2024-01-01") + np.array([0, 0, 1, 2, 2], dtype="timedelta64[D]")
+    status = np.array(["open", "closed", "open", "open", "closed"], dtype=object)
+    page.setColumns(["Date", "Status", "Amount"], [dates, status, np.array([1.0, 2.0, 3.0, 4.0, 5.0])])
+
+    def results():
+        deadline = time.monotonic() + 10
+        while page.aggregate_status.text() == "Aggregating…" or page.date_index is None:
+            assert time.monotonic() < deadline
+            qapp.processEvents()
+        model = page.aggregate_model
+        return [[model.index(row, column).data() for column in range(model.columnCount())]
+                for row in range(model.rowCount())]
+
+    assert not page.aggregate_panel.isHidden()
+    assert page.group_combo.currentText() == "Date" and page.value_combo.currentText() == "Amount"
+    assert results() == [["2024-01-01", "2"], ["2024-01-02", "1"], ["2024-01-03", "2"]]
+
+    page.function_combo.setCurrentText("sum")
+    page.pivot_combo.setCurrentText("Status")
+    assert results() == [["2024-01-01", "2.00", "1.00"], ["2024-01-02", "0.00", "3.00"], ["2024-01-03", "5.00", "4.00"]]
+    assert page.aggregate_model.columnNames() == ["Date", "closed", "open"]
+
+    factorizations = page.aggregation.factorizations
+    page.from_date.setDate(QDate(2024, 1, 3))
+    assert results() == [["2024-01-03", "5.00", "4.00"]]
+    assert page.aggregation.factorizations == factorizations  # Only the filter changed
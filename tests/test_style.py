@@ -0,0 +1,78 @@
+from dashboard_components.style import StyleManager
+
+
+def test_stylesheets_are_compiled_once_per_mode():
+    style_manager = StyleManager()
+    dark = style_manager.get_navigation_stylesheet()
+    assert style_manager.get_navigation_stylesheet() is dark
+    style_manager.toggle_mode()
+    bright = style_manager.get_navigation_stylesheet()
+    assert bright != dark
+    style_manager.toggle_mode()
+    assert style_manager.get_navigation_stylesheet() is dark
+    assert style_manager.version == 0
+
+
+def test_palette_and_font_changes_invalidate_and_bump_version():
+    style_manager = StyleManager()
+    token = style_manager.style_token()
+    stylesheet = style_manager.get_stylesheet()
+
+    style_manager.font_size = style_manager.font_size
+    assert style_manager.style_token() == token
+    assert style_manager.get_stylesheet() is stylesheet
+
+    style_manager.font_size = 12
+    assert style_manager.style_token() != token
+    assert "font-size: 12px" in style_manager.get_stylesheet()
+
+    token = style_manager.style_token()
+    style_manager.dark_navi_bgcolor = "#123456"
+    assert style_manager.style_token() != token
+    assert "#123456" in style_manager.get_navigation_stylesheet()
+
+
+def test_scope_stylesheet_targets_the_widget_and_its_children():
+    from dashboard_components.style import scope_stylesheet
+
+    scoped = scope_stylesheet("QListWidget::item:hover, QLabel { color: red; }", "nav")
+    assert scoped == ("QListWidget#nav::item:hover, #nav QListWidget::item:hover, QLabel#nav, #nav QLabel "
+                      "{ color: red; }")
+
+
+def test_application_stylesheet_scopes_every_component():
+    style_manager = StyleManager()
+    stylesheet = style_manager.get_application_stylesheet()
+    for object_name in ("navigationContent", "titleBar", "mainWindow", "svgTemplateGenerator", "excelProcessing"):
+        assert f"#{object_name} " in stylesheet
+    assert stylesheet.index("#navigationContent ") < stylesheet.index("#svgTemplateGenerator ")
+
+
+def test_palette_follows_the_mode_color_attributes(qapp):
+    from PySide6.QtGui import QColor, QPalette
+
+    style_manager = StyleManager()
+    dark = style_manager.get_palette()
+    assert dark.color(QPalette.Base) == QColor(style_manager.dark_content_bgcolor)
+    assert dark.color(QPalette.AlternateBase) == QColor(style_manager.dark_navi_bgcolor)
+    assert style_manager.get_palette("bright").color(QPalette.Text) == QColor(style_manager.bright_font_color)
+    assert style_manager.get_palette() is dark
+
+    style_manager.dark_content_bgcolor = "#010203"
+    assert style_manager.get_palette().color(QPalette.Base) == QColor("#010203")
+
+
+def test_apply_stylesheet_skips_unchanged_themes_and_other_modes(qapp):
+    from PySide6.QtWidgets import QWidget
+
+    style_manager = StyleManager()
+    widget = QWidget()
+    assert style_manager.apply_stylesheet(widget, style_manager.get_titlebar_stylesheet)
+    assert widget.styleSheet() == style_manager.get_titlebar_stylesheet()
+    assert not style_manager.apply_stylesheet(widget, style_manager.get_titlebar_stylesheet)
+
+    style_manager.toggle_mode()
+    assert style_manager.apply_stylesheet(widget, style_manager.get_titlebar_stylesheet)
+    style_manager.styling_mode = "application"
+    style_manager.toggle_mode()
+    assert not style_manager.apply_stylesheet(widget, style_manager.get_titlebar_stylesheet)
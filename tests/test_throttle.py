@@ -0,0 +1,50 @@
+from PySide6.QtCore import QEvent, QPointF, Qt
+from PySide6.QtGui import QMouseEvent
+from PySide6.QtWidgets import QApplication, QWidget
+
+from dashboard_components.sidegrip import SideGrip
+from dashboard_components.throttle import FrameCoalescer
+
+
+def test_values_within_a_frame_collapse_to_the_last_one(qapp):
+    applied = []
+    coalescer = FrameCoalescer(applied.append, interval=10.0)
+    for value in range(5):
+        coalescer.submit(value)
+    assert applied == [0] and coalescer.is_pending()
+    coalescer.flush()
+    assert applied == [0, 4] and not coalescer.is_pending()
+    coalescer.submit(5)
+    coalescer.cancel()
+    coalescer.flush()
+    assert applied == [0, 4] and (coalescer.submitted, coalescer.applied) == (6, 2)
+
+
+def test_zero_interval_applies_every_value(qapp):
+    applied = []
+    coalescer = FrameCoalescer(applied.append, interval=0)
+    for value in range(3):
+        coalescer.submit(value)
+    assert applied == [0, 1, 2]
+
+
+def test_side_grip_resizes_relative_to_the_press(qapp):
+    window = QWidget()
+    window.setMinimumSize(200, 100)
+    window.setGeometry(100, 100, 400, 300)
+    grip = SideGrip(window, Qt.RightEdge)
+    grip.resizeCoalescer.interval = 10.0
+
+    def send(event_type, x):
+        global_pos = QPointF(500 + x, 200)
+        QApplication.sendEvent(grip, QMouseEvent(event_type, QPointF(0, 0), global_pos, Qt.LeftButton,
+                                                 Qt.LeftButton, Qt.NoModifier))
+
+    send(QEvent.MouseButtonPress, 0)
+    send(QEvent.MouseMove, 10)
+    send(QEvent.MouseMove, 30)
+    send(QEvent.MouseMove, 50)
+    assert window.width() == 410  # Later moves wait for the next frame
+    send(QEvent.MouseButtonRelease, 50)
+    assert window.width() == 450
+    window.deleteLater()
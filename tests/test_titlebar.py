@@ -0,0 +1,49 @@
+from PySide6.QtCore import QEvent, QPoint, QPointF, Qt
+from PySide6.QtGui import QMouseEvent
+from PySide6.QtWidgets import QApplication, QWidget
+
+from dashboard_components.icon import SVGIconManager
+from dashboard_components.style import StyleManager
+from dashboard_components.titlebar import CustomTitleBar
+
+
+def send(widget, event_type, global_pos, buttons=Qt.LeftButton):
+    QApplication.sendEvent(widget, QMouseEvent(event_type, QPointF(5, 5), QPointF(global_pos), Qt.LeftButton,
+                                               buttons, Qt.NoModifier))
+
+
+def test_double_click_toggles_the_window_state(qapp, icon_file):
+    window = QWidget()
+    title_bar = CustomTitleBar(StyleManager(), SVGIconManager(icon_file), window)
+    window.show()
+    send(title_bar, QEvent.MouseButtonDblClick, QPoint(50, 10))
+    assert title_bar.is_maximized and window.windowState() & Qt.WindowMaximized
+    title_bar.maximize_restore_window()
+    assert not title_bar.is_maximized
+    window.deleteLater()
+
+
+def test_manual_drag_moves_the_window_once_per_frame(qapp, icon_file):
+    window = QWidget()
+    window.setGeometry(100, 100, 300, 200)
+    title_bar = CustomTitleBar(StyleManager(), SVGIconManager(icon_file), window)
+    title_bar.dragger.system_move = False
+    title_bar.dragger.move_coalescer.interval = 10.0
+    start = window.frameGeometry().topLeft()
+
+    send(title_bar, QEvent.MouseButtonPress, QPoint(150, 110))
+    send(title_bar, QEvent.MouseMove, QPoint(160, 115))
+    send(title_bar, QEvent.MouseMove, QPoint(190, 140))
+    assert window.frameGeometry().topLeft() == start + QPoint(10, 5)
+    send(title_bar, QEvent.MouseButtonRelease, QPoint(190, 140), Qt.NoButton)
+    assert window.frameGeometry().topLeft() == start + QPoint(40, 30)
+    window.deleteLater()
+
+
+def test_title_bar_without_a_parent_ignores_drags(qapp, icon_file):
+    title_bar = CustomTitleBar(StyleManager(), SVGIconManager(icon_file))
+    assert title_bar.dragger is None
+    send(title_bar, QEvent.MouseButtonPress, QPoint(50, 10))
+    send(title_bar, QEvent.MouseMove, QPoint(80, 30))
+    send(title_bar, QEvent.MouseButtonRelease, QPoint(80, 30), Qt.NoButton)
+    title_bar.deleteLater()